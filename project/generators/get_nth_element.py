@@ -1,8 +1,48 @@
-from typing import Generator, Callable, Any
+from collections import deque
+from collections.abc import Mapping
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
+
+
+@runtime_checkable
+class RandomAccess(Protocol):
+    """
+    A source whose elements are read by their 0-based index, such as a
+    sequence. Indexing past its end raises `IndexError`.
+    """
+
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+
+@runtime_checkable
+class Skippable(Protocol):
+    """
+    An iterator that can drop its next `k` elements without producing them,
+    faster than calling `next` `k` times. Skipping past its end exhausts it.
+    """
+
+    def __next__(self) -> Any:
+        ...
+
+    def skip(self, k: int) -> None:
+        ...
+
+
+# Marks the end of the source, which may itself yield None.
+_MISSING = object()
 
 
 def get_nth_element(
-    func: Callable[[], Generator[Any, None, None]]
+    func: Callable[[], Union[Iterable[Any], RandomAccess]], memo: int = 0
 ) -> Callable[..., Any]:
     """
     Returns a function that retrieves the nth element from a generator function.
@@ -12,8 +52,20 @@ def get_nth_element(
     If `n` is greater than the number of elements in the generator or less than or
     equal to zero, it raises an `IndexError`.
 
+    How the source is advanced depends on what `func` returns:
+
+    - a `RandomAccess` source (such as `RGBASequence` or `primes.Primes`) is indexed
+      directly, so any element can be read, in any order. Mappings are iterated
+      instead, since their keys aren't positions;
+    - a `Skippable` iterator jumps over the elements before `n` with `skip`;
+    - any other iterable is advanced in bulk with `itertools.islice`.
+
+    Iterated sources can't go back: an element already passed raises `IndexError`,
+    unless it is among the last `memo` elements read, which are kept.
+
     Args:
         func : A function that, when called, returns a generator yielding elements of any type.
+        memo : The number of most recent elements kept to be read again.
 
     Returns:
     Callable[..., Any]:
@@ -21,7 +73,8 @@ def get_nth_element(
         generator produced by `func`.
 
     Raises:
-    IndexError: If `n` is less than or equal to zero or if the generator does not yield `n` elements.
+    IndexError: If `n` is less than or equal to zero, if the generator does not yield
+        `n` elements, or if the element has been passed through.
 
     Example:
     >>> def simple_gen():
@@ -29,28 +82,74 @@ def get_nth_element(
     >>> get_third = get_nth_element(simple_gen)
     >>> get_third(3)
     2
+    >>> get_element = get_nth_element(simple_gen, memo=2)
+    >>> get_element(5), get_element(4)
+    (4, 3)
     """
 
-    gen = func()
+    source = func()
+
+    if isinstance(source, RandomAccess) and not isinstance(source, Mapping):
+        return _random_access(source)
+
+    gen = source if isinstance(source, Skippable) else iter(source)
     index = 0
+    window: Deque[Any] = deque(maxlen=memo)
 
     def helper(n: int) -> Any:
         nonlocal index
 
-        if n < index + 1:
+        if n <= 0:
+            raise IndexError("`n` must be positive.")
+
+        if n <= index:
+            if index - n < len(window):
+                return window[n - index - 1]
+
             raise IndexError(
                 f"The element with this index does not exist or it has been passed through"
             )
 
-        result = None
+        # Only the elements that end up in the window are produced.
+        skipped = n - index - max(memo, 1)
+        if skipped > 0:
+            if isinstance(gen, Skippable):
+                gen.skip(skipped)
+            else:
+                next(islice(gen, skipped, skipped), None)
+
+            index += skipped
+            window.clear()
+
+        result = _MISSING
         while index != n:
-            result = next(gen, None)
+            result = next(gen, _MISSING)
 
-            if result is None:
+            if result is _MISSING:
                 raise IndexError(f"Generator does not have {n} elements.")
 
+            window.append(result)
             index += 1
 
         return result
 
     return helper
+
+
+def _random_access(source: RandomAccess) -> Callable[..., Any]:
+    """
+    Returns a function that reads the nth element (1-based) of `source`.
+    """
+
+    def helper(n: int) -> Any:
+        if n <= 0:
+            raise IndexError("`n` must be positive.")
+
+        try:
+            return source[n - 1]
+        except IndexError:
+            raise IndexError(
+                f"Generator does not have {n} elements."
+            ) from None
+
+    return helper
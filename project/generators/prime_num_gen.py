@@ -1,16 +1,46 @@
 import math
-from typing import Generator
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import compress, count
+from typing import Deque, Generator, List
 
+from project.generators.primes import get_prime_table, primes_between
+from project.process_context import PROCESS_CONTEXT
 
-def prime_num_gen() -> Generator[int, None, None]:
+# Odd numbers sieved per segment: one byte each, so a segment stays small
+# enough for the CPU cache however long the generator runs.
+SEGMENT_SIZE = 1 << 15
+
+_ZEROS = memoryview(bytes(SEGMENT_SIZE))
+
+# Numbers sieved by a worker process at a time in parallel mode. Each task
+# takes tens of milliseconds, long enough to outweigh sending its primes
+# back to the parent.
+PARALLEL_SEGMENT_SIZE = 1 << 21
+
+
+def prime_num_gen(workers: int = 1) -> Generator[int, None, None]:
     """
     Generates an infinite sequence of prime numbers.
 
     This is a generator function that yields prime numbers indefinitely. It starts from 2
-    (the smallest prime number) and checks each subsequent number for primality. A number
-    is considered prime if it is not divisible by any number other than 1 and itself.
-    The generator uses trial division up to the square root of the current number (`n`)
-    to determine if it is prime.
+    (the smallest prime number) and runs an incremental segmented Sieve of Eratosthenes
+    over the odd numbers: each segment of `SEGMENT_SIZE` odd numbers is a bytearray in
+    which the multiples of the base primes (the primes up to the square root of the end
+    of the segment) are crossed out, and the numbers left are the primes. The first
+    segment is sieved on its own. The base primes for the later ones are taken lazily
+    from a nested generator, so memory stays bounded by one segment plus the base primes.
+
+    With `workers` above one, contiguous segments of `PARALLEL_SEGMENT_SIZE` numbers are
+    sieved by a pool of that many processes instead (see `_parallel_primes`). The primes
+    come out in the same order.
+
+    When an on-disk prime table is in use (see `primes.use_prime_table`), the primes it
+    covers are read from it and sieving starts past its limit.
+
+    Args:
+        workers : The number of processes sieving segments.
 
     Yields:
         The next prime number in the sequence.
@@ -29,18 +59,95 @@ def prime_num_gen() -> Generator[int, None, None]:
     11
     """
 
-    n = 2
+    if workers <= 0:
+        raise ValueError("The number of workers must be positive.")
+
+    low = 0
+    table = get_prime_table()
+    if table is not None and table.limit:
+        yield from table.primes()
+        low = table.limit
+
+    if workers > 1:
+        yield from _parallel_primes(workers, low)
+        return
+
+    if not low:
+        yield 2
+
+        # The element i of a segment starting at `low` stands for
+        # low + 2i + 1.
+        sieve = bytearray(b"\x01") * SEGMENT_SIZE
+        sieve[0] = 0
+        for i in range(1, (math.isqrt(2 * SEGMENT_SIZE) - 1) // 2 + 1):
+            if sieve[i]:
+                _cross_out(sieve, (2 * i + 1) ** 2 // 2, 2 * i + 1)
+
+        yield from compress(range(1, 2 * SEGMENT_SIZE, 2), sieve)
+        low = 2 * SEGMENT_SIZE
+
+    base_primes = prime_num_gen()
+    next(base_primes)  # Only odd multiples are sieved
+    primes: List[int] = []
+    # The index, in the current segment, of the next multiple of each prime
+    offsets: List[int] = []
+    prime = next(base_primes)
 
     while True:
-        is_prime = True
-        limit = math.isqrt(n)
+        high = low + 2 * SEGMENT_SIZE
+
+        while prime * prime < high:
+            # The first odd multiple from prime^2 on, not below `low`
+            multiple = max(prime * prime, -(-low // prime) * prime)
+            if multiple % 2 == 0:
+                multiple += prime
+            primes.append(prime)
+            offsets.append((multiple - low) // 2)
+            prime = next(base_primes)
+
+        sieve = bytearray(b"\x01") * SEGMENT_SIZE
+        for k, (p, offset) in enumerate(zip(primes, offsets)):
+            offsets[k] = _cross_out(sieve, offset, p) - SEGMENT_SIZE
+
+        yield from compress(range(low + 1, high, 2), sieve)
+        low = high
+
+
+def _cross_out(sieve: bytearray, start: int, step: int) -> int:
+    """
+    Zeroes every `step`-th byte of the sieve from `start` on, and returns the
+    index of the first one past its end.
+    """
+
+    count = len(range(start, len(sieve), step))
+    sieve[start::step] = _ZEROS[:count]
+
+    return start + count * step
+
+
+def _parallel_primes(workers: int, low: int) -> Generator[int, None, None]:
+    """
+    Yields the primes from `low` on, in order, while a process pool sieves
+    the segments ahead. The pending segments form a bounded reorder buffer:
+    each one is submitted in order and its primes are yielded once every
+    earlier segment has been, while at most `2 * workers` segments are in
+    flight, so the workers stay busy but finished segments can't pile up.
+    """
 
-        for divisor in range(2, limit + 1):
-            if n % divisor == 0:
-                is_prime = False
-                break
+    pool = ProcessPoolExecutor(workers, mp_context=PROCESS_CONTEXT)
+    pending: Deque["Future[array[int]]"] = deque()
+    starts = count(low, PARALLEL_SEGMENT_SIZE)
 
-        if is_prime:
-            yield n
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                low = next(starts)
+                pending.append(
+                    pool.submit(
+                        primes_between, low, low + PARALLEL_SEGMENT_SIZE
+                    )
+                )
 
-        n += 1
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
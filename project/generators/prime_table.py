@@ -0,0 +1,337 @@
+import mmap
+import os
+from itertools import compress, islice
+from struct import Struct
+from typing import Iterator, Optional, TypeAlias, Union
+
+from project.generators.primes import primes_between
+
+Path: TypeAlias = Union[str, "os.PathLike[str]"]
+
+# Magic, format version, the numbers covered ([0, limit)) and the number of
+# odd primes among them, padded to 24 bytes.
+HEADER = Struct("<6sBxQQ")
+MAGIC = b"PRIMES"
+VERSION = 1
+
+# The table is a sequence of blocks, each made of the number of odd primes
+# below the block (a little-endian uint64) and a bitset of BLOCK_BYTES
+# bytes with a bit per odd number, set for the primes. Bit i of the block
+# starting at `low` stands for low + 2i + 1, least significant bit first.
+BLOCK_COUNT = Struct("<Q")
+BLOCK_BYTES = 1 << 13
+BLOCK_SPAN = 16 * BLOCK_BYTES
+BLOCK_SIZE = BLOCK_COUNT.size + BLOCK_BYTES
+
+# Maps the bytes 0 and 1 to the digits "0" and "1", and back.
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class PrimeTable:
+    """
+    A class to represent a table of the primes below some limit, stored on
+    disk as a bitset of odd numbers (an eighth of a byte per number below
+    the limit) and memory-mapped when opened, so it is computed once and
+    then read by any number of processes without sieving.
+
+    The bitset is split into blocks that start with the count of primes
+    before them, so counting and indexing primes read a single block.
+
+    Methods:
+    -------
+    `create(path: Path, limit: int) -> PrimeTable`:
+        Class method to write a new table of the primes below `limit`.
+
+    `limit -> int`:
+        Property returning the bound below which all primes are recorded.
+
+    `__len__() -> int`:
+        Returns the number of primes in the table.
+
+    `is_prime(x: int) -> bool`:
+        Checks whether a number below the limit is prime.
+
+    `prime_pi(x: int) -> int`:
+        Counts the primes less than or equal to a number below the limit.
+
+    `nth_prime(n: int) -> int`:
+        Returns the nth prime in the table (1-based).
+
+    `primes(start: int = 0, stop: Optional[int] = None) -> Iterator[int]`:
+        Iterates over the primes of the table in [start, stop).
+
+    `extend(limit: int) -> None`:
+        Appends blocks to the file until it covers `limit`.
+
+    `close() -> None`:
+        Unmaps the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Opens and maps a table written by `create`.
+
+        Raises:
+        ValueError: If the file is not a prime table or is truncated.
+        """
+
+        self.path = path
+        self._file = open(path, "r+b")
+        self._map: Optional[mmap.mmap] = None
+        self._limit = self._count = 0
+
+        try:
+            self._remap()
+        except ValueError:
+            self._file.close()
+            raise
+
+    @classmethod
+    def create(cls, path: Path, limit: int) -> "PrimeTable":
+        """
+        Writes a table of the primes below `limit`, rounded up to a whole
+        block, to `path` and opens it.
+        """
+
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        os.replace(temporary, path)
+
+        table = cls(path)
+        table.extend(limit)
+
+        return table
+
+    @property
+    def limit(self) -> int:
+        """
+        The bound below which every prime is recorded.
+        """
+
+        return self._limit
+
+    def __len__(self) -> int:
+        """
+        Returns the number of primes in the table.
+        """
+
+        return self._count + (self._limit > 2)
+
+    def is_prime(self, x: int) -> bool:
+        """
+        Checks whether `x` is a prime number.
+
+        Raises:
+        ValueError: If `x` is not below the limit of the table.
+        """
+
+        if x < 2:
+            return False
+
+        self._check(x)
+
+        if x % 2 == 0:
+            return x == 2
+
+        block, bit = divmod(x // 2, 8 * BLOCK_BYTES)
+        start = HEADER.size + block * BLOCK_SIZE + BLOCK_COUNT.size + bit // 8
+
+        return bool(self._bits[start] >> (bit % 8) & 1)
+
+    def prime_pi(self, x: int) -> int:
+        """
+        Counts the prime numbers less than or equal to `x`.
+
+        Raises:
+        ValueError: If `x` is not below the limit of the table.
+        """
+
+        if x < 2:
+            return 0
+
+        self._check(x)
+
+        # The odd numbers up to x are the first (x + 1) // 2 bits.
+        block, bits = divmod((x + 1) // 2, 8 * BLOCK_BYTES)
+        if not bits:
+            return 1 + self._odd_primes_before(block)
+
+        before, bitset = self._block(block)
+        value = int.from_bytes(bitset, "little") & ((1 << bits) - 1)
+
+        return 1 + before + value.bit_count()
+
+    def nth_prime(self, n: int) -> int:
+        """
+        Returns the nth prime number of the table (1-based).
+
+        Raises:
+        IndexError: If `n` is not positive or greater than the number of
+            primes in the table.
+        """
+
+        if not 0 < n <= len(self):
+            raise IndexError(f"The table doesn't have {n} primes.")
+
+        if n == 1:
+            return 2
+
+        # The last block with fewer than n - 1 odd primes before it.
+        low, high = 0, self._limit // BLOCK_SPAN
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self._odd_primes_before(middle) < n - 1:
+                low = middle
+            else:
+                high = middle
+
+        before, bitset = self._block(low)
+        primes = _decode(bitset, low * BLOCK_SPAN)
+
+        return next(islice(primes, n - 2 - before, None))
+
+    def primes(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[int]:
+        """
+        Lazily iterates over the primes of the table in [start, stop), one
+        block at a time. By default it runs to the end of the table.
+        """
+
+        stop = self._limit if stop is None else min(stop, self._limit)
+
+        if start <= 2 < stop:
+            yield 2
+
+        for block in range(
+            max(start, 0) // BLOCK_SPAN, -(-stop // BLOCK_SPAN)
+        ):
+            low = block * BLOCK_SPAN
+            primes = _decode(self._block(block)[1], low)
+
+            if start > low or stop < low + BLOCK_SPAN:
+                yield from (p for p in primes if start <= p < stop)
+            else:
+                yield from primes
+
+    def extend(self, limit: int) -> None:
+        """
+        Appends blocks to the file until it covers every number below
+        `limit`. The blocks are sieved one at a time and the header is
+        updated last, so an interrupted extension leaves a valid table.
+        """
+
+        count, low = self._count, self._limit
+        self._file.seek(HEADER.size + low // BLOCK_SPAN * BLOCK_SIZE)
+        self._file.truncate()
+
+        while low < limit:
+            flags = bytearray(BLOCK_SPAN // 2)
+            for p in primes_between(max(low, 3), low + BLOCK_SPAN):
+                flags[(p - low) // 2] = 1
+
+            digits = flags.translate(_TO_DIGITS)[::-1]
+            self._file.write(BLOCK_COUNT.pack(count))
+            self._file.write(int(digits, 2).to_bytes(BLOCK_BYTES, "little"))
+
+            count += flags.count(1)
+            low += BLOCK_SPAN
+
+        if low == self._limit:
+            return
+
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, low, count))
+        self._file.flush()
+        self._remap()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file.
+        """
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @property
+    def _bits(self) -> mmap.mmap:
+        if self._map is None:
+            raise ValueError("The prime table is closed.")
+
+        return self._map
+
+    def _remap(self) -> None:
+        """
+        Maps the file again after it changed, checking its header.
+        """
+
+        self._file.seek(0)
+        header = self._file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{self.path!r} is not a prime table.")
+
+        magic, version, limit, count = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or limit % BLOCK_SPAN:
+            raise ValueError(f"{self.path!r} is not a prime table.")
+
+        self._file.seek(0, 2)
+        if self._file.tell() < HEADER.size + limit // BLOCK_SPAN * BLOCK_SIZE:
+            raise ValueError(f"{self.path!r} is truncated or corrupted.")
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        self._limit, self._count = limit, count
+        if limit:
+            # The offset must be a multiple of the page size: the header is
+            # skipped in `_block` instead.
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    def _block(self, block: int) -> "tuple[int, bytes]":
+        """
+        Returns the odd primes before a block and the block's bitset.
+        """
+
+        start = HEADER.size + block * BLOCK_SIZE
+        (before,) = BLOCK_COUNT.unpack_from(self._bits, start)
+        bitset = self._bits[start + BLOCK_COUNT.size : start + BLOCK_SIZE]
+
+        return before, bitset
+
+    def _odd_primes_before(self, block: int) -> int:
+        """
+        Returns the number of odd primes below the start of a block.
+        """
+
+        if block * BLOCK_SPAN >= self._limit:
+            return self._count
+
+        (before,) = BLOCK_COUNT.unpack_from(
+            self._bits, HEADER.size + block * BLOCK_SIZE
+        )
+        return int(before)
+
+    def _check(self, x: int) -> None:
+        if not x < self._limit:
+            raise ValueError(f"{x} is beyond the limit of the prime table.")
+
+
+def _decode(bitset: bytes, low: int) -> Iterator[int]:
+    """
+    Lazily yields the primes recorded in the bitset of the block starting
+    at `low`.
+    """
+
+    value = int.from_bytes(bitset, "little")
+    digits = f"{value:0{8 * len(bitset)}b}"[::-1].encode()
+
+    return compress(
+        range(low + 1, low + BLOCK_SPAN, 2), digits.translate(_FROM_DIGITS)
+    )
@@ -0,0 +1,438 @@
+import math
+import os
+from array import array
+from bisect import bisect_right
+from itertools import compress
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from project.generators.prime_table import Path, PrimeTable
+
+# Numbers covered by the shared sieve when it is first used.
+INITIAL_LIMIT = 1 << 16
+
+# The shared sieve grows up to this limit. Larger queries use Miller-Rabin
+# (`is_prime`), Lucy's prime-counting algorithm (`prime_pi`) or a temporary
+# segmented sieve (`nth_prime`), so memory stays within about 25 MB.
+SIEVE_LIMIT = 1 << 24
+
+# Numbers sieved at a time past the shared sieve.
+SEGMENT_SIZE = 1 << 20
+
+# With these bases Miller-Rabin is exact below 3.3 * 10^24, which covers
+# every 64-bit integer.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+class _PrimeCache:
+    """
+    A process-wide sieve of Eratosthenes that grows on demand. It keeps a
+    primality flag per number below `limit` and the sorted list of primes
+    below it. Growth at least doubles the limit, and only the new range is
+    sieved, with the primes already known.
+    """
+
+    def __init__(self) -> None:
+        self.limit = 0
+        self.flags = bytearray()
+        self.primes = array("q")
+        self._lock = Lock()
+
+    def extend(self, limit: int) -> None:
+        """
+        Makes the sieve cover every number below `limit`.
+        """
+
+        if limit <= self.limit:
+            return
+
+        with self._lock:
+            if limit <= self.limit:
+                return
+
+            high = max(limit, min(2 * self.limit, SIEVE_LIMIT), INITIAL_LIMIT)
+            segment = _sieve_segment(self.limit, high, self.primes)
+
+            self.primes.extend(compress(range(self.limit, high), segment))
+            self.flags.extend(segment)
+            self.limit = high
+
+
+_cache = _PrimeCache()
+
+# The on-disk table in use, if any (see `use_prime_table`).
+_table: Optional["PrimeTable"] = None
+
+
+def use_prime_table(path: "Path", limit: int = 0) -> "PrimeTable":
+    """
+    Serves the functions of this module, and `prime_num_gen`, from an
+    on-disk prime table (see `prime_table`) for the numbers it covers. The
+    table is memory-mapped, so opening it is instant and processes using
+    the same file share its pages.
+
+    Args:
+        path : The table file. It is created if it doesn't exist.
+        limit : The bound the table is extended to if it covers less.
+
+    Returns:
+    PrimeTable:
+        The table, now used by this process.
+
+    Raises:
+    ValueError: If the file exists but is not a prime table.
+    """
+
+    # Imported here: tables are built with `primes_between`.
+    from project.generators.prime_table import PrimeTable
+
+    global _table
+
+    if os.path.exists(path):
+        table = PrimeTable(path)
+        table.extend(limit)
+    else:
+        table = PrimeTable.create(path, limit)
+
+    drop_prime_table()
+    _table = table
+
+    return table
+
+
+def drop_prime_table() -> None:
+    """
+    Stops using the on-disk prime table, if any, and closes it.
+    """
+
+    global _table
+
+    if _table is not None:
+        _table.close()
+        _table = None
+
+
+def get_prime_table() -> Optional["PrimeTable"]:
+    """
+    Returns the on-disk prime table in use, if any.
+    """
+
+    return _table
+
+
+class Primes:
+    """
+    A class to represent the infinite sequence of prime numbers, indexed from
+    0, for random access (for instance with `get_nth_element`) without
+    generating the primes before the one read.
+
+    Methods:
+    -------
+    `__getitem__(index: int) -> int`:
+        Returns the prime at a 0-based index, with `nth_prime`.
+
+    `__iter__() -> Iterator[int]`:
+        Iterates over the primes, with `prime_num_gen`.
+    """
+
+    def __getitem__(self, index: int) -> int:
+        """
+        Returns the prime at a 0-based index.
+
+        Raises:
+        IndexError: If `index` is negative.
+        """
+
+        if index < 0:
+            raise IndexError("The sequence of primes has no end.")
+
+        return nth_prime(index + 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterates over the primes in order.
+        """
+
+        # Imported here: prime_num_gen is built on top of this module.
+        from project.generators.prime_num_gen import prime_num_gen
+
+        return prime_num_gen()
+
+
+def is_prime(x: int) -> bool:
+    """
+    Checks whether `x` is a prime number.
+
+    Numbers covered by the prime table in use (see `use_prime_table`) or by
+    the shared sieve are looked up in them. Larger ones are tested by trial
+    division by the first primes and then with the Miller-Rabin test, which
+    is deterministic below 3.3 * 10^24, so for every 64-bit integer (see
+    `MILLER_RABIN_BASES`). Above that bound it is a strong probable-prime
+    test.
+
+    Args:
+        x : The number to test.
+
+    Returns:
+    bool:
+        True if `x` is prime, False otherwise.
+
+    Example:
+    >>> is_prime(97)
+    True
+    >>> is_prime(2**61 - 1)
+    True
+    """
+
+    if x < 2:
+        return False
+
+    if _table is not None and x < _table.limit:
+        return _table.is_prime(x)
+
+    _cache.extend(INITIAL_LIMIT)
+    if x < _cache.limit:
+        return bool(_cache.flags[x])
+
+    for p in MILLER_RABIN_BASES:
+        if x % p == 0:
+            return False
+
+    # x - 1 = d * 2^s with d odd
+    d, s = x - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+
+    for base in MILLER_RABIN_BASES:
+        y = pow(base, d, x)
+        if y == 1 or y == x - 1:
+            continue
+
+        for _ in range(s - 1):
+            y = y * y % x
+            if y == x - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def prime_pi(x: int) -> int:
+    """
+    Counts the prime numbers less than or equal to `x`.
+
+    Within the prime table in use, if any, the count is read off it. Up to
+    `SIEVE_LIMIT` it is read off the shared sieve, growing it if needed.
+    Above it, Lucy's variant of the Legendre-Meissel method counts the
+    primes in O(x^(3/4)) time and O(sqrt(x)) memory, without sieving up to
+    `x`.
+
+    Args:
+        x : The upper bound, included.
+
+    Returns:
+    int:
+        The number of primes in [2, x].
+
+    Example:
+    >>> prime_pi(100)
+    25
+    """
+
+    if x < 2:
+        return 0
+
+    if _table is not None and x < _table.limit:
+        return _table.prime_pi(x)
+
+    if x < SIEVE_LIMIT:
+        _cache.extend(x + 1)
+        return bisect_right(_cache.primes, x)
+
+    return _count_primes(x)
+
+
+def nth_prime(n: int) -> int:
+    """
+    Returns the nth prime number (1-based, so `nth_prime(1)` is 2).
+
+    Primes within the prime table in use, if any, are read off it. Others
+    are bracketed by the bounds of Rosser and Dusart,
+    n (ln n + ln ln n - 1) < p_n < n (ln n + ln ln n) for n >= 6. When the
+    upper bound is within `SIEVE_LIMIT` the shared sieve is grown to it and
+    indexed. Otherwise the primes below the lower bound are counted with
+    `prime_pi`, and the gap between the bounds is sieved segment by segment
+    until the nth prime is reached.
+
+    Args:
+        n : The 1-based position of the prime.
+
+    Returns:
+    int:
+        The nth prime number.
+
+    Raises:
+    IndexError: If `n` is less than or equal to zero.
+
+    Example:
+    >>> nth_prime(1)
+    2
+    >>> nth_prime(100000)
+    1299709
+    """
+
+    if n <= 0:
+        raise IndexError("`n` must be positive.")
+
+    if _table is not None and n <= len(_table):
+        return _table.nth_prime(n)
+
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+
+    log_n = math.log(n)
+    upper = int(n * (log_n + math.log(log_n))) + 1
+
+    if upper < SIEVE_LIMIT:
+        _cache.extend(upper + 1)
+        return _cache.primes[n - 1]
+
+    low = int(n * (log_n + math.log(log_n) - 1))
+    count = prime_pi(low - 1)
+    base_primes = _base_primes(math.isqrt(upper) + 1)
+
+    while True:
+        high = low + SEGMENT_SIZE
+        segment = _sieve_segment(low, high, base_primes)
+        found = segment.count(1)
+
+        if count + found >= n:
+            primes = compress(range(low, high), segment)
+            for _ in range(n - count - 1):
+                next(primes)
+            return next(primes)
+
+        count += found
+        low = high
+
+
+def primes_between(low: int, high: int) -> "array[int]":
+    """
+    Returns the primes in [low, high) as a packed array of 64-bit integers.
+
+    Ranges covered by the prime table in use or by the shared sieve are
+    read off them. Others are sieved on their own with the primes up to
+    sqrt(high), for which the shared sieve is grown up to `SIEVE_LIMIT`, so
+    the memory used is about one byte per number of the range, plus one
+    per number up to sqrt(high) past that limit.
+
+    Args:
+        low : The start of the range, included.
+        high : The end of the range, excluded.
+
+    Returns:
+    array[int]:
+        The primes in the range, in increasing order.
+
+    Example:
+    >>> list(primes_between(10, 30))
+    [11, 13, 17, 19, 23, 29]
+    """
+
+    low = max(low, 0)
+    if high <= low:
+        return array("q")
+
+    if _table is not None and high <= _table.limit:
+        return array("q", _table.primes(low, high))
+
+    if high <= _cache.limit:
+        start = bisect_right(_cache.primes, low - 1)
+        return _cache.primes[start : bisect_right(_cache.primes, high - 1)]
+
+    base_primes = _base_primes(math.isqrt(high) + 1)
+    segment = _sieve_segment(low, high, base_primes)
+
+    return array("q", compress(range(low, high), segment))
+
+
+def _base_primes(limit: int) -> "array[int]":
+    """
+    Returns the primes below `limit`, read off the shared sieve when the
+    limit is within `SIEVE_LIMIT`. Larger ones are sieved in a temporary
+    segment, so that a single query far away doesn't grow the shared sieve
+    past its bound for the lifetime of the process.
+    """
+
+    if limit <= SIEVE_LIMIT:
+        _cache.extend(limit)
+        return _cache.primes
+
+    return array("q", compress(range(limit), _sieve_segment(0, limit, ())))
+
+
+def _sieve_segment(low: int, high: int, primes: Iterable[int]) -> bytearray:
+    """
+    Sieves the numbers in [low, high): the returned flags are 1 for the
+    primes. `primes` must hold every prime below sqrt(high), in order,
+    unless `low` is 0: the primes are then found in the segment itself.
+    """
+
+    size = high - low
+    segment = bytearray(b"\x01") * size
+    zeros = memoryview(bytes(size))
+
+    if low == 0:
+        segment[:2] = bytes(2)
+        primes = compress(range(math.isqrt(high - 1) + 1), segment)
+
+    for p in primes:
+        if p * p >= high:
+            break
+
+        start = max(p * p, -(-low // p) * p) - low
+        segment[start::p] = zeros[: len(range(start, size, p))]
+
+    return segment
+
+
+def _count_primes(x: int) -> int:
+    """
+    Counts the primes up to `x` with Lucy's algorithm.
+
+    For every value v of the form x // k, S(v) starts as the count of
+    numbers in [2, v] and is sieved by each prime p up to sqrt(x) in turn:
+    S(v) -= S(v // p) - S(p - 1) for v >= p^2. Afterwards S(v) = pi(v).
+    `small[v]` holds S(v) for v <= sqrt(x) and `large[k]` holds S(x // k).
+    """
+
+    r = math.isqrt(x)
+    small = [v - 1 for v in range(r + 1)]
+    large = [0] + [x // k - 1 for k in range(1, r + 1)]
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue
+
+        below = small[p - 1]
+        square = p * p
+
+        # All reads below are of values not yet updated for p, as in a
+        # descending pass.
+        end = min(r, x // square)
+        split = min(end, r // p)
+        large[1 : end + 1] = [
+            large[k] - large[k * p] + below for k in range(1, split + 1)
+        ] + [
+            large[k] - small[x // (k * p)] + below
+            for k in range(split + 1, end + 1)
+        ]
+
+        if square <= r:
+            small[square:] = [
+                small[v] - small[v // p] + below for v in range(square, r + 1)
+            ]
+
+    return large[1]
@@ -1,8 +1,27 @@
-from typing import Generator
-from itertools import product
+from collections.abc import Buffer, Sequence
+from typing import Generator, Iterator, Optional, TypeAlias, Union, overload
+from itertools import chain, product
 
+RGBA: TypeAlias = tuple[int, int, int, int]
 
-def get_rgba_gen() -> Generator[tuple[int, int, int, int], None, None]:
+# Values of each color component, and of the alpha component (even only).
+CHANNEL_VALUES = range(256)
+ALPHA_VALUES = range(0, 101, 2)
+
+# The vectors are ordered like the numbers written with the digits R, G, B
+# (base 256) and A // 2 (base 51), so the index of a vector is computed
+# from its components and back.
+RGBA_COUNT = len(CHANNEL_VALUES) ** 3 * len(ALPHA_VALUES)
+
+# The vectors sharing their R and G components, packed as RGBA8888 with R
+# and G set to zero. Bulk fills copy it and then overwrite those channels.
+_BLOCK = bytes(
+    chain.from_iterable(product((0,), (0,), CHANNEL_VALUES, ALPHA_VALUES))
+)
+_BLOCK_LENGTH = len(CHANNEL_VALUES) * len(ALPHA_VALUES)
+
+
+def get_rgba_gen() -> Generator[RGBA, None, None]:
     """
     Generates all possible RGBA color combinations.
 
@@ -30,21 +49,18 @@ def get_rgba_gen() -> Generator[tuple[int, int, int, int], None, None]:
     (0, 0, 0, 4)
     """
 
-    return (
-        (r, g, b, a)
-        for r, g, b in product(range(256), repeat=3)
-        for a in range(0, 101)
-        if a % 2 == 0
+    yield from product(
+        CHANNEL_VALUES, CHANNEL_VALUES, CHANNEL_VALUES, ALPHA_VALUES
     )
 
 
-def get_nth_rgba_vec(n: int) -> tuple[int, int, int, int]:
+def get_nth_rgba_vec(n: int) -> RGBA:
     """
-    Retrieves the nth RGBA vector from the RGBA generator.
+    Retrieves the nth RGBA vector of the RGBA generator.
 
-    This function uses the `get_rgba_gen()` generator to retrieve the RGBA color tuple at
-    the specified index `n`. The index is 0-based, meaning the first element corresponds
-    to `n=0`. If `n` is negative, it raises an `IndexError`.
+    The vector is decoded from `n` arithmetically, as the digits of `n` in the mixed
+    radix of the components (see `RGBA_COUNT`), so no vector before it is generated.
+    The index is 0-based, meaning the first element corresponds to `n=0`.
 
     Args:
         n : The 0-based index of the RGBA tuple to retrieve.
@@ -64,22 +80,294 @@ def get_nth_rgba_vec(n: int) -> tuple[int, int, int, int]:
     (0, 0, 0, 2)
     >>> get_nth_rgba_vec(5)
     (0, 0, 0, 10)
+    >>> get_nth_rgba_vec(RGBA_COUNT - 1)
+    (255, 255, 255, 100)
     """
 
     if n < 0:
         raise IndexError("`n` must be non-negative")
 
-    if n > 256**3 * 51:
-        raise IndexError("Generator does not have {n} elements.")
+    if n >= RGBA_COUNT:
+        raise IndexError(f"Generator does not have {n + 1} elements.")
 
-    gen = get_rgba_gen()
+    return _decode(n)
 
-    for i, val in enumerate(gen):
-        if i == n:
-            return val
 
-    # This line should not be reached because of the bounds check above,
-    # but is added to satisfy mypy's exhaustive checks.
-    raise IndexError(
-        f"Generator exhausted unexpectedly before reaching element {n}."
-    )
+def rgba_index(r: int, g: int, b: int, a: int) -> int:
+    """
+    Returns the 0-based index of an RGBA vector in the RGBA generator, the
+    inverse of `get_nth_rgba_vec`.
+
+    Args:
+        r : Red component (0-255).
+        g : Green component (0-255).
+        b : Blue component (0-255).
+        a : Alpha component (0, 2, 4, ..., 100).
+
+    Returns:
+    int:
+        The index of (r, g, b, a).
+
+    Raises:
+    ValueError: If a component is out of its range, or `a` is odd.
+
+    Example:
+    >>> rgba_index(0, 0, 1, 0)
+    51
+    >>> get_nth_rgba_vec(rgba_index(12, 34, 56, 78))
+    (12, 34, 56, 78)
+    """
+
+    if not (
+        r in CHANNEL_VALUES and g in CHANNEL_VALUES and b in CHANNEL_VALUES
+    ):
+        raise ValueError(f"{(r, g, b)} is not a valid RGB color.")
+
+    if a not in ALPHA_VALUES:
+        raise ValueError(f"{a} is not a valid alpha value.")
+
+    rgb = (r * len(CHANNEL_VALUES) + g) * len(CHANNEL_VALUES) + b
+
+    return rgb * len(ALPHA_VALUES) + a // 2
+
+
+def fill_rgba(buffer: Buffer, start: int = 0) -> int:
+    """
+    Fills a writable buffer with the RGBA vectors from index `start` on,
+    packed as RGBA8888 (one byte per component, in that order).
+
+    The buffer may be a `bytearray`, an `array('B')`, a memoryview or any
+    other writable object supporting the buffer protocol, such as an image
+    or texture buffer, so a palette can be streamed slice by slice without
+    creating a tuple per vector. Vectors are copied a block of 13056 (all
+    those sharing R and G) at a time from a precomputed block.
+
+    Args:
+        buffer : The buffer to fill. Its size must be a multiple of 4.
+        start : The 0-based index of the first vector to write.
+
+    Returns:
+    int:
+        The number of vectors written, the size of the buffer divided by 4.
+
+    Raises:
+    ValueError: If the size of the buffer is not a multiple of 4.
+    IndexError: If the vectors run past the end of the generator.
+
+    Example:
+    >>> palette = bytearray(8)
+    >>> fill_rgba(palette, 50)
+    2
+    >>> list(palette)
+    [0, 0, 0, 100, 0, 0, 1, 0]
+    """
+
+    with memoryview(buffer) as view, view.cast("B") as data:
+        if len(data) % 4:
+            raise ValueError("The buffer size must be a multiple of 4.")
+
+        stop = start + len(data) // 4
+        if start < 0 or stop > RGBA_COUNT:
+            raise IndexError(
+                f"Vectors [{start}, {stop}) are out of the generator."
+            )
+
+        index, offset = start, 0
+        while index < stop:
+            rg, within = divmod(index, _BLOCK_LENGTH)
+            r, g = divmod(rg, len(CHANNEL_VALUES))
+            count = min(_BLOCK_LENGTH - within, stop - index)
+            end = offset + 4 * count
+
+            data[offset:end] = _BLOCK[4 * within : 4 * (within + count)]
+            data[offset:end:4] = bytes((r,)) * count
+            data[offset + 1 : end : 4] = bytes((g,)) * count
+
+            index, offset = index + count, end
+
+    return stop - start
+
+
+def rgba_bytes(start: int = 0, stop: Optional[int] = None) -> bytearray:
+    """
+    Returns the RGBA vectors in [start, stop) packed as RGBA8888 (see
+    `fill_rgba`). By default it runs to the end of the generator, which
+    takes about 3.5 GB.
+
+    Raises:
+    IndexError: If the range is out of the generator.
+
+    Example:
+    >>> list(rgba_bytes(51, 53))
+    [0, 0, 1, 0, 0, 0, 1, 2]
+    """
+
+    stop = RGBA_COUNT if stop is None else stop
+    palette = bytearray(4 * max(stop - start, 0))
+    fill_rgba(palette, start)
+
+    return palette
+
+
+class RGBASequence(Sequence[RGBA]):
+    """
+    A class to represent the vectors of the RGBA generator, or a slice of
+    them, as a read-only sequence. Vectors are computed from their index on
+    access, so indexing, slicing, `len` and `in` never iterate.
+
+    Methods:
+    -------
+    `__len__() -> int`:
+        Returns the number of vectors in the sequence.
+
+    `__getitem__(index: Union[int, slice]) -> Union[RGBA, RGBASequence]`:
+        Returns the vector at an index, or the sequence of a slice.
+
+    `__contains__(value: object) -> bool`:
+        Checks whether a vector is in the sequence.
+
+    `index(value: RGBA) -> int`:
+        Returns the index of a vector in the sequence.
+
+    `count(value: RGBA) -> int`:
+        Returns the number of occurrences of a vector (0 or 1).
+
+    `tobytes() -> bytearray`:
+        Returns the vectors packed as RGBA8888.
+    """
+
+    def __init__(self, indices: range = range(RGBA_COUNT)) -> None:
+        """
+        Initializes the sequence of the vectors at `indices` in the RGBA
+        generator, by default all of them.
+        """
+
+        if indices and not (
+            0 <= indices[0] < RGBA_COUNT and 0 <= indices[-1] < RGBA_COUNT
+        ):
+            raise ValueError("Indices out of the RGBA generator.")
+
+        self._indices = indices
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the sequence.
+        """
+
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> RGBA:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RGBASequence":
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[RGBA, "RGBASequence"]:
+        """
+        Returns the vector at an index (negative ones count from the end), or
+        the sequence of the vectors in a slice.
+        """
+
+        if isinstance(index, slice):
+            return RGBASequence(self._indices[index])
+
+        return _decode(self._indices[index])
+
+    def __iter__(self) -> Iterator[RGBA]:
+        """
+        Iterates over the vectors of the sequence.
+        """
+
+        return map(_decode, self._indices)
+
+    def __reversed__(self) -> Iterator[RGBA]:
+        """
+        Iterates over the vectors of the sequence from the end.
+        """
+
+        return map(_decode, reversed(self._indices))
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Checks whether a vector is in the sequence.
+        """
+
+        try:
+            return _encode(value) in self._indices
+        except ValueError:
+            return False
+
+    def index(
+        self, value: object, start: int = 0, stop: int = RGBA_COUNT
+    ) -> int:
+        """
+        Returns the index of a vector in the sequence, searched in
+        [start, stop).
+
+        Raises:
+        ValueError: If the vector is not in the sequence.
+        """
+
+        position = self._indices.index(_encode(value))
+        if position not in range(len(self))[start:stop]:
+            raise ValueError(f"{value!r} is not in the sequence.")
+
+        return position
+
+    def count(self, value: object) -> int:
+        """
+        Returns the number of occurrences of a vector (0 or 1).
+        """
+
+        return int(value in self)
+
+    def tobytes(self) -> bytearray:
+        """
+        Returns the vectors of the sequence packed as RGBA8888, in bulk when
+        they are contiguous (see `fill_rgba`).
+        """
+
+        if self._indices.step == 1:
+            return rgba_bytes(self._indices.start, self._indices.stop)
+
+        return bytearray(chain.from_iterable(self))
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of the sequence.
+        """
+
+        return f"RGBASequence({self._indices!r})"
+
+
+def _decode(n: int) -> RGBA:
+    """
+    Returns the vector at index `n`, which must be in range.
+    """
+
+    rgb, alpha = divmod(n, len(ALPHA_VALUES))
+    rg, b = divmod(rgb, len(CHANNEL_VALUES))
+    r, g = divmod(rg, len(CHANNEL_VALUES))
+
+    return r, g, b, 2 * alpha
+
+
+def _encode(value: object) -> int:
+    """
+    Returns the index of a vector, given as a tuple of 4 integers.
+
+    Raises:
+    ValueError: If `value` is not an RGBA vector.
+    """
+
+    if not isinstance(value, tuple) or len(value) != 4:
+        raise ValueError(f"{value!r} is not an RGBA vector.")
+
+    if not all(isinstance(x, int) for x in value):
+        raise ValueError(f"{value!r} is not an RGBA vector.")
+
+    return rgba_index(*value)
@@ -0,0 +1,668 @@
+from abc import ABC, abstractmethod
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib import import_module
+from math import acos, copysign, hypot, nan, sumprod
+from operator import add, mul, sub
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+from project.matrix_vector_operations.elementwise import (
+    Operand,
+    broadcast_shape,
+    broadcast_values,
+)
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.matmul_kernels import (
+    naive_matmul,
+    tiled_matmul,
+)
+from project.matrix_vector_operations.parallel_matmul import parallel_matmul
+
+# NumPy is an optional dependency: without it only the pure-Python backend
+# is available.
+np: Any
+try:
+    np = import_module("numpy")
+except ImportError:
+    np = None
+
+
+class MatrixBackend(ABC):
+    """
+    An interface for the engines that carry out Matrix and Vector operations.
+
+    Backends work on `MatrixStorage` objects. Operations producing a matrix
+    take an optional `out` storage of the result's shape: when it is given
+    the result is written into it (it may be one of the operands) and `out`
+    is returned, otherwise a new storage is allocated. The caller makes sure
+    `out` is writable and not shared with a view.
+
+    Methods:
+    -------
+    `add(a: MatrixStorage, b: MatrixStorage, out: Optional[MatrixStorage] = None) -> MatrixStorage`:
+        Returns a + b.
+
+    `subtract(a: MatrixStorage, b: MatrixStorage, out: Optional[MatrixStorage] = None) -> MatrixStorage`:
+        Returns a - b.
+
+    `scale(a: MatrixStorage, alpha: float, out: Optional[MatrixStorage] = None) -> MatrixStorage`:
+        Returns alpha * a.
+
+    `add_scaled(a: MatrixStorage, alpha: float, b: MatrixStorage, out: Optional[MatrixStorage] = None) -> MatrixStorage`:
+        Returns a + alpha * b (the BLAS `axpy` operation).
+
+    `elementwise(function: Callable[..., float], operands: Sequence[Operand], out: Optional[MatrixStorage] = None) -> MatrixStorage`:
+        Applies a function elementwise to broadcast storages and scalars.
+
+    `copy(a: MatrixStorage) -> MatrixStorage`:
+        Returns a contiguous copy of a storage.
+
+    `matmul(a: MatrixStorage, b: MatrixStorage, tile_size: Optional[int], out: Optional[MatrixStorage] = None, workers: int = 1) -> MatrixStorage`:
+        Returns the matrix product of two storages.
+
+    `dot(a: MatrixStorage, b: MatrixStorage) -> float`:
+        Returns the dot product of two vector-shaped storages.
+
+    `norm(a: MatrixStorage) -> float`:
+        Returns the Euclidean norm of a vector-shaped storage.
+
+    `angle(a: MatrixStorage, b: MatrixStorage) -> float`:
+        Returns the angle (in radians) between two vector-shaped storages.
+
+    `row_dots(a: MatrixStorage, query: MatrixStorage) -> array`:
+        Returns the dot products of every row with a vector.
+
+    `matvec(a: MatrixStorage, x: MatrixStorage, out: Optional[MatrixStorage] = None) -> MatrixStorage`:
+        Returns the matrix-vector product as a column storage.
+
+    `row_norms(a: MatrixStorage) -> array`:
+        Returns the Euclidean norms of every row.
+
+    `cosines(dots: array, norms: array, query_norm: float) -> array`:
+        Turns dot products and norms into cosine similarities.
+
+    `arccos(values: array) -> array`:
+        Returns the arc cosines of cosine similarities.
+    """
+
+    name: str
+
+    @abstractmethod
+    def add(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        """
+        Returns the elementwise sum of two storages of the same shape.
+        """
+
+    @abstractmethod
+    def subtract(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        """
+        Returns the elementwise difference of two storages of the same shape.
+        """
+
+    @abstractmethod
+    def scale(
+        self,
+        a: MatrixStorage,
+        alpha: float,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        """
+        Returns the storage multiplied by a scalar.
+        """
+
+    @abstractmethod
+    def add_scaled(
+        self,
+        a: MatrixStorage,
+        alpha: float,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        """
+        Returns a + alpha * b in a single pass.
+        """
+
+    @abstractmethod
+    def elementwise(
+        self,
+        function: Callable[..., Any],
+        operands: Sequence[Operand],
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        """
+        Applies `function` to the operands elementwise, in a single pass,
+        after broadcasting them to a common shape (see `broadcast_shape`).
+        The pure-Python backend calls it once per element with floats; the
+        NumPy backend calls it once with whole arrays when it can (arithmetic
+        operators, NumPy ufuncs), and once per element otherwise.
+        """
+
+    @abstractmethod
+    def copy(self, a: MatrixStorage) -> MatrixStorage:
+        """
+        Returns a contiguous copy of a storage, materializing views.
+        """
+
+    @abstractmethod
+    def matmul(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        tile_size: Optional[int],
+        out: Optional[MatrixStorage] = None,
+        workers: int = 1,
+    ) -> MatrixStorage:
+        """
+        Returns the matrix product of two storages. `tile_size` is a hint
+        that backends without a blocked kernel may ignore. With `workers`
+        above one every backend computes the product in that many processes
+        with `parallel_matmul`.
+        """
+
+    @abstractmethod
+    def dot(self, a: MatrixStorage, b: MatrixStorage) -> float:
+        """
+        Returns the dot product of two vector-shaped storages.
+        """
+
+    @abstractmethod
+    def norm(self, a: MatrixStorage) -> float:
+        """
+        Returns the Euclidean norm of a vector-shaped storage.
+        """
+
+    def angle(self, a: MatrixStorage, b: MatrixStorage) -> float:
+        """
+        Returns the angle (in radians) between two vector-shaped storages.
+        """
+
+        return acos(self.dot(a, b) / (self.norm(a) * self.norm(b)))
+
+    @abstractmethod
+    def row_dots(
+        self, a: MatrixStorage, query: MatrixStorage
+    ) -> "array[float]":
+        """
+        Returns the dot products of every row of `a` with a vector-shaped
+        storage as a packed array.
+        """
+
+    def matvec(
+        self,
+        a: MatrixStorage,
+        x: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        """
+        Returns the product of a storage of shape (n, m) with a vector-shaped
+        storage of m elements as a storage of shape (n, 1), computed as one
+        pass of `row_dots` instead of a general `matmul`.
+        """
+
+        dots = self.row_dots(a, x)
+        if out is None:
+            return MatrixStorage.from_buffer(dots, a.height, 1)
+
+        out.assign(dots)
+        return out
+
+    @abstractmethod
+    def row_norms(self, a: MatrixStorage) -> "array[float]":
+        """
+        Returns the Euclidean norms of every row of `a` as a packed array.
+        """
+
+    @abstractmethod
+    def cosines(
+        self, dots: "array[float]", norms: "array[float]", query_norm: float
+    ) -> "array[float]":
+        """
+        Returns dots[i] / (norms[i] * query_norm), or NaN where a norm is
+        zero, as a packed array.
+        """
+
+    @abstractmethod
+    def arccos(self, values: "array[float]") -> "array[float]":
+        """
+        Returns the arc cosines of cosine similarities, clipped to [-1, 1]
+        first to absorb rounding errors, as a packed array.
+        """
+
+
+def _store(
+    values: Iterable[float],
+    height: int,
+    width: int,
+    out: Optional[MatrixStorage],
+) -> MatrixStorage:
+    """
+    Writes row-major values into `out`, or into a new storage without it.
+    """
+
+    if out is None:
+        return MatrixStorage.from_iterable(values, height, width)
+
+    out.assign(values)
+    return out
+
+
+class PythonBackend(MatrixBackend):
+    """
+    The pure-Python backend, built on `sumprod`, `hypot` and the kernels from
+    `matmul_kernels` and `parallel_matmul`. It is always available.
+    """
+
+    name = "python"
+
+    def add(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return _store(map(add, a.values(), b.values()), a.height, a.width, out)
+
+    def subtract(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return _store(map(sub, a.values(), b.values()), a.height, a.width, out)
+
+    def scale(
+        self,
+        a: MatrixStorage,
+        alpha: float,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return _store(
+            map(mul, a.values(), repeat(alpha)), a.height, a.width, out
+        )
+
+    def add_scaled(
+        self,
+        a: MatrixStorage,
+        alpha: float,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return _store(
+            map(add, a.values(), map(mul, repeat(alpha), b.values())),
+            a.height,
+            a.width,
+            out,
+        )
+
+    def elementwise(
+        self,
+        function: Callable[..., Any],
+        operands: Sequence[Operand],
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        height, width = broadcast_shape(operands)
+        values = map(
+            function,
+            *(
+                broadcast_values(operand, height, width)
+                for operand in operands
+            ),
+        )
+
+        return _store(values, height, width, out)
+
+    def copy(self, a: MatrixStorage) -> MatrixStorage:
+        return a.copy()
+
+    def matmul(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        tile_size: Optional[int],
+        out: Optional[MatrixStorage] = None,
+        workers: int = 1,
+    ) -> MatrixStorage:
+        if workers > 1:
+            return parallel_matmul(a, b, workers, tile_size, out)
+
+        if tile_size is None:
+            return naive_matmul(a, b, out)
+
+        return tiled_matmul(a, b, tile_size, out)
+
+    def dot(self, a: MatrixStorage, b: MatrixStorage) -> float:
+        return sumprod(a.values(), b.values())
+
+    def norm(self, a: MatrixStorage) -> float:
+        return hypot(*a.values())
+
+    def row_dots(
+        self, a: MatrixStorage, query: MatrixStorage
+    ) -> "array[float]":
+        return array("d", map(sumprod, a.rows(), repeat(list(query.values()))))
+
+    def row_norms(self, a: MatrixStorage) -> "array[float]":
+        return array("d", [hypot(*row) for row in a.rows()])
+
+    def cosines(
+        self, dots: "array[float]", norms: "array[float]", query_norm: float
+    ) -> "array[float]":
+        return array(
+            "d",
+            [
+                dot / (norm * query_norm) if norm and query_norm else nan
+                for dot, norm in zip(dots, norms)
+            ],
+        )
+
+    def arccos(self, values: "array[float]") -> "array[float]":
+        # NaN fails both comparisons and is passed through to `acos`.
+        return array(
+            "d",
+            [
+                acos(copysign(1.0, value) if abs(value) > 1 else value)
+                for value in values
+            ],
+        )
+
+
+class NumpyBackend(MatrixBackend):
+    """
+    A backend that hands every operation to NumPy, working directly on the
+    storages' buffers. Available only when NumPy is installed.
+    """
+
+    name = "numpy"
+
+    def add(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return self._apply(
+            np.add, out, storage_to_numpy(a), storage_to_numpy(b)
+        )
+
+    def subtract(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return self._apply(
+            np.subtract, out, storage_to_numpy(a), storage_to_numpy(b)
+        )
+
+    def scale(
+        self,
+        a: MatrixStorage,
+        alpha: float,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return self._apply(np.multiply, out, storage_to_numpy(a), alpha)
+
+    def add_scaled(
+        self,
+        a: MatrixStorage,
+        alpha: float,
+        b: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        return self._apply(
+            np.add, out, storage_to_numpy(a), alpha * storage_to_numpy(b)
+        )
+
+    def elementwise(
+        self,
+        function: Callable[..., Any],
+        operands: Sequence[Operand],
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        height, width = broadcast_shape(operands)
+        arrays = [
+            (
+                storage_to_numpy(operand)
+                if isinstance(operand, MatrixStorage)
+                else operand
+            )
+            for operand in operands
+        ]
+        try:
+            result = np.asarray(function(*arrays), dtype=np.float64)
+        except (TypeError, ValueError):
+            if isinstance(function, np.ufunc):
+                raise
+
+            # A function of numbers only (`math.sqrt`, or one branching on
+            # its arguments) fails on arrays: call it once per element.
+            vectorized = np.vectorize(function, otypes=[np.float64])
+            result = vectorized(*arrays)
+
+        if out is not None:
+            np.copyto(
+                storage_to_numpy(out), np.broadcast_to(result, (height, width))
+            )
+            return out
+
+        # Keep a fresh result as it is, but never share an operand's buffer.
+        if result.shape != (height, width) or not result.flags.owndata:
+            result = np.array(np.broadcast_to(result, (height, width)))
+
+        return storage_from_numpy(result)
+
+    def copy(self, a: MatrixStorage) -> MatrixStorage:
+        return storage_from_numpy(storage_to_numpy(a).copy(order="C"))
+
+    def matmul(
+        self,
+        a: MatrixStorage,
+        b: MatrixStorage,
+        tile_size: Optional[int],
+        out: Optional[MatrixStorage] = None,
+        workers: int = 1,
+    ) -> MatrixStorage:
+        # The worker processes are an explicit request: honour it, although
+        # NumPy's BLAS already runs on several threads.
+        if workers > 1:
+            return parallel_matmul(a, b, workers, tile_size, out)
+
+        return self._apply(
+            np.matmul, out, storage_to_numpy(a), storage_to_numpy(b)
+        )
+
+    def dot(self, a: MatrixStorage, b: MatrixStorage) -> float:
+        return float(
+            np.dot(storage_to_numpy(a).ravel(), storage_to_numpy(b).ravel())
+        )
+
+    def norm(self, a: MatrixStorage) -> float:
+        return float(np.linalg.norm(storage_to_numpy(a)))
+
+    def matvec(
+        self,
+        a: MatrixStorage,
+        x: MatrixStorage,
+        out: Optional[MatrixStorage] = None,
+    ) -> MatrixStorage:
+        # A single gemv, without the packed array in between.
+        column = storage_to_numpy(x).reshape(-1, 1)
+        return self._apply(np.matmul, out, storage_to_numpy(a), column)
+
+    def row_dots(
+        self, a: MatrixStorage, query: MatrixStorage
+    ) -> "array[float]":
+        return _packed(storage_to_numpy(a) @ storage_to_numpy(query).ravel())
+
+    def row_norms(self, a: MatrixStorage) -> "array[float]":
+        return _packed(np.linalg.norm(storage_to_numpy(a), axis=1))
+
+    def cosines(
+        self, dots: "array[float]", norms: "array[float]", query_norm: float
+    ) -> "array[float]":
+        denominators = np.frombuffer(norms) * query_norm
+        result = np.full(len(dots), np.nan)
+        np.divide(
+            np.frombuffer(dots),
+            denominators,
+            out=result,
+            where=denominators != 0,
+        )
+
+        return _packed(result)
+
+    def arccos(self, values: "array[float]") -> "array[float]":
+        return _packed(np.arccos(np.clip(np.frombuffer(values), -1.0, 1.0)))
+
+    @staticmethod
+    def _apply(
+        ufunc: Any, out: Optional[MatrixStorage], *operands: Any
+    ) -> MatrixStorage:
+        """
+        Calls a NumPy ufunc, writing straight into `out` when it is given.
+        NumPy copies overlapping inputs itself, so `out` may be an operand.
+        """
+
+        if out is None:
+            return storage_from_numpy(ufunc(*operands))
+
+        ufunc(*operands, out=storage_to_numpy(out))
+        return out
+
+
+def _packed(vector: Any) -> "array[float]":
+    """
+    Copies a one-dimensional NumPy array into a packed `array('d')`.
+    """
+
+    result = array("d")
+    result.frombytes(np.ascontiguousarray(vector, dtype=np.float64).tobytes())
+
+    return result
+
+
+def storage_to_numpy(storage: MatrixStorage) -> Any:
+    """
+    Returns a 2D NumPy array sharing the storage's buffer (and its strides).
+
+    Raises:
+    ImportError: If NumPy is not installed.
+    """
+
+    if np is None:
+        raise ImportError("NumPy is not installed.")
+
+    flat = np.frombuffer(storage.data, dtype=np.float64)
+
+    return np.lib.stride_tricks.as_strided(
+        flat[storage.offset :],
+        shape=(storage.height, storage.width),
+        strides=(storage.row_stride * 8, storage.col_stride * 8),
+        writeable=not storage.data.readonly,
+    )
+
+
+def storage_from_numpy(array: Any) -> MatrixStorage:
+    """
+    Wraps a 2D NumPy array in a storage. The buffer is shared when the array
+    already holds C-contiguous doubles, otherwise the data is copied once.
+
+    Raises:
+    ImportError: If NumPy is not installed.
+    ValueError: If the array is not two-dimensional.
+    """
+
+    if np is None:
+        raise ImportError("NumPy is not installed.")
+
+    if array.ndim != 2:
+        raise ValueError("Only two-dimensional arrays can be wrapped.")
+
+    array = np.ascontiguousarray(array, dtype=np.float64)
+    height, width = array.shape
+
+    return MatrixStorage.from_buffer(array, height, width)
+
+
+_BACKENDS: Dict[str, MatrixBackend] = {"python": PythonBackend()}
+if np is not None:
+    _BACKENDS["numpy"] = NumpyBackend()
+
+_default_backend = "numpy" if np is not None else "python"
+_scoped_backend: ContextVar[Optional[str]] = ContextVar(
+    "scoped_backend", default=None
+)
+
+
+def available_backends() -> list[str]:
+    """
+    Returns the names of the backends that can be used in this process.
+    """
+
+    return list(_BACKENDS)
+
+
+def get_backend(name: Optional[str] = None) -> MatrixBackend:
+    """
+    Resolves a backend by name.
+
+    Without a name, the backend selected by the innermost `use_backend` block
+    is returned, or the process-wide one set by `set_backend` (NumPy when it
+    is installed, pure Python otherwise).
+
+    Raises:
+    ValueError: If there is no available backend with this name.
+    """
+
+    if name is None:
+        name = _scoped_backend.get() or _default_backend
+
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown or unavailable backend {name!r}, "
+            f"choose one of {available_backends()}."
+        ) from None
+
+
+def set_backend(name: str) -> None:
+    """
+    Sets the backend used by default in the whole process.
+    """
+
+    global _default_backend
+
+    get_backend(name)
+    _default_backend = name
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[MatrixBackend]:
+    """
+    Selects a backend for the duration of a `with` block.
+
+    Example:
+    >>> with use_backend("python"):
+    ...     product = a * b
+    """
+
+    backend = get_backend(name)
+    token = _scoped_backend.set(name)
+
+    try:
+        yield backend
+    finally:
+        _scoped_backend.reset(token)
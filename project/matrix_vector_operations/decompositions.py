@@ -0,0 +1,620 @@
+from abc import ABC, abstractmethod
+from array import array
+from itertools import chain, repeat
+from math import copysign, hypot, prod, sqrt, sumprod
+from typing import Iterable, List, Optional, Tuple
+
+from project.matrix_vector_operations.backends import get_backend
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.vector_operations import Vector
+
+# Columns factored per panel by the blocked decompositions. Each panel is
+# factored in Python lists, and the rest of the matrix is updated with one
+# backend matrix product per panel, which is where most of the work goes.
+BLOCK_SIZE = 32
+
+
+class Decomposition(ABC):
+    """
+    A class to represent a factorization of a matrix, computed once and
+    reused to solve systems with any number of right-hand sides.
+
+    Methods:
+    -------
+    `height -> int`, `width -> int`:
+        Properties returning the shape of the factored matrix.
+
+    `solve(b: Matrix) -> Matrix`:
+        Solves A x = b for every column of `b`.
+
+    `det() -> float`:
+        Returns the determinant of the factored matrix.
+
+    `inverse() -> Matrix`:
+        Returns the inverse of the factored matrix.
+    """
+
+    def __init__(self, height: int, width: int) -> None:
+        """
+        Initializes a decomposition of a matrix of the given shape.
+        """
+
+        self.height = height
+        self.width = width
+
+    def solve(self, b: Matrix) -> Matrix:
+        """
+        Solves A x = b, where A is the factored matrix, for every column of
+        `b`. A row vector is solved as a column and returned as a row again.
+        The result has the type of `b`.
+
+        Raises:
+        ValueError: If `b` doesn't have as many rows as A, or A is singular.
+        """
+
+        row = isinstance(b, Vector) and b.height == 1 != b.width
+        if row and b.width == self.height:
+            columns = [list(b._storage.row(0))]
+        elif not row and b.height == self.height:
+            columns = list(map(list, b._storage.columns()))
+        else:
+            raise ValueError("Matrix and right-hand side are incompatible.")
+
+        solutions = [self._solve_column(column) for column in columns]
+
+        if row:
+            storage = MatrixStorage.from_iterable(solutions[0], 1, self.width)
+        else:
+            storage = MatrixStorage.from_iterable(
+                chain.from_iterable(zip(*solutions)),
+                self.width,
+                len(solutions),
+            )
+
+        return type(b)._from_storage(storage)
+
+    def inverse(self) -> Matrix:
+        """
+        Returns the inverse of the factored matrix.
+
+        Raises:
+        ValueError: If the matrix is not square or is singular.
+        """
+
+        self._check_square()
+
+        identity = MatrixStorage.zeros(self.height, self.height)
+        for i in range(self.height):
+            identity.data[i * (self.height + 1)] = 1.0
+
+        return self.solve(Matrix._from_storage(identity))
+
+    @abstractmethod
+    def det(self) -> float:
+        """
+        Returns the determinant of the factored matrix.
+        """
+
+    @abstractmethod
+    def _solve_column(self, column: List[float]) -> List[float]:
+        """
+        Solves A x = column, possibly overwriting `column`.
+        """
+
+    def _check_square(self) -> None:
+        if self.height != self.width:
+            raise ValueError("Matrix must be square.")
+
+
+class LUDecomposition(Decomposition):
+    """
+    LU decomposition with partial pivoting: P A = L U, with L unit lower
+    triangular and U upper triangular. A zero pivot makes the matrix
+    singular: the decomposition still exists and its determinant is 0, but
+    solving raises ValueError.
+
+    Methods:
+    -------
+    `lower -> Matrix`, `upper -> Matrix`:
+        Properties returning the factors L and U.
+
+    `permutation -> List[int]`:
+        Property returning the row of A that each row of L U comes from.
+    """
+
+    def __init__(self, matrix: Matrix, backend: Optional[str] = None) -> None:
+        """
+        Factors a square matrix, one panel of `BLOCK_SIZE` columns at a
+        time: each panel is factored with row swaps, the rows to its right
+        are solved against its unit lower triangle, and the trailing
+        submatrix is updated with a single matrix product.
+
+        Raises:
+        ValueError: If the matrix is not square.
+        """
+
+        super().__init__(matrix.height, matrix.width)
+        self._check_square()
+
+        n = self.height
+        data = array("d", matrix._storage.values())
+        work = MatrixStorage.from_buffer(data, n, n)
+        self._permutation = list(range(n))
+        self._sign = 1.0
+        self._singular = False
+
+        for start in range(0, n, BLOCK_SIZE):
+            size = min(BLOCK_SIZE, n - start)
+            panel = work.block(start, start, n - start, size)
+            rows = panel.tolist()
+
+            for i, j in self._factor_panel(rows, start):
+                first, second = slice(i * n, i * n + n), slice(
+                    j * n, j * n + n
+                )
+                data[first], data[second] = data[second], data[first]
+            panel.assign(chain.from_iterable(rows))
+
+            if start + size == n:
+                break
+
+            # U12 = L11^-1 A12, then A22 -= L21 U12.
+            right = work.block(start, start + size, size, n - start - size)
+            lower = [row[:i] for i, row in enumerate(rows[:size])]
+            columns = list(map(list, right.columns()))
+            for column in columns:
+                _solve_lower(lower, None, column)
+            right.transposed().assign(chain.from_iterable(columns))
+
+            trailing = work.block(
+                start + size, start + size, n - start - size, n - start - size
+            )
+            product = get_backend(backend).matmul(
+                work.block(start + size, start, n - start - size, size),
+                right,
+                None,
+            )
+            get_backend(backend).subtract(trailing, product, trailing)
+
+        self._factors = work
+        rows = work.tolist()
+        self._lower = [row[:i] for i, row in enumerate(rows)]
+        self._upper = [row[i + 1 :] for i, row in enumerate(rows)]
+        self._diagonal = [row[i] for i, row in enumerate(rows)]
+
+    def _factor_panel(
+        self, rows: List[List[float]], start: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Factors the rows of a panel in place with partial pivoting, and
+        returns the row swaps made, in rows of the whole matrix.
+        """
+
+        swaps = []
+
+        for j in range(len(rows[0])):
+            pivot_row = max(range(j, len(rows)), key=lambda i: abs(rows[i][j]))
+
+            if pivot_row != j:
+                rows[j], rows[pivot_row] = rows[pivot_row], rows[j]
+                swaps.append((start + j, start + pivot_row))
+                p = self._permutation
+                p[start + j], p[start + pivot_row] = (
+                    p[start + pivot_row],
+                    p[start + j],
+                )
+                self._sign = -self._sign
+
+            pivot = rows[j][j]
+            if pivot == 0:
+                self._singular = True
+                continue
+
+            tail = rows[j][j + 1 :]
+            for row in rows[j + 1 :]:
+                factor = row[j] = row[j] / pivot
+                if factor:
+                    row[j + 1 :] = [
+                        x - factor * y for x, y in zip(row[j + 1 :], tail)
+                    ]
+
+        return swaps
+
+    @property
+    def lower(self) -> Matrix:
+        """
+        The unit lower triangular factor L.
+        """
+
+        return _triangle(self._factors, lower=True, unit=True)
+
+    @property
+    def upper(self) -> Matrix:
+        """
+        The upper triangular factor U.
+        """
+
+        return _triangle(self._factors, lower=False, unit=False)
+
+    @property
+    def permutation(self) -> List[int]:
+        """
+        The row of A that each row of L U comes from.
+        """
+
+        return list(self._permutation)
+
+    def det(self) -> float:
+        return self._sign * prod(self._diagonal)
+
+    def _solve_column(self, column: List[float]) -> List[float]:
+        if self._singular:
+            raise ValueError("Matrix is singular.")
+
+        x = [column[i] for i in self._permutation]
+        _solve_lower(self._lower, None, x)
+        _solve_upper(self._upper, self._diagonal, x)
+
+        return x
+
+
+class CholeskyDecomposition(Decomposition):
+    """
+    Cholesky decomposition of a symmetric positive definite matrix:
+    A = L L^T, with L lower triangular. Only the lower triangle of A is
+    read. It takes half the work of LU and needs no pivoting.
+
+    Methods:
+    -------
+    `lower -> Matrix`:
+        Property returning the factor L.
+    """
+
+    def __init__(self, matrix: Matrix, backend: Optional[str] = None) -> None:
+        """
+        Factors a matrix one diagonal block of `BLOCK_SIZE` rows at a time:
+        the block is factored, the rows below it are solved against it, and
+        the trailing submatrix is updated with a single matrix product.
+
+        Raises:
+        ValueError: If the matrix is not square or not positive definite.
+        """
+
+        super().__init__(matrix.height, matrix.width)
+        self._check_square()
+
+        n = self.height
+        data = array("d", matrix._storage.values())
+        work = MatrixStorage.from_buffer(data, n, n)
+
+        for start in range(0, n, BLOCK_SIZE):
+            size = min(BLOCK_SIZE, n - start)
+            diagonal = work.block(start, start, size, size)
+            block = _cholesky(diagonal.tolist())
+            diagonal.assign(chain.from_iterable(block))
+
+            if start + size == n:
+                break
+
+            # L21 = A21 L11^-T, then A22 -= L21 L21^T.
+            below = work.block(start + size, start, n - start - size, size)
+            lower = [row[:i] for i, row in enumerate(block)]
+            pivots = [row[i] for i, row in enumerate(block)]
+            rows = below.tolist()
+            for row in rows:
+                _solve_lower(lower, pivots, row)
+            below.assign(chain.from_iterable(rows))
+
+            trailing = work.block(
+                start + size, start + size, n - start - size, n - start - size
+            )
+            product = get_backend(backend).matmul(
+                below, below.transposed(), None
+            )
+            get_backend(backend).subtract(trailing, product, trailing)
+
+        # The strict upper triangle still holds what was there in A.
+        for i in range(n - 1):
+            data[i * n + i + 1 : i * n + n] = array(
+                "d", bytes(8 * (n - i - 1))
+            )
+
+        self._factors = work
+        rows = work.tolist()
+        columns = work.transposed().tolist()
+        self._lower = [row[:i] for i, row in enumerate(rows)]
+        self._upper = [column[i + 1 :] for i, column in enumerate(columns)]
+        self._diagonal = [row[i] for i, row in enumerate(rows)]
+
+    @property
+    def lower(self) -> Matrix:
+        """
+        The lower triangular factor L.
+        """
+
+        return _triangle(self._factors, lower=True, unit=False)
+
+    def det(self) -> float:
+        return prod(self._diagonal) ** 2
+
+    def _solve_column(self, column: List[float]) -> List[float]:
+        _solve_lower(self._lower, self._diagonal, column)
+        _solve_upper(self._upper, self._diagonal, column)
+
+        return column
+
+
+class QRDecomposition(Decomposition):
+    """
+    QR decomposition of a matrix with at least as many rows as columns:
+    A = Q R, with Q having orthonormal columns and R upper triangular. For
+    a tall matrix `solve` returns the least-squares solution.
+
+    Methods:
+    -------
+    `q -> Matrix`, `r -> Matrix`:
+        Properties returning the reduced factors Q and R.
+    """
+
+    def __init__(self, matrix: Matrix, backend: Optional[str] = None) -> None:
+        """
+        Factors a matrix with Householder reflections, one panel of
+        `BLOCK_SIZE` columns at a time. The reflections of a panel are
+        accumulated into the compact form I - V T V^T, so that they are
+        applied to the remaining columns with three matrix products.
+
+        The work is done on the transpose of the matrix, so that columns,
+        which the reflections act on, are contiguous.
+
+        Raises:
+        ValueError: If the matrix has more columns than rows.
+        """
+
+        super().__init__(matrix.height, matrix.width)
+
+        if self.height < self.width:
+            raise ValueError(
+                "Matrix must have at least as many rows as columns."
+            )
+
+        m, n = self.height, self.width
+        work = MatrixStorage.from_iterable(
+            matrix._storage.transposed().values(), n, m
+        )
+        self._taus: List[float] = []
+
+        for start in range(0, n, BLOCK_SIZE):
+            size = min(BLOCK_SIZE, n - start)
+            panel = work.block(start, start, size, m - start)
+            columns = panel.tolist()
+            reflectors, taus = _householder(columns)
+            panel.assign(chain.from_iterable(columns))
+            self._taus.extend(taus)
+
+            if start + size == n:
+                break
+
+            # A22 -= V T^T V^T A22, here on the transpose of A22.
+            v = MatrixStorage.from_iterable(
+                chain.from_iterable(reflectors), size, m - start
+            )
+            t = MatrixStorage.from_iterable(
+                chain.from_iterable(_compact_factor(reflectors, taus)),
+                size,
+                size,
+            )
+            trailing = work.block(
+                start + size, start, n - start - size, m - start
+            )
+            projections = get_backend(backend).matmul(
+                trailing, v.transposed(), None
+            )
+            product = get_backend(backend).matmul(
+                get_backend(backend).matmul(projections, t, None), v, None
+            )
+            get_backend(backend).subtract(trailing, product, trailing)
+
+        self._factors = work
+        columns = work.tolist()
+        self._reflectors = [
+            [1.0] + column[k + 1 :] for k, column in enumerate(columns)
+        ]
+        self._upper = [
+            [column[i] for column in columns[i + 1 :]] for i in range(n)
+        ]
+        self._diagonal = [column[k] for k, column in enumerate(columns)]
+
+    @property
+    def q(self) -> Matrix:
+        """
+        The reduced factor Q, with orthonormal columns.
+        """
+
+        columns = []
+        for j in range(self.width):
+            column = [0.0] * self.height
+            column[j] = 1.0
+            columns.append(self._reflect(column, reversed(range(self.width))))
+
+        return Matrix._from_storage(
+            MatrixStorage.from_iterable(
+                chain.from_iterable(zip(*columns)), self.height, self.width
+            )
+        )
+
+    @property
+    def r(self) -> Matrix:
+        """
+        The upper triangular factor R.
+        """
+
+        return _triangle(
+            self._factors.transposed().block(0, 0, self.width, self.width),
+            lower=False,
+            unit=False,
+        )
+
+    def det(self) -> float:
+        self._check_square()
+
+        # Each reflection with a nonzero tau has determinant -1.
+        reflections = sum(1 for tau in self._taus if tau)
+        return (-1.0) ** reflections * prod(self._diagonal)
+
+    def _solve_column(self, column: List[float]) -> List[float]:
+        if 0 in self._diagonal:
+            raise ValueError("Matrix is singular.")
+
+        x = self._reflect(column, range(self.width))[: self.width]
+        _solve_upper(self._upper, self._diagonal, x)
+
+        return x
+
+    def _reflect(
+        self, column: List[float], order: Iterable[int]
+    ) -> List[float]:
+        """
+        Applies the reflections in the given order to a column, in place.
+        """
+
+        for k in order:
+            v, tau = self._reflectors[k], self._taus[k]
+            scale = tau * sumprod(v, column[k:])
+            if scale:
+                column[k:] = [x - scale * y for x, y in zip(column[k:], v)]
+
+        return column
+
+
+def _solve_lower(
+    lower: List[List[float]],
+    diagonal: Optional[List[float]],
+    x: List[float],
+) -> None:
+    """
+    Solves L y = x in place by forward substitution, where `lower[i]` holds
+    the elements of row i left of the diagonal. Without `diagonal`, L has a
+    unit diagonal.
+    """
+
+    for i, row in enumerate(lower):
+        value = x[i] - sumprod(row, x[:i])
+        x[i] = value if diagonal is None else value / diagonal[i]
+
+
+def _solve_upper(
+    upper: List[List[float]], diagonal: List[float], x: List[float]
+) -> None:
+    """
+    Solves U y = x in place by back substitution, where `upper[i]` holds
+    the elements of row i right of the diagonal.
+    """
+
+    for i in reversed(range(len(upper))):
+        x[i] = (x[i] - sumprod(upper[i], x[i + 1 :])) / diagonal[i]
+
+
+def _cholesky(rows: List[List[float]]) -> List[List[float]]:
+    """
+    Returns the Cholesky factor of a small matrix given by its rows.
+
+    Raises:
+    ValueError: If the matrix is not positive definite.
+    """
+
+    n = len(rows)
+    lower = [[0.0] * n for _ in range(n)]
+
+    for j in range(n):
+        pivot = rows[j][j] - sumprod(lower[j][:j], lower[j][:j])
+        if not pivot > 0:
+            raise ValueError("Matrix is not positive definite.")
+
+        lower[j][j] = root = sqrt(pivot)
+        for i in range(j + 1, n):
+            lower[i][j] = (
+                rows[i][j] - sumprod(lower[i][:j], lower[j][:j])
+            ) / root
+
+    return lower
+
+
+def _householder(
+    columns: List[List[float]],
+) -> Tuple[List[List[float]], List[float]]:
+    """
+    Triangularizes a panel, given by its columns, with Householder
+    reflections H = I - tau v v^T, in place. Above and on the diagonal the
+    columns end up holding R; below it, the reflectors without their
+    leading 1.
+
+    Returns:
+        The reflectors padded with zeros to the height of the panel, and
+        their taus.
+    """
+
+    reflectors: List[List[float]] = []
+    taus: List[float] = []
+
+    for j, column in enumerate(columns):
+        alpha = column[j]
+
+        if not any(column[j + 1 :]):
+            # Already triangular: the reflection is the identity.
+            v, tau = [1.0] + [0.0] * (len(column) - j - 1), 0.0
+        else:
+            beta = -copysign(hypot(*column[j:]), alpha)
+            v = [1.0] + [x / (alpha - beta) for x in column[j + 1 :]]
+            tau = (beta - alpha) / beta
+            column[j:] = [beta] + v[1:]
+
+        for other in columns[j + 1 :]:
+            scale = tau * sumprod(v, other[j:])
+            if scale:
+                other[j:] = [x - scale * y for x, y in zip(other[j:], v)]
+
+        reflectors.append([0.0] * j + v)
+        taus.append(tau)
+
+    return reflectors, taus
+
+
+def _compact_factor(
+    reflectors: List[List[float]], taus: List[float]
+) -> List[List[float]]:
+    """
+    Returns the upper triangular T such that the product of the reflections
+    H_0 H_1 ... H_(k-1) is I - V T V^T, V having the reflectors as columns.
+    """
+
+    k = len(taus)
+    t = [[0.0] * k for _ in range(k)]
+
+    for j, (v, tau) in enumerate(zip(reflectors, taus)):
+        # T[:j, j] = -tau T[:j, :j] V[:, :j]^T v
+        products = [sumprod(reflectors[i], v) for i in range(j)]
+        for i in range(j):
+            t[i][j] = -tau * sumprod(t[i][i:j], products[i:j])
+        t[j][j] = tau
+
+    return t
+
+
+def _triangle(storage: MatrixStorage, lower: bool, unit: bool) -> Matrix:
+    """
+    Copies the lower or upper triangle of a square storage into a matrix,
+    with ones on the diagonal if `unit` is set.
+    """
+
+    rows = storage.tolist()
+
+    for i, row in enumerate(rows):
+        if lower:
+            row[i + 1 :] = repeat(0.0, len(row) - i - 1)
+        else:
+            row[:i] = repeat(0.0, i)
+        if unit:
+            row[i] = 1.0
+
+    return Matrix(rows)
@@ -0,0 +1,76 @@
+from itertools import chain, repeat
+from typing import Iterable, Sequence, Tuple, Union
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+# An operand of an elementwise operation: a storage or a scalar.
+Operand = Union[MatrixStorage, float]
+
+
+def broadcast_shape(operands: Sequence[Operand]) -> Tuple[int, int]:
+    """
+    Returns the shape of the result of an elementwise operation.
+
+    Scalars match any shape. Along each dimension the storages must either
+    agree or have size 1, in which case their single row or column is
+    repeated: a (1, k) row is added to every row of an (n, k) matrix, and an
+    (n, 1) column to every column.
+
+    Args:
+        operands: Storages and scalars, at least one of them a storage.
+
+    Returns:
+        The (height, width) of the result.
+
+    Raises:
+    ValueError: If the shapes of the storages are incompatible.
+    """
+
+    return combine_shapes(
+        (operand.height, operand.width)
+        for operand in operands
+        if isinstance(operand, MatrixStorage)
+    )
+
+
+def combine_shapes(shapes: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Returns the shape that the given (height, width) shapes broadcast to,
+    following the rules of `broadcast_shape`.
+    """
+
+    shapes = list(shapes)
+    height = max(shape[0] for shape in shapes)
+    width = max(shape[1] for shape in shapes)
+
+    for shape_height, shape_width in shapes:
+        if not (shape_height in (1, height) and shape_width in (1, width)):
+            raise ValueError("Matrices can't be broadcast together.")
+
+    return height, width
+
+
+def broadcast_values(
+    operand: Operand, height: int, width: int
+) -> Iterable[float]:
+    """
+    Lazily yields the elements of an operand broadcast to (height, width),
+    in row-major order. Repeated rows, columns and scalars are never
+    materialized.
+    """
+
+    if not isinstance(operand, MatrixStorage):
+        return repeat(operand, height * width)
+
+    if operand.height == height and operand.width == width:
+        return operand.values()
+
+    if operand.height == 1 and operand.width == 1:
+        return repeat(operand.data[operand.offset], height * width)
+
+    if operand.height == 1:
+        return chain.from_iterable(repeat(operand.row(0).tolist(), height))
+
+    return chain.from_iterable(
+        map(repeat, operand.column(0).tolist(), repeat(width))
+    )
@@ -0,0 +1,357 @@
+import operator
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from project.matrix_vector_operations.elementwise import combine_shapes
+from project.matrix_vector_operations.matrix_operations import Matrix
+
+# Operands accepted by the operators of an expression.
+LazyOperand = Union["Expression", Matrix, float]
+
+# Elementwise operators, by symbol. Their functions work alike on floats
+# and on NumPy arrays.
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+# A part of a fused elementwise expression: computes its value from the
+# arguments of the fused function.
+Kernel = Callable[[Tuple[Any, ...]], Any]
+
+
+class Expression(ABC):
+    """
+    A class to represent a matrix expression that is built now and computed
+    later. `Matrix.lazy()` starts one; its operators then build a tree
+    instead of computing intermediate matrices, and `evaluate()` runs it.
+
+    Evaluation fuses every connected group of elementwise operations into a
+    single pass of the backend's `elementwise`, and multiplies chains of
+    three or more matrices in the order that minimizes the number of scalar
+    multiplications (the classic matrix-chain dynamic program). Shapes are
+    checked as the tree is built, so intermediate results are never
+    validated again.
+
+    Methods:
+    -------
+    `height -> int`, `width -> int`:
+        Properties returning the shape of the result.
+
+    `__add__`, `__sub__`, `__truediv__` and their reflections:
+        Build elementwise operations with matrices, expressions or scalars.
+
+    `__mul__(other: LazyOperand) -> Expression`:
+        Builds a matrix product, or a multiplication by a scalar.
+
+    `multiply(other: LazyOperand) -> Expression`:
+        Builds an elementwise (Hadamard) product.
+
+    `evaluate(out: Optional[Matrix] = None, backend: Optional[str] = None) -> Matrix`:
+        Computes the expression.
+    """
+
+    def __init__(self, height: int, width: int) -> None:
+        """
+        Initializes an expression whose result has the given shape.
+        """
+
+        self.height = height
+        self.width = width
+
+    def __add__(self, other: LazyOperand) -> "Expression":
+        return Elementwise("+", self, other)
+
+    def __radd__(self, other: LazyOperand) -> "Expression":
+        return Elementwise("+", other, self)
+
+    def __sub__(self, other: LazyOperand) -> "Expression":
+        return Elementwise("-", self, other)
+
+    def __rsub__(self, other: LazyOperand) -> "Expression":
+        return Elementwise("-", other, self)
+
+    def __truediv__(self, other: LazyOperand) -> "Expression":
+        return Elementwise("/", self, other)
+
+    def __rtruediv__(self, other: LazyOperand) -> "Expression":
+        return Elementwise("/", other, self)
+
+    def multiply(self, other: LazyOperand) -> "Expression":
+        """
+        Builds the elementwise (Hadamard) product with `other`.
+        """
+
+        return Elementwise("*", self, other)
+
+    def __mul__(self, other: LazyOperand) -> "Expression":
+        """
+        Builds the matrix product with a matrix or an expression, or the
+        product with a scalar.
+        """
+
+        if isinstance(other, (int, float)):
+            return Elementwise("*", self, other)
+
+        return Product(self, _as_expression(other))
+
+    def __rmul__(self, other: LazyOperand) -> "Expression":
+        if isinstance(other, (int, float)):
+            return Elementwise("*", other, self)
+
+        return Product(_as_expression(other), self)
+
+    def evaluate(
+        self, out: Optional[Matrix] = None, backend: Optional[str] = None
+    ) -> Matrix:
+        """
+        Computes the expression. The result is written into `out` when it
+        is given (it may be one of the matrices in the expression) and a new
+        matrix is returned otherwise.
+        """
+
+        return self._evaluate(out, backend)
+
+    @abstractmethod
+    def _evaluate(
+        self, out: Optional[Matrix], backend: Optional[str]
+    ) -> Matrix:
+        """
+        Computes the expression, optionally into `out`.
+        """
+
+    def _value(self, backend: Optional[str]) -> Matrix:
+        """
+        Computes the expression as an operand of another one. The result may
+        be a matrix of the expression, and must not be written to.
+        """
+
+        return self._evaluate(None, backend)
+
+
+class Leaf(Expression):
+    """
+    A matrix taking part in an expression.
+    """
+
+    def __init__(self, matrix: Matrix) -> None:
+        super().__init__(matrix.height, matrix.width)
+        self.matrix = matrix
+
+    def _evaluate(
+        self, out: Optional[Matrix], backend: Optional[str]
+    ) -> Matrix:
+        return self.matrix.apply(_identity, out=out, backend=backend)
+
+    def _value(self, backend: Optional[str]) -> Matrix:
+        return self.matrix
+
+
+class Elementwise(Expression):
+    """
+    An elementwise operation on two operands, broadcasting rows and columns.
+    """
+
+    def __init__(
+        self, operator: str, left: LazyOperand, right: LazyOperand
+    ) -> None:
+        if operator not in OPERATORS:
+            raise ValueError(f"Unknown elementwise operator {operator!r}.")
+
+        self.operator = operator
+        self.left = _as_operand(left)
+        self.right = _as_operand(right)
+
+        height, width = combine_shapes(
+            (operand.height, operand.width)
+            for operand in (self.left, self.right)
+            if isinstance(operand, Expression)
+        )
+        super().__init__(height, width)
+
+    def _evaluate(
+        self, out: Optional[Matrix], backend: Optional[str]
+    ) -> Matrix:
+        fused = _FusedFunction()
+        kernel = fused.compile(self, backend)
+        function, matrices, rest = fused.build(kernel)
+
+        return matrices[0].apply(
+            function, *matrices[1:], *rest, out=out, backend=backend
+        )
+
+
+class Product(Expression):
+    """
+    A chain of matrix products, kept flat so that it can be reordered.
+    """
+
+    def __init__(self, left: Expression, right: Expression) -> None:
+        if left.width != right.height:
+            raise ValueError("Matrices can't be multiplied.")
+
+        super().__init__(left.height, right.width)
+        self.factors = _factors(left) + _factors(right)
+
+    def _evaluate(
+        self, out: Optional[Matrix], backend: Optional[str]
+    ) -> Matrix:
+        matrices = [factor._value(backend) for factor in self.factors]
+        splits = chain_order([(m.height, m.width) for m in matrices])
+
+        def multiply(i: int, j: int, target: Optional[Matrix]) -> Matrix:
+            if i == j:
+                return matrices[i]
+
+            k = splits[i][j]
+            return multiply(i, k, None).matmul(
+                multiply(k + 1, j, None), out=target, backend=backend
+            )
+
+        return multiply(0, len(matrices) - 1, out)
+
+
+def chain_order(shapes: List[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Finds the cheapest order to multiply a chain of matrices.
+
+    With cost[i][j] the least number of scalar multiplications to compute
+    the product of matrices i..j, cost[i][j] is the minimum over the split
+    points k of cost[i][k] + cost[k + 1][j] + rows(i) * cols(k) * cols(j).
+    Filling the table by increasing chain length takes O(n^3) for n
+    matrices, which is negligible next to any product worth reordering.
+
+    Args:
+        shapes: The (height, width) of every matrix, in order.
+
+    Returns:
+        The table of split points: the product of matrices i..j is best
+        computed as (i..k) * (k + 1..j) with k = splits[i][j].
+    """
+
+    n = len(shapes)
+    dims = [shapes[0][0]] + [width for _, width in shapes]
+    cost = [[0] * n for _ in range(n)]
+    splits = [[0] * n for _ in range(n)]
+
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            cost[i][j], splits[i][j] = min(
+                (
+                    cost[i][k]
+                    + cost[k + 1][j]
+                    + dims[i] * dims[k + 1] * dims[j + 1],
+                    k,
+                )
+                for k in range(i, j)
+            )
+
+    return splits
+
+
+class _FusedFunction:
+    """
+    Composes a tree of elementwise operations into a single function of the
+    leaves, so that the whole tree is one backend pass.
+    """
+
+    def __init__(self) -> None:
+        self.operands: List[Union[Matrix, float]] = []
+        self.positions: Dict[int, int] = {}
+
+    def compile(
+        self, node: Union[Expression, float], backend: Optional[str]
+    ) -> Kernel:
+        """
+        Returns the kernel of `node`, collecting its operands. Subtrees that
+        are not elementwise are evaluated.
+        """
+
+        if isinstance(node, Elementwise):
+            function = OPERATORS[node.operator]
+            left = self.compile(node.left, backend)
+            right = self.compile(node.right, backend)
+            return lambda arguments: function(
+                left(arguments), right(arguments)
+            )
+
+        if isinstance(node, Expression):
+            return self._argument(node._value(backend))
+
+        return self._argument(node)
+
+    def build(
+        self, kernel: Kernel
+    ) -> Tuple[Callable[..., Any], List[Matrix], List[float]]:
+        """
+        Turns the compiled kernel into a function whose arguments are the
+        matrix operands followed by the scalar ones.
+        """
+
+        matrices = [op for op in self.operands if isinstance(op, Matrix)]
+        scalars = [op for op in self.operands if not isinstance(op, Matrix)]
+
+        for position, operand in enumerate([*matrices, *scalars]):
+            self.positions[id(operand)] = position
+
+        def function(*arguments: Any) -> Any:
+            return kernel(arguments)
+
+        return function, matrices, scalars
+
+    def _argument(self, operand: Union[Matrix, float]) -> Kernel:
+        """
+        Returns the kernel reading an operand from the arguments,
+        registering the operand first. Its position is set by `build`.
+        """
+
+        key = id(operand)
+        if key not in self.positions:
+            self.positions[key] = len(self.operands)
+            self.operands.append(operand)
+
+        positions = self.positions
+        return lambda arguments: arguments[positions[key]]
+
+
+def _as_expression(value: Union[Expression, Matrix]) -> Expression:
+    """
+    Wraps a matrix in a leaf, leaving expressions as they are.
+    """
+
+    if isinstance(value, Expression):
+        return value
+
+    if isinstance(value, Matrix):
+        return Leaf(value)
+
+    raise TypeError("Operand must be a matrix or an expression.")
+
+
+def _as_operand(value: LazyOperand) -> Union[Expression, float]:
+    """
+    Wraps a matrix in a leaf, leaving expressions and scalars as they are.
+    """
+
+    if isinstance(value, (int, float)):
+        return value
+
+    return _as_expression(value)
+
+
+def _factors(expression: Expression) -> List[Expression]:
+    """
+    Returns the factors of a product, or the expression itself.
+    """
+
+    if isinstance(expression, Product):
+        return expression.factors
+
+    return [expression]
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -0,0 +1,102 @@
+from array import array
+from math import sumprod
+from itertools import chain, starmap, product
+from typing import Optional
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+
+def naive_matmul(
+    a: MatrixStorage, b: MatrixStorage, out: Optional[MatrixStorage] = None
+) -> MatrixStorage:
+    """
+    Multiplies two storages by taking the dot product of every row of `a`
+    with every column of `b`.
+
+    Args:
+        a: Left operand of shape (n, m).
+        b: Right operand of shape (m, k).
+        out: Optional storage of shape (n, k) to write the result into. It
+            may share its buffer with `a` or `b`.
+
+    Returns:
+        `out`, or a new contiguous storage of shape (n, k).
+    """
+
+    # Unpacking the views into lists once is much cheaper than letting
+    # `sumprod` box every double again for each pair of row and column.
+    columns = [column.tolist() for column in b.columns()]
+    rows = map(memoryview.tolist, a.rows())
+
+    values = chain.from_iterable(
+        starmap(sumprod, product((row,), columns)) for row in rows
+    )
+
+    if out is None:
+        return MatrixStorage.from_iterable(values, a.height, b.width)
+
+    out.assign(values)
+    return out
+
+
+def tiled_matmul(
+    a: MatrixStorage,
+    b: MatrixStorage,
+    tile_size: int,
+    out: Optional[MatrixStorage] = None,
+) -> MatrixStorage:
+    """
+    Multiplies two storages block by block.
+
+    The result is computed in `tile_size` x `tile_size` blocks. For each block
+    only `tile_size` rows of `a` and `tile_size` columns of `b` are unpacked,
+    so the working set stays bounded however large the operands are, and
+    every unpacked row is reused across all column tiles. The shared
+    dimension is not split: a whole row-by-column `sumprod` is a single C
+    call, and cutting it would only add interpreter overhead.
+
+    Args:
+        a: Left operand of shape (n, m).
+        b: Right operand of shape (m, k).
+        tile_size: The edge of a square tile of the result.
+        out: Optional storage of shape (n, k) to write the result into. It
+            may share its buffer with `a` or `b`.
+
+    Returns:
+        `out`, or a new contiguous storage of shape (n, k).
+
+    Raises:
+    ValueError: If `tile_size` is not positive.
+    """
+
+    if tile_size <= 0:
+        raise ValueError("Tile size must be positive.")
+
+    if out is not None and (
+        not out.is_contiguous or out.shares_buffer(a) or out.shares_buffer(b)
+    ):
+        # Blocks are written as soon as they are ready, so compute aside.
+        out.assign(tiled_matmul(a, b, tile_size).values())
+        return out
+
+    if out is None:
+        out = MatrixStorage.zeros(a.height, b.width)
+
+    for i0 in range(0, a.height, tile_size):
+        rows = [
+            a.row(i).tolist() for i in range(i0, min(i0 + tile_size, a.height))
+        ]
+
+        for j0 in range(0, b.width, tile_size):
+            columns = [
+                b.column(j).tolist()
+                for j in range(j0, min(j0 + tile_size, b.width))
+            ]
+
+            for i, row in enumerate(rows, i0):
+                start = out.offset + i * out.row_stride + j0
+                out.data[start : start + len(columns)] = array(
+                    "d", starmap(sumprod, product((row,), columns))
+                )
+
+    return out
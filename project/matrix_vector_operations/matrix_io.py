@@ -0,0 +1,155 @@
+import mmap as _mmap
+import os
+import sys
+import tempfile
+from array import array
+from struct import Struct
+from typing import IO, Optional, Tuple, TypeAlias, Union
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+Path: TypeAlias = Union[str, "os.PathLike[str]"]
+
+# Magic, format version, dtype (an `array` type code), height and width,
+# padded to 32 bytes so that the data that follows stays 8-byte aligned.
+HEADER = Struct("<6sBcQQ4x")
+MAGIC = b"MATRIX"
+VERSION = 1
+
+# The data is always stored little-endian.
+_NATIVE = sys.byteorder == "little"
+
+# The process's file mode creation mask, which can only be read by setting
+# it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def save_storage(storage: MatrixStorage, path: Path) -> None:
+    """
+    Writes a storage to `path` in the binary matrix format: a fixed-size
+    header with the shape and the dtype, followed by the elements as raw
+    little-endian doubles in row-major order.
+
+    Args:
+        storage: The storage to write. Strided views are written row by row.
+        path: The file to create or overwrite.
+    """
+
+    # Write aside and swap the file in, so that matrices still mapping the
+    # old contents keep reading them instead of faulting on a truncated file.
+    # Every save gets its own temporary file, so concurrent saves to the
+    # same path don't write into each other's.
+    directory = os.path.dirname(os.fspath(path)) or os.curdir
+    file = tempfile.NamedTemporaryFile(
+        "wb", dir=directory, prefix=".matrix-", delete=False
+    )
+
+    try:
+        with file:
+            file.write(pack_header(storage.height, storage.width))
+
+            if storage.is_contiguous and _NATIVE:
+                start = storage.offset
+                size = storage.height * storage.width
+                file.write(storage.data[start : start + size])
+            else:
+                for row in storage.rows():
+                    write_values(file, array("d", row))
+
+        # Temporary files are private: give the file the usual permissions.
+        os.chmod(file.name, 0o666 & ~_UMASK)
+        os.replace(file.name, path)
+    except BaseException:
+        os.unlink(file.name)
+        raise
+
+
+def pack_header(height: int, width: int) -> bytes:
+    """
+    Returns the header of a binary matrix file of the given shape.
+    """
+
+    return HEADER.pack(MAGIC, VERSION, b"d", height, width)
+
+
+def write_values(file: IO[bytes], values: "array[float]") -> None:
+    """
+    Appends doubles to a binary matrix file in its little-endian byte order.
+    `values` is swapped in place on big-endian machines.
+    """
+
+    if not _NATIVE:
+        values.byteswap()
+    file.write(values)
+
+
+def load_storage(
+    path: Path, mmap: bool = True, rows: Optional[slice] = None
+) -> MatrixStorage:
+    """
+    Reads a storage written by `save_storage`.
+
+    With `mmap` the file is memory-mapped read-only: loading takes constant
+    time whatever the size of the matrix, and pages are read from disk only
+    when their elements are first accessed. Otherwise only the requested
+    rows are read into memory.
+
+    Args:
+        path: The file to read.
+        mmap: Whether to map the file instead of reading it.
+        rows: Optional slice (with step 1) of the rows to load.
+
+    Returns:
+        A storage over the mapped file, which is read-only, or a new
+        contiguous storage.
+
+    Raises:
+    ValueError: If the file is not in the binary matrix format, or `rows`
+        selects no rows or has a step other than 1.
+    """
+
+    with open(path, "rb") as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path!r} is not a binary matrix file.")
+
+        magic, version, dtype, height, width = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or dtype != b"d":
+            raise ValueError(f"{path!r} is not a binary matrix file.")
+
+        start, stop = _row_range(rows, height)
+        first = HEADER.size + 8 * start * width
+        size = 8 * (stop - start) * width
+
+        file.seek(0, 2)
+        if file.tell() != HEADER.size + 8 * height * width:
+            raise ValueError(f"{path!r} is truncated or corrupted.")
+
+        if mmap and _NATIVE:
+            mapping = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+            buffer = memoryview(mapping)[first : first + size]
+            return MatrixStorage.from_buffer(buffer, stop - start, width)
+
+        file.seek(first)
+        values = array("d", bytes(size))
+        file.readinto(values)
+        if not _NATIVE:
+            values.byteswap()
+
+        return MatrixStorage.from_buffer(values, stop - start, width)
+
+
+def _row_range(rows: Optional[slice], height: int) -> Tuple[int, int]:
+    """
+    Resolves a slice of rows against the height of the matrix.
+    """
+
+    if rows is None:
+        return 0, height
+
+    start, stop, step = rows.indices(height)
+    if step != 1 or start >= stop:
+        raise ValueError("Rows must be a non-empty slice with step 1.")
+
+    return start, stop
@@ -1,6 +1,41 @@
-from typing import List
-from math import sumprod
-from itertools import batched, starmap, product
+import operator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Union,
+)
+from itertools import chain
+from collections.abc import Buffer
+
+from project.matrix_vector_operations.matrix_storage import (
+    FloatView,
+    MatrixStorage,
+)
+from project.matrix_vector_operations.elementwise import broadcast_shape
+from project.matrix_vector_operations.matrix_io import (
+    Path,
+    load_storage,
+    save_storage,
+)
+from project.matrix_vector_operations.backends import (
+    get_backend,
+    storage_from_numpy,
+    storage_to_numpy,
+)
+from project.matrix_vector_operations.strassen import strassen_matmul
+
+if TYPE_CHECKING:
+    from project.matrix_vector_operations.decompositions import (
+        CholeskyDecomposition,
+        LUDecomposition,
+        QRDecomposition,
+    )
+    from project.matrix_vector_operations.lazy import Expression
 
 
 class Matrix:
@@ -8,19 +43,110 @@ class Matrix:
     A class to represent a mathematical matrix and perform operations such as
     addition, multiplication, and transposition.
 
+    The elements are kept in a contiguous `MatrixStorage` (a flat buffer of
+    doubles in row-major order) rather than in a list of lists. Operations
+    are carried out by a backend (see `backends`): NumPy when it is
+    installed, pure Python otherwise. The methods taking a `backend` name
+    override that choice for a single call.
+
     Methods:
     -------
+    `from_buffer(buffer: Buffer, height: int, width: int, offset: int = 0) -> "Matrix"`:
+        Class method to build a matrix over a flat buffer without copying it.
+
+    `from_numpy(array: Any) -> "Matrix"`:
+        Class method to build a matrix from a 2D NumPy array.
+
+    `to_list() -> List[List[float]]`:
+        Returns the elements of the matrix as a list of lists.
+
+    `to_numpy() -> Any`:
+        Returns a NumPy array sharing the matrix's buffer.
+
+    `lazy() -> "Expression"`:
+        Starts a lazy expression evaluated with fusion and reordering.
+
+    `save(path: Path) -> None`:
+        Writes the matrix to a binary file.
+
+    `load(path: Path, mmap: bool = True, rows: Optional[slice] = None) -> "Matrix"`:
+        Class method to read a matrix, or some of its rows, from a binary file.
+
+    `rows() -> Iterator[FloatView]`, `columns() -> Iterator[FloatView]`:
+        Lazily iterate over read-only views of the rows or columns.
+
     `transpose() -> "Matrix"`:
-        Returns the transpose of the matrix.
+        Returns a transposed view of the matrix in O(1).
+
+    `__iadd__(other: Operand) -> "Matrix"`, `__isub__(other: Operand) -> "Matrix"`:
+        Perform in-place addition and subtraction.
+
+    `__imul__(other: float) -> "Matrix"`, `__itruediv__(other: Operand) -> "Matrix"`:
+        Perform in-place multiplication by a scalar and elementwise division.
+
+    `add_scaled(alpha: float, other: "Matrix") -> "Matrix"`:
+        Performs in-place self += alpha * other in a single pass.
+
+    `__add__(other: Operand) -> "Matrix"`, `__sub__(other: Operand) -> "Matrix"`:
+        Perform addition and subtraction and return a new matrix.
+
+    `add(other: Operand, out: Optional["Matrix"] = None, backend: Optional[str] = None) -> "Matrix"`:
+        Performs addition, optionally into a preallocated matrix.
+
+    `subtract(other: Operand, out: Optional["Matrix"] = None, backend: Optional[str] = None) -> "Matrix"`:
+        Performs subtraction, optionally into a preallocated matrix.
+
+    `multiply(other: Operand, out: Optional["Matrix"] = None, backend: Optional[str] = None) -> "Matrix"`:
+        Performs elementwise (Hadamard) or scalar multiplication.
+
+    `divide(other: Operand, out: Optional["Matrix"] = None, backend: Optional[str] = None) -> "Matrix"`:
+        Performs elementwise or scalar division.
+
+    `apply(function: Callable[..., float], *others: Operand, out: Optional["Matrix"] = None, backend: Optional[str] = None) -> "Matrix"`:
+        Evaluates an elementwise expression of several operands in one pass.
 
-    `__iadd__(other: "Matrix") -> "Matrix"`:
-        Performs in-place matrix addition.
+    `__mul__(other: Operand) -> "Matrix"`:
+        Performs matrix multiplication, or multiplication by a scalar.
 
-    `__add__(other: "Matrix") -> "Matrix"`:
-        Performs matrix addition and returns a new matrix.
+    `__truediv__(other: Operand) -> "Matrix"`:
+        Performs elementwise or scalar division and returns a new matrix.
 
-    `__mul__(other: "Matrix") -> "Matrix"`:
-        Performs matrix multiplication and returns a new matrix.
+    `__rsub__(other: float) -> "Matrix"`, `__rtruediv__(other: float) -> "Matrix"`:
+        Subtract the matrix from a scalar or divide a scalar by it.
+
+    `matmul(other: "Matrix", tile_size: Optional[int] = None, out: Optional["Matrix"] = None, workers: int = 1, backend: Optional[str] = None, algorithm: str = "standard") -> "Matrix"`:
+        Performs matrix multiplication with an explicit choice of kernel,
+        optionally in several processes or into a preallocated matrix.
+
+    `lu(backend: Optional[str] = None) -> "LUDecomposition"`:
+        Computes the LU decomposition with partial pivoting.
+
+    `qr(backend: Optional[str] = None) -> "QRDecomposition"`:
+        Computes the QR decomposition.
+
+    `cholesky(backend: Optional[str] = None) -> "CholeskyDecomposition"`:
+        Computes the Cholesky decomposition.
+
+    `solve(b: "Matrix", backend: Optional[str] = None) -> "Matrix"`:
+        Solves the linear system self * x = b.
+
+    `det(backend: Optional[str] = None) -> float`:
+        Returns the determinant of the matrix.
+
+    `inverse(backend: Optional[str] = None) -> "Matrix"`:
+        Returns the inverse of the matrix.
+
+    `matrix_power(exponent: int, backend: Optional[str] = None) -> "Matrix"`, `__pow__(exponent: int) -> "Matrix"`:
+        Raise a square matrix to an integer power by repeated squaring.
+
+    `apply_power(other: "Matrix", exponent: int, backend: Optional[str] = None) -> "Matrix"`:
+        Computes self^exponent * other, with repeated products when cheaper.
+
+    `__getitem__(index: tuple[int, int]) -> float`:
+        Returns the element at the given (row, column) position.
+
+    `__setitem__(index: tuple[int, int], value: float) -> None`:
+        Sets the element at the given (row, column) position.
 
     `_has_same_dimension(other: "Matrix") -> bool`:
         Checks if two matrices have the same dimensions.
@@ -33,8 +159,24 @@ class Matrix:
 
     `__str__() -> str`:
         Returns a string representation of the matrix.
+
+    Operands of the elementwise operations (`Operand`) are matrices or
+    scalars. Matrices are broadcast: a single row or column is repeated
+    along the other dimension to match the shape of the other operands.
     """
 
+    # Edge of the result blocks computed by the tiled multiplication kernel.
+    TILE_SIZE = 64
+    # Products where some dimension reaches this size use the tiled kernel.
+    TILED_MATMUL_THRESHOLD = 256
+    # Strassen multiplication recurses until some dimension is this small.
+    # On the pure-Python backend an addition costs several times more per
+    # element than a multiply-add inside `sumprod`, so recursion only pays
+    # off for blocks above a few hundred rows (see the benchmark script).
+    STRASSEN_CUTOFF = 256
+
+    _storage: MatrixStorage
+
     def __init__(self, list_of_lists: List[List[float]]) -> None:
         """
         Initializes a Matrix object.
@@ -43,75 +185,758 @@ class Matrix:
         if not Matrix.is_matrix(list_of_lists):
             raise TypeError("Input must be a valid matrix.")
 
-        self._matrix = list_of_lists
+        self._storage = MatrixStorage.from_iterable(
+            chain.from_iterable(list_of_lists),
+            len(list_of_lists),
+            len(list_of_lists[0]),
+        )
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: Buffer, height: int, width: int, offset: int = 0
+    ) -> "Matrix":
+        """
+        Builds a matrix over a flat buffer of row-major doubles (for example
+        an `array('d')`) without copying it. Writes to the matrix go to the
+        buffer, even while a transposed view of the matrix is alive: the view
+        is then moved to a copy, keeping the elements it had. Writes to such
+        a view never reach the buffer. `offset` is counted in elements.
+        """
+
+        return cls._from_storage(
+            MatrixStorage.from_buffer(buffer, height, width, offset)
+        )
+
+    @classmethod
+    def from_numpy(cls, array: Any) -> "Matrix":
+        """
+        Builds a matrix from a 2D NumPy array. The array's buffer is shared
+        when it holds C-contiguous float64 values, otherwise it is copied.
+        """
+
+        return cls._from_storage(storage_from_numpy(array))
+
+    @classmethod
+    def _from_storage(cls, storage: MatrixStorage) -> Self:
+        """
+        Wraps an existing storage, skipping the validation done by __init__.
+        """
+
+        matrix = cls.__new__(cls)
+        matrix._storage = storage
+
+        return matrix
+
+    @property
+    def height(self) -> int:
+        """
+        The number of rows.
+        """
+
+        return self._storage.height
+
+    @property
+    def width(self) -> int:
+        """
+        The number of columns.
+        """
+
+        return self._storage.width
+
+    def to_list(self) -> List[List[float]]:
+        """
+        Returns the elements of the matrix as a list of lists.
+        """
+
+        return self._storage.tolist()
+
+    def to_numpy(self) -> Any:
+        """
+        Returns a 2D NumPy array sharing the matrix's buffer, so writes to
+        either are visible in both.
+        """
+
+        return storage_to_numpy(self._storage)
+
+    def lazy(self) -> "Expression":
+        """
+        Starts a lazy expression (see `lazy`): operators on the result build
+        an expression tree, and `evaluate()` computes it with fused
+        elementwise passes and reordered chains of products.
+        """
+
+        # Imported here: expressions are built on top of this module.
+        from project.matrix_vector_operations.lazy import Leaf
+
+        return Leaf(self)
+
+    def save(self, path: Path) -> None:
+        """
+        Writes the matrix to `path` in the binary matrix format (see
+        `matrix_io`): a header with the shape and dtype, then the raw
+        row-major data.
+        """
+
+        save_storage(self._storage, path)
 
-        self.height = len(self._matrix)
-        self.width = len(self._matrix[0])
+    @classmethod
+    def load(
+        cls, path: Path, mmap: bool = True, rows: Optional[slice] = None
+    ) -> "Matrix":
+        """
+        Reads a matrix saved with `save`. With `mmap` the file is mapped
+        read-only, which takes constant time and pages the data in lazily;
+        the first write to the matrix copies it into memory. `rows` loads a
+        slice of the rows only.
+        """
+
+        return cls._from_storage(load_storage(path, mmap, rows))
+
+    def rows(self) -> Iterator[FloatView]:
+        """
+        Lazily iterates over read-only views of the rows, without copying.
+        """
+
+        return map(memoryview.toreadonly, self._storage.rows())
+
+    def columns(self) -> Iterator[FloatView]:
+        """
+        Lazily iterates over read-only views of the columns, without copying.
+        """
+
+        return map(memoryview.toreadonly, self._storage.columns())
 
     def transpose(self) -> "Matrix":
         """
         Transposes the matrix (flips rows and columns).
+
+        This is O(1): the result is a view over the same buffer with the
+        strides swapped. Elements are copied only when either matrix is
+        written to afterwards (copy-on-write), so the two never observe each
+        other's changes.
         """
 
-        return Matrix(list(map(list, zip(*self._matrix))))
+        return Matrix._from_storage(self._storage.transposed())
 
-    def __iadd__(self, other: "Matrix") -> "Matrix":
+    def _writable_storage(self) -> MatrixStorage:
         """
-        Performs in-place matrix addition (self += other).
+        Returns the storage, first replacing it with a private copy if it is
+        shared with a view or backed by a read-only buffer. A storage over a
+        caller's buffer (see `from_buffer`) keeps it: its views are moved to
+        copies instead, so that writes still reach the buffer.
         """
 
-        if not self._has_same_dimension(other):
-            raise ValueError("Matrix 'other' has wrong dimension.")
+        storage = self._storage
 
-        # 1 way
-        self._matrix = [
-            [
-                self._matrix[i][j] + other._matrix[i][j]
-                for j in range(self.width)
-            ]
-            for i in range(self.height)
-        ]
+        if storage.data.readonly:
+            self._storage = get_backend().copy(storage)
+        elif storage.is_shared and storage.external:
+            for alias in list(storage.aliases or ()):
+                if alias is not storage:
+                    alias.detach()
+        elif storage.is_shared:
+            self._storage = get_backend().copy(storage)
+
+        return self._storage
+
+    def _output_storage(
+        self, out: Optional["Matrix"], height: int, width: int
+    ) -> Optional[MatrixStorage]:
+        """
+        Checks the shape of a preallocated result matrix and returns its
+        storage, ready to be written to.
+        """
+
+        if out is None:
+            return None
+
+        if out.height != height or out.width != width:
+            raise ValueError("Matrix 'out' has wrong dimension.")
+
+        return out._writable_storage()
+
+    def __iadd__(self, other: "Operand") -> "Matrix":
+        """
+        Performs in-place addition (self += other), writing into the
+        existing storage.
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.add(other, out=self)
+
+    def __isub__(self, other: "Operand") -> "Matrix":
+        """
+        Performs in-place subtraction (self -= other), writing into the
+        existing storage.
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.subtract(other, out=self)
+
+    def __imul__(self, other: Union[float, "Matrix"]) -> "Matrix":
+        """
+        Multiplies the matrix by a scalar in place (self *= alpha). With a
+        matrix operand, `*=` falls back to the matrix product.
+        """
+
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        storage = self._writable_storage()
+        get_backend().scale(storage, other, out=storage)
 
         return self
 
-    def __add__(self, other: "Matrix") -> "Matrix":
+    def __itruediv__(self, other: "Operand") -> "Matrix":
         """
-        Adds two matrices and returns a new matrix.
+        Performs in-place elementwise division (self /= other), writing into
+        the existing storage.
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.divide(other, out=self)
+
+    def add_scaled(self, alpha: float, other: "Matrix") -> "Matrix":
+        """
+        Performs self += alpha * other in place and in a single pass (the
+        BLAS `axpy` operation), without building alpha * other.
         """
 
         if not self._has_same_dimension(other):
             raise ValueError("Matrix 'other' has wrong dimension.")
 
-        # 2 way
-        return Matrix(
-            [
-                [a + b for a, b in zip(row_1, row_2)]
-                for row_1, row_2 in zip(self._matrix, other._matrix)
-            ]
-        )
+        storage = self._writable_storage()
+        get_backend().add_scaled(storage, alpha, other._storage, out=storage)
+
+        return self
+
+    def __add__(self, other: "Operand") -> "Matrix":
+        """
+        Adds a matrix or a scalar and returns a new matrix.
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.add(other)
+
+    def __radd__(self, other: float) -> "Matrix":
+        """
+        Adds the matrix to a scalar (alpha + self).
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.add(other)
+
+    def add(
+        self,
+        other: "Operand",
+        out: Optional["Matrix"] = None,
+        backend: Optional[str] = None,
+    ) -> "Matrix":
+        """
+        Adds a matrix or a scalar, broadcasting rows and columns. The result
+        is written into `out` when it is given (it may be one of the
+        operands) and a new matrix is returned otherwise.
+        """
+
+        if isinstance(other, Matrix) and self._has_same_dimension(other):
+            target = self._output_storage(out, self.height, self.width)
+            storage = get_backend(backend).add(
+                self._storage, other._storage, target
+            )
+            return out if out is not None else self._result(storage)
+
+        return self.apply(operator.add, other, out=out, backend=backend)
+
+    def __sub__(self, other: "Operand") -> "Matrix":
+        """
+        Subtracts a matrix or a scalar and returns a new matrix.
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.subtract(other)
+
+    def __rsub__(self, other: float) -> "Matrix":
+        """
+        Subtracts the matrix from a scalar (alpha - self).
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.apply(_reflected(operator.sub), other)
+
+    def subtract(
+        self,
+        other: "Operand",
+        out: Optional["Matrix"] = None,
+        backend: Optional[str] = None,
+    ) -> "Matrix":
+        """
+        Subtracts a matrix or a scalar, broadcasting rows and columns. The
+        result is written into `out` when it is given (it may be one of the
+        operands) and a new matrix is returned otherwise.
+        """
+
+        if isinstance(other, Matrix) and self._has_same_dimension(other):
+            target = self._output_storage(out, self.height, self.width)
+            storage = get_backend(backend).subtract(
+                self._storage, other._storage, target
+            )
+            return out if out is not None else self._result(storage)
+
+        return self.apply(operator.sub, other, out=out, backend=backend)
+
+    def multiply(
+        self,
+        other: "Operand",
+        out: Optional["Matrix"] = None,
+        backend: Optional[str] = None,
+    ) -> "Matrix":
+        """
+        Multiplies by a scalar, or elementwise by a matrix (the Hadamard
+        product), broadcasting rows and columns. The result is written into
+        `out` when it is given and a new matrix is returned otherwise.
+        """
+
+        if not isinstance(other, Matrix):
+            target = self._output_storage(out, self.height, self.width)
+            storage = get_backend(backend).scale(self._storage, other, target)
+            return out if out is not None else self._result(storage)
+
+        return self.apply(operator.mul, other, out=out, backend=backend)
+
+    def divide(
+        self,
+        other: "Operand",
+        out: Optional["Matrix"] = None,
+        backend: Optional[str] = None,
+    ) -> "Matrix":
+        """
+        Divides by a scalar, or elementwise by a matrix, broadcasting rows
+        and columns. The result is written into `out` when it is given and a
+        new matrix is returned otherwise.
+        """
+
+        return self.apply(operator.truediv, other, out=out, backend=backend)
+
+    def apply(
+        self,
+        function: Callable[..., Any],
+        *others: "Operand",
+        out: Optional["Matrix"] = None,
+        backend: Optional[str] = None,
+    ) -> "Matrix":
+        """
+        Evaluates `function(self, *others)` elementwise in a single pass,
+        after broadcasting the operands to a common shape.
+
+        A whole expression such as `a * b + c` evaluated as
+        `a.apply(lambda x, y, z: x * y + z, b, c)` reads every operand once
+        and writes every result once, without an intermediate matrix per
+        operator. `function` may be any function of numbers, on every
+        backend. The pure-Python backend calls it with floats, one element
+        at a time. The NumPy backend first calls it once with whole arrays,
+        which is much faster for functions made of arithmetic operators or
+        NumPy ufuncs, and if that raises TypeError or ValueError (as
+        `math.sqrt` or a function branching on its arguments do) it calls
+        it once per element instead.
+
+        Args:
+            function: The function of len(others) + 1 numbers to apply.
+            others: The other operands, matrices or scalars.
+            out: Optional matrix of the broadcast shape to write the result
+                into. It may be one of the operands.
+            backend: The name of the backend to use, or None for the current
+                one.
+
+        Returns:
+            `out`, or a new matrix of the broadcast shape.
+
+        Raises:
+        ValueError: If the shapes can't be broadcast together, or `out` has
+            another shape.
+        """
+
+        operands = [self._storage] + [
+            other._storage if isinstance(other, Matrix) else other
+            for other in others
+        ]
+        height, width = broadcast_shape(operands)
+
+        target = self._output_storage(out, height, width)
+        storage = get_backend(backend).elementwise(function, operands, target)
+
+        return out if out is not None else self._result(storage)
+
+    def __mul__(self, other: "Operand") -> "Matrix":
+        """
+        Multiplies two matrices, or the matrix by a scalar, and returns a new
+        matrix. The elementwise product of matrices is `multiply`.
+        """
+
+        if isinstance(other, Matrix):
+            return self.matmul(other)
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.multiply(other)
+
+    def __rmul__(self, other: float) -> "Matrix":
+        """
+        Multiplies a scalar by the matrix (alpha * self).
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.multiply(other)
+
+    def __truediv__(self, other: "Operand") -> "Matrix":
+        """
+        Divides elementwise by a matrix or a scalar and returns a new matrix.
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
 
-    def __mul__(self, other: "Matrix") -> "Matrix":
+        return self.divide(other)
+
+    def __rtruediv__(self, other: float) -> "Matrix":
         """
-        Multiplies two matrices and returns a new matrix.
+        Divides a scalar by the matrix elementwise (alpha / self).
+        """
+
+        if not _is_operand(other):
+            return NotImplemented
+
+        return self.apply(_reflected(operator.truediv), other)
+
+    def matmul(
+        self,
+        other: "Matrix",
+        tile_size: Optional[int] = None,
+        out: Optional["Matrix"] = None,
+        workers: int = 1,
+        backend: Optional[str] = None,
+        algorithm: str = "standard",
+    ) -> "Matrix":
+        """
+        Multiplies two matrices. The result is written into `out` when it is
+        given (it may be one of the operands) and a new matrix is returned
+        otherwise.
+
+        On the pure-Python backend small products use the naive kernel and
+        products where some dimension reaches `TILED_MATMUL_THRESHOLD` use
+        the tiled kernel with tiles of `TILE_SIZE`. Passing `tile_size`
+        forces the tiled kernel with that tile size. With `workers` above one
+        the rows of the result are split into blocks computed by that many
+        processes, which share the operands through shared memory.
+
+        With `algorithm="strassen"` the product is computed by Strassen's
+        recursive algorithm (see `strassen`) down to blocks of
+        `STRASSEN_CUTOFF`, which are multiplied as above in one process.
+
+        Matrix-vector (and vector-matrix) products with the default options
+        skip the general kernels and take the backend's `matvec` path: one
+        dot product per row. The result keeps the class of the vector
+        operand, so a matrix times a `Vector` is a `Vector`.
         """
 
         if not self._is_multiplicable(other):
             raise ValueError(f"Matrices can't be multiplied.")
 
-        return Matrix(
-            list(
-                map(
-                    list,
-                    batched(
-                        starmap(
-                            sumprod, product(self._matrix, zip(*other._matrix))
-                        ),
-                        other.width,
-                    ),
-                )
+        if tile_size is not None and tile_size <= 0:
+            raise ValueError("Tile size must be positive.")
+
+        if workers <= 0:
+            raise ValueError("The number of workers must be positive.")
+
+        if algorithm not in ("standard", "strassen"):
+            raise ValueError(
+                f"Unknown multiplication algorithm {algorithm!r}."
+            )
+
+        if algorithm == "strassen" and workers != 1:
+            raise ValueError("Strassen multiplication runs in one process.")
+
+        target = self._output_storage(out, self.height, other.width)
+
+        if (
+            (other.width == 1 or self.height == 1)
+            and tile_size is None
+            and workers == 1
+            and algorithm == "standard"
+        ):
+            product = self._matvec(other, target, backend)
+            return out if out is not None else product
+
+        if tile_size is None and (
+            max(self.height, self.width, other.width)
+            >= self.TILED_MATMUL_THRESHOLD
+        ):
+            tile_size = self.TILE_SIZE
+
+        if algorithm == "strassen":
+            storage = strassen_matmul(
+                get_backend(backend),
+                self._storage,
+                other._storage,
+                self.STRASSEN_CUTOFF,
+                tile_size,
+                target,
+            )
+        else:
+            storage = get_backend(backend).matmul(
+                self._storage, other._storage, tile_size, target, workers
             )
+
+        return out if out is not None else Matrix._from_storage(storage)
+
+    def _matvec(
+        self,
+        other: "Matrix",
+        target: Optional[MatrixStorage],
+        backend: Optional[str],
+    ) -> "Matrix":
+        """
+        Multiplies by a column vector, or multiplies a row vector by a matrix,
+        with one dot product per element of the result.
+        """
+
+        if other.width == 1:
+            storage = get_backend(backend).matvec(
+                self._storage, other._storage, target
+            )
+            return type(other)._from_storage(storage)
+
+        # v * M is the transpose of M.T * v.T.
+        storage = get_backend(backend).matvec(
+            other._storage.transposed(),
+            self._storage,
+            None if target is None else target.transposed(),
+        )
+        return type(self)._from_storage(storage.transposed())
+
+    def lu(self, backend: Optional[str] = None) -> "LUDecomposition":
+        """
+        Computes the LU decomposition with partial pivoting (see
+        `decompositions`). Keep the result to solve several systems with
+        this matrix without factoring it again.
+        """
+
+        # Imported here: decompositions are built on top of this module.
+        from project.matrix_vector_operations.decompositions import (
+            LUDecomposition,
+        )
+
+        return LUDecomposition(self, backend)
+
+    def qr(self, backend: Optional[str] = None) -> "QRDecomposition":
+        """
+        Computes the QR decomposition of a matrix with at least as many rows
+        as columns (see `decompositions`). Its `solve` finds least-squares
+        solutions.
+        """
+
+        from project.matrix_vector_operations.decompositions import (
+            QRDecomposition,
+        )
+
+        return QRDecomposition(self, backend)
+
+    def cholesky(
+        self, backend: Optional[str] = None
+    ) -> "CholeskyDecomposition":
+        """
+        Computes the Cholesky decomposition of a symmetric positive definite
+        matrix (see `decompositions`).
+        """
+
+        from project.matrix_vector_operations.decompositions import (
+            CholeskyDecomposition,
+        )
+
+        return CholeskyDecomposition(self, backend)
+
+    def solve(self, b: "Matrix", backend: Optional[str] = None) -> "Matrix":
+        """
+        Solves self * x = b for a square matrix, through its LU
+        decomposition. The result has the class of `b`.
+        """
+
+        return self.lu(backend).solve(b)
+
+    def det(self, backend: Optional[str] = None) -> float:
+        """
+        Returns the determinant of a square matrix, through its LU
+        decomposition.
+        """
+
+        return self.lu(backend).det()
+
+    def inverse(self, backend: Optional[str] = None) -> "Matrix":
+        """
+        Returns the inverse of a square matrix, through its LU
+        decomposition.
+        """
+
+        return self.lu(backend).inverse()
+
+    def matrix_power(
+        self, exponent: int, backend: Optional[str] = None
+    ) -> "Matrix":
+        """
+        Raises a square matrix to an integer power by repeated squaring:
+        A^13 = A^8 * A^4 * A, which takes O(log k) multiplications instead
+        of k - 1. The products are written into three buffers that are
+        reused throughout. A^0 is the identity, and a negative power is the
+        power of the inverse.
+
+        Raises:
+        ValueError: If the matrix is not square, or singular with a negative
+            exponent.
+        """
+
+        if self.height != self.width:
+            raise ValueError("Matrix must be square.")
+
+        if exponent < 0:
+            return self.inverse(backend).matrix_power(-exponent, backend)
+
+        if exponent == 0:
+            identity = MatrixStorage.zeros(self.height, self.width)
+            for i in range(self.height):
+                identity.data[i * (self.width + 1)] = 1.0
+            return Matrix._from_storage(identity)
+
+        base = Matrix._from_storage(get_backend(backend).copy(self._storage))
+        spare = Matrix._from_storage(
+            MatrixStorage.zeros(self.height, self.width)
         )
 
+        def square() -> None:
+            nonlocal base, spare
+            base.matmul(base, out=spare, backend=backend)
+            base, spare = spare, base
+
+        # The lowest set bit of the exponent starts the result.
+        while not exponent & 1:
+            square()
+            exponent >>= 1
+
+        result = Matrix._from_storage(get_backend(backend).copy(base._storage))
+
+        exponent >>= 1
+        while exponent:
+            square()
+            if exponent & 1:
+                result.matmul(base, out=spare, backend=backend)
+                result, spare = spare, result
+            exponent >>= 1
+
+        return result
+
+    def __pow__(self, exponent: int) -> "Matrix":
+        """
+        Raises a square matrix to an integer power (see `matrix_power`).
+        """
+
+        if not isinstance(exponent, int):
+            return NotImplemented
+
+        return self.matrix_power(exponent)
+
+    def apply_power(
+        self, other: "Matrix", exponent: int, backend: Optional[str] = None
+    ) -> "Matrix":
+        """
+        Computes self^exponent * other without necessarily forming the power.
+
+        For a vector, k matrix-vector products cost k n^2 against about
+        log2(k) n^3 for squaring, so repeated products win until k nears
+        n log2(k). Whichever way needs fewer multiplications is taken, for
+        any number of columns in `other`. A negative exponent solves
+        against one LU decomposition of the matrix instead.
+
+        Raises:
+        ValueError: If the matrix is not square or the operands can't be
+            multiplied.
+        """
+
+        if self.height != self.width:
+            raise ValueError("Matrix must be square.")
+
+        if not self._is_multiplicable(other):
+            raise ValueError("Matrices can't be multiplied.")
+
+        if exponent < 0:
+            factor = self.lu(backend)
+            for _ in range(-exponent):
+                other = factor.solve(other)
+            return other
+
+        if exponent == 0:
+            return other._result(get_backend(backend).copy(other._storage))
+
+        # Multiplications in squaring: one per bit but the first, and one
+        # per set bit but the first, each n^3, then one product with other.
+        n, columns = self.height, other.width
+        products = exponent.bit_length() + exponent.bit_count() - 2
+
+        if products * n + columns <= exponent * columns:
+            return self.matrix_power(exponent, backend).matmul(
+                other, backend=backend
+            )
+
+        result = self.matmul(other, backend=backend)
+        spare = other._result(MatrixStorage.zeros(n, columns))
+
+        for _ in range(exponent - 1):
+            self.matmul(result, out=spare, backend=backend)
+            result, spare = spare, result
+
+        return result
+
+    def _result(self, storage: MatrixStorage) -> "Matrix":
+        """
+        Wraps the result of an elementwise operation. It keeps the class of
+        the matrix (a `Vector` stays a `Vector`) unless broadcasting changed
+        the shape.
+        """
+
+        if (storage.height, storage.width) == (self.height, self.width):
+            return type(self)._from_storage(storage)
+
+        return Matrix._from_storage(storage)
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """
+        Returns the element at the given (row, column) position.
+        """
+
+        return self._storage.data[self._storage.index(*index)]
+
+    def __setitem__(self, index: tuple[int, int], value: float) -> None:
+        """
+        Sets the element at the given (row, column) position.
+        """
+
+        storage = self._writable_storage()
+        storage.data[storage.index(*index)] = value
+
     def _has_same_dimension(self, other: "Matrix") -> bool:
         """
         Checks if two matrices have the same dimensions.
@@ -144,4 +969,29 @@ class Matrix:
         and elements separated by spaces.
         """
 
-        return "\n".join([" ".join(map(str, row)) for row in self._matrix])
+        return "\n".join(
+            [" ".join(map(str, row)) for row in self._storage.rows()]
+        )
+
+
+# An operand of the elementwise operations: a matrix or a scalar.
+Operand = Union[Matrix, float]
+
+
+def _is_operand(value: object) -> bool:
+    """
+    Checks whether a value can take part in an elementwise operation.
+    """
+
+    return isinstance(value, (Matrix, int, float))
+
+
+def _reflected(
+    function: Callable[[Any, Any], Any]
+) -> Callable[[Any, Any], Any]:
+    """
+    Returns `function` with its two operands swapped, for the reflected
+    operators: `apply` always passes the matrix first.
+    """
+
+    return lambda x, y: function(y, x)
@@ -0,0 +1,399 @@
+from array import array
+from collections.abc import Buffer
+from itertools import chain
+from typing import Callable, Iterable, Iterator, List, Optional, TypeAlias
+from weakref import WeakSet
+
+# Views over the buffer are always cast to the 'd' (C double) format.
+FloatView: TypeAlias = "memoryview[float]"
+
+# Buffer formats accepted as doubles: doubles themselves, or raw bytes.
+FLOAT_FORMATS = frozenset({"d", "B", "b", "c"})
+
+
+def as_float_view(buffer: Buffer) -> FloatView:
+    """
+    Returns a flat view of the buffer's bytes reinterpreted as C doubles.
+
+    Raises:
+    TypeError: If the buffer holds items other than doubles or raw bytes.
+    """
+
+    view = memoryview(buffer)
+
+    if view.format not in FLOAT_FORMATS:
+        raise TypeError(
+            f"Expected a buffer of doubles or bytes, got format "
+            f"{view.format!r}."
+        )
+
+    return view.cast("B").cast("d")
+
+
+class MatrixStorage:
+    """
+    A contiguous, typed backing store for the elements of a matrix.
+
+    Elements are kept as raw C doubles in a flat one-dimensional buffer and
+    addressed through an offset and a pair of strides, so a row or a column
+    is just a (possibly strided) slice of that buffer. Any object exposing
+    the buffer protocol (`array('d')`, `bytearray`, `mmap`, ...) can be used
+    as the underlying buffer without copying it.
+
+    Attributes:
+    ----------
+    `data: memoryview`:
+        Flat view of the underlying buffer, formatted as doubles.
+
+    `height: int`, `width: int`:
+        Dimensions of the stored matrix.
+
+    `offset: int`:
+        Index in `data` of the element (0, 0).
+
+    `row_stride: int`, `col_stride: int`:
+        Distance in `data` between neighbouring rows and columns.
+
+    `aliases: Optional[WeakSet]`:
+        The live storages sharing `data` through views, including this one.
+
+    `external: bool`:
+        Whether `data` is a caller's buffer wrapped by `from_buffer`, which
+        writes to this storage must keep reaching.
+
+    Methods:
+    -------
+    `from_iterable(values: Iterable[float], height: int, width: int) -> "MatrixStorage"`:
+        Static method to copy row-major values into a new buffer.
+
+    `from_buffer(buffer: Buffer, height: int, width: int, offset: int = 0) -> "MatrixStorage"`:
+        Static method to wrap an existing buffer without copying it.
+
+    `zeros(height: int, width: int) -> "MatrixStorage"`:
+        Static method to allocate a zero-filled storage.
+
+    `row(i: int) -> FloatView`, `column(j: int) -> FloatView`:
+        Return views of a single row or column.
+
+    `rows() -> Iterator[FloatView]`, `columns() -> Iterator[FloatView]`:
+        Iterate over views of all rows or columns.
+
+    `values() -> Iterable[float]`:
+        Returns the elements in row-major order.
+
+    `transposed() -> "MatrixStorage"`:
+        Returns a transposed view sharing the same buffer.
+
+    `block(i: int, j: int, height: int, width: int) -> "MatrixStorage"`:
+        Returns a view of a rectangular block sharing the same buffer.
+
+    `is_shared -> bool`:
+        Whether another live storage is a view of the same elements.
+
+    `index(i: int, j: int) -> int`:
+        Returns the position of the element (i, j) in `data`.
+
+    `assign(values: Iterable[float]) -> None`:
+        Overwrites the elements in place with row-major values.
+
+    `detach() -> None`:
+        Moves the storage onto a private copy of its elements.
+
+    `shares_buffer(other: "MatrixStorage") -> bool`:
+        Whether two storages are backed by the same buffer.
+
+    `copy() -> "MatrixStorage"`:
+        Returns a contiguous copy of the storage.
+
+    `tolist() -> List[List[float]]`:
+        Returns the elements as a list of lists.
+
+    `__reduce__() -> tuple`:
+        Pickles the shape and a contiguous copy of the elements.
+    """
+
+    __slots__ = (
+        "data",
+        "height",
+        "width",
+        "offset",
+        "row_stride",
+        "col_stride",
+        "aliases",
+        "external",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        data: FloatView,
+        height: int,
+        width: int,
+        offset: int = 0,
+        row_stride: Optional[int] = None,
+        col_stride: int = 1,
+    ) -> None:
+        """
+        Initializes a storage over an already formatted view of doubles.
+        """
+
+        self.data = data
+        self.height = height
+        self.width = width
+        self.offset = offset
+        self.row_stride = width if row_stride is None else row_stride
+        self.col_stride = col_stride
+        self.aliases: Optional[WeakSet[MatrixStorage]] = None
+        self.external = False
+
+    @staticmethod
+    def from_iterable(
+        values: Iterable[float], height: int, width: int
+    ) -> "MatrixStorage":
+        """
+        Copies row-major values into a new contiguous buffer.
+        """
+
+        data = array("d", values)
+
+        if len(data) != height * width:
+            raise ValueError(
+                f"Expected {height * width} values, got {len(data)}."
+            )
+
+        return MatrixStorage(as_float_view(data), height, width)
+
+    @staticmethod
+    def from_buffer(
+        buffer: Buffer, height: int, width: int, offset: int = 0
+    ) -> "MatrixStorage":
+        """
+        Wraps a buffer of row-major doubles without copying it. `offset` is
+        counted in elements, not bytes.
+        """
+
+        if height <= 0 or width <= 0:
+            raise ValueError("Matrix dimensions must be positive.")
+
+        data = as_float_view(buffer)
+
+        if offset < 0 or len(data) - offset < height * width:
+            raise ValueError("Buffer is too small for the requested shape.")
+
+        storage = MatrixStorage(data, height, width, offset)
+        storage.external = True
+
+        return storage
+
+    @staticmethod
+    def zeros(height: int, width: int) -> "MatrixStorage":
+        """
+        Allocates a contiguous storage filled with zeros.
+        """
+
+        return MatrixStorage(
+            as_float_view(array("d", bytes(8 * height * width))),
+            height,
+            width,
+        )
+
+    @property
+    def is_contiguous(self) -> bool:
+        """
+        Whether the elements occupy a dense row-major block of `data`.
+        """
+
+        return (self.col_stride == 1 or self.width == 1) and (
+            self.row_stride == self.width or self.height == 1
+        )
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        Whether another live storage is a view of the same elements, so that
+        writing to this one would be visible through it.
+        """
+
+        return self.aliases is not None and len(self.aliases) > 1
+
+    def block(
+        self, i: int, j: int, height: int, width: int
+    ) -> "MatrixStorage":
+        """
+        Returns a view of the `height` x `width` block whose top-left element
+        is (i, j). Unlike `transposed`, the view is not recorded as an alias:
+        it is meant for kernels working on parts of a storage.
+        """
+
+        if not (0 <= i and 0 < height and i + height <= self.height) or not (
+            0 <= j and 0 < width and j + width <= self.width
+        ):
+            raise IndexError("Block out of range.")
+
+        return MatrixStorage(
+            self.data,
+            height,
+            width,
+            self.offset + i * self.row_stride + j * self.col_stride,
+            self.row_stride,
+            self.col_stride,
+        )
+
+    def transposed(self) -> "MatrixStorage":
+        """
+        Returns a transposed view of the storage in O(1): the same buffer
+        with the dimensions and strides swapped. Both storages are recorded
+        as aliases of each other.
+        """
+
+        view = MatrixStorage(
+            self.data,
+            self.width,
+            self.height,
+            self.offset,
+            self.col_stride,
+            self.row_stride,
+        )
+
+        if self.aliases is None:
+            self.aliases = WeakSet([self])
+        self.aliases.add(view)
+        view.aliases = self.aliases
+
+        return view
+
+    def row(self, i: int) -> FloatView:
+        """
+        Returns a view of the i-th row.
+        """
+
+        start = self.offset + i * self.row_stride
+        return self.data[
+            start : start + self.width * self.col_stride : self.col_stride
+        ]
+
+    def column(self, j: int) -> FloatView:
+        """
+        Returns a view of the j-th column.
+        """
+
+        start = self.offset + j * self.col_stride
+        return self.data[
+            start : start + self.height * self.row_stride : self.row_stride
+        ]
+
+    def rows(self) -> Iterator[FloatView]:
+        """
+        Iterates over views of all rows.
+        """
+
+        return map(self.row, range(self.height))
+
+    def columns(self) -> Iterator[FloatView]:
+        """
+        Iterates over views of all columns.
+        """
+
+        return map(self.column, range(self.width))
+
+    def values(self) -> Iterable[float]:
+        """
+        Returns the elements in row-major order, as a single view when the
+        storage is contiguous.
+        """
+
+        if self.is_contiguous:
+            return self.data[
+                self.offset : self.offset + self.height * self.width
+            ]
+
+        return chain.from_iterable(self.rows())
+
+    def index(self, i: int, j: int) -> int:
+        """
+        Returns the position of the element (i, j) in `data`.
+        """
+
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"Index ({i}, {j}) is out of range.")
+
+        return self.offset + i * self.row_stride + j * self.col_stride
+
+    def assign(self, values: Iterable[float]) -> None:
+        """
+        Overwrites the elements in place with row-major values. The values
+        are fully collected before the first write, so they may be computed
+        from this very storage.
+        """
+
+        buffer = array("d", values)
+        size = self.height * self.width
+
+        if len(buffer) != size:
+            raise ValueError(f"Expected {size} values, got {len(buffer)}.")
+
+        if self.is_contiguous:
+            self.data[self.offset : self.offset + size] = buffer
+            return
+
+        for i, row in enumerate(self.rows()):
+            row[:] = buffer[i * self.width : (i + 1) * self.width]
+
+    def detach(self) -> None:
+        """
+        Moves the storage onto a private contiguous copy of its elements and
+        removes it from its aliases, so that writes to them no longer reach
+        it.
+        """
+
+        copy = self.copy()
+        self.data = copy.data
+        self.offset, self.row_stride, self.col_stride = 0, self.width, 1
+        self.external = False
+
+        if self.aliases is not None:
+            self.aliases.discard(self)
+            self.aliases = None
+
+    def shares_buffer(self, other: "MatrixStorage") -> bool:
+        """
+        Whether two storages are backed by the same buffer, so that writing
+        to one may change the other.
+        """
+
+        return self.data.obj is other.data.obj
+
+    def copy(self) -> "MatrixStorage":
+        """
+        Returns a contiguous copy of the storage.
+        """
+
+        return MatrixStorage.from_iterable(
+            self.values(), self.height, self.width
+        )
+
+    def tolist(self) -> List[List[float]]:
+        """
+        Returns the elements as a list of lists.
+        """
+
+        return [list(row) for row in self.rows()]
+
+    def __reduce__(
+        self,
+    ) -> "tuple[Callable[..., MatrixStorage], tuple[object, ...]]":
+        """
+        Pickles (and deep-copies) the storage as its shape and a contiguous
+        `array('d')` of its elements, since memoryviews can't be pickled.
+        Views are restored as independent storages.
+        """
+
+        return _restore, (array("d", self.values()), self.height, self.width)
+
+
+def _restore(values: "array[float]", height: int, width: int) -> MatrixStorage:
+    """
+    Rebuilds a storage pickled by `MatrixStorage.__reduce__`.
+    """
+
+    return MatrixStorage(as_float_view(values), height, width)
@@ -0,0 +1,173 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.matmul_kernels import (
+    naive_matmul,
+    tiled_matmul,
+)
+from project.process_context import PROCESS_CONTEXT
+
+# Shapes of the operands and of the result, as (name, height, width).
+_Operand = Tuple[str, int, int]
+
+# Shared memory blocks attached by a worker process, kept alive for the
+# lifetime of the pool.
+_worker_blocks: List[SharedMemory] = []
+_worker_operands: List[MatrixStorage] = []
+_worker_tile_size: Optional[int] = None
+
+
+def _attach(name: str, height: int, width: int) -> MatrixStorage:
+    """
+    Attaches to a shared memory block in a worker and wraps it in a storage.
+    """
+
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not make the block outlive the parent's `unlink`.
+    block = SharedMemory(name=name)
+    _worker_blocks.append(block)
+
+    return _wrap(block, height, width)
+
+
+def _wrap(block: SharedMemory, height: int, width: int) -> MatrixStorage:
+    """
+    Wraps an open shared memory block in a storage.
+    """
+
+    if block.buf is None:
+        raise ValueError("Shared memory block is closed.")
+
+    return MatrixStorage.from_buffer(block.buf, height, width)
+
+
+def _init_worker(
+    a: _Operand, b: _Operand, out: _Operand, tile_size: Optional[int]
+) -> None:
+    """
+    Pool initializer: attaches the operands and the result once per worker.
+    """
+
+    global _worker_tile_size
+
+    _worker_operands[:] = [_attach(*a), _attach(*b), _attach(*out)]
+    _worker_tile_size = tile_size
+
+
+def _multiply_rows(start: int, stop: int) -> None:
+    """
+    Computes rows [start, stop) of the product straight into shared memory.
+    """
+
+    a, b, out = _worker_operands
+    a_rows = MatrixStorage(
+        a.data, stop - start, a.width, a.offset + start * a.row_stride
+    )
+    out_rows = MatrixStorage(
+        out.data, stop - start, out.width, out.offset + start * out.row_stride
+    )
+
+    if _worker_tile_size is None:
+        naive_matmul(a_rows, b, out_rows)
+    else:
+        tiled_matmul(a_rows, b, _worker_tile_size, out_rows)
+
+
+def _share(storage: MatrixStorage) -> SharedMemory:
+    """
+    Copies a storage into a new shared memory block, row-major.
+    """
+
+    block = SharedMemory(create=True, size=8 * storage.height * storage.width)
+    _wrap(block, storage.height, storage.width).assign(storage.values())
+
+    return block
+
+
+def _collect(
+    block: SharedMemory, height: int, width: int, out: Optional[MatrixStorage]
+) -> MatrixStorage:
+    """
+    Copies the result out of shared memory. The views over the block die
+    with this call, which lets the caller close it.
+    """
+
+    result = _wrap(block, height, width)
+    if out is None:
+        return result.copy()
+
+    out.assign(result.values())
+    return out
+
+
+def parallel_matmul(
+    a: MatrixStorage,
+    b: MatrixStorage,
+    workers: int,
+    tile_size: Optional[int] = None,
+    out: Optional[MatrixStorage] = None,
+) -> MatrixStorage:
+    """
+    Multiplies two storages in a pool of worker processes.
+
+    The operands are copied once into `multiprocessing.shared_memory` blocks
+    that every worker attaches to, so nothing but row ranges is pickled. The
+    result is split into contiguous row blocks, one per worker, and each
+    worker writes its rows straight into a shared result block with the
+    naive (or, given `tile_size`, the tiled) kernel. Since processes do not
+    share the GIL, the work scales with the number of cores, minus the cost
+    of starting the pool and copying the operands.
+
+    Args:
+        a: Left operand of shape (n, m).
+        b: Right operand of shape (m, k).
+        workers: The number of worker processes.
+        tile_size: The tile size for the tiled kernel, or None for the naive
+            kernel.
+        out: Optional storage of shape (n, k) to write the result into.
+
+    Returns:
+        `out`, or a new contiguous storage of shape (n, k).
+
+    Raises:
+    ValueError: If `workers` is not positive.
+    """
+
+    if workers <= 0:
+        raise ValueError("The number of workers must be positive.")
+
+    blocks: List[SharedMemory] = []
+
+    try:
+        blocks.append(_share(a))
+        blocks.append(_share(b))
+        blocks.append(SharedMemory(create=True, size=8 * a.height * b.width))
+        a_block, b_block, out_block = blocks
+
+        step = -(-a.height // workers)
+        ranges = [
+            (start, min(start + step, a.height))
+            for start in range(0, a.height, step)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=len(ranges),
+            mp_context=PROCESS_CONTEXT,
+            initializer=_init_worker,
+            initargs=(
+                (a_block.name, a.height, a.width),
+                (b_block.name, b.height, b.width),
+                (out_block.name, a.height, b.width),
+                tile_size,
+            ),
+        ) as pool:
+            for future in [pool.submit(_multiply_rows, *r) for r in ranges]:
+                future.result()
+
+        return _collect(out_block, a.height, b.width, out)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,511 @@
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate
+from math import hypot, sumprod
+from typing import Dict, Iterator, Tuple, Union
+
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+
+class SparseMatrix(ABC):
+    """
+    A base class for matrices storing only their non-zero elements.
+
+    It provides the same operator protocol as `Matrix` (`+`, `+=`, `*`,
+    `transpose`, and `length`/`dot_product` for vector shapes). Operands may
+    be sparse or dense: sparse-sparse operations stay sparse, while mixed
+    operations return a dense `Matrix`. Every operation is carried out on the
+    CSR form, which subclasses provide through `to_csr`.
+
+    Methods:
+    -------
+    `to_csr() -> "CSRMatrix"`:
+        Returns the matrix in compressed sparse row form.
+
+    `to_dense() -> Matrix`:
+        Returns the matrix as a dense `Matrix`.
+
+    `to_list() -> List[List[float]]`:
+        Returns the elements of the matrix as a list of lists.
+
+    `transpose() -> "SparseMatrix"`:
+        Returns the transpose of the matrix.
+
+    `length() -> float`:
+        Returns the magnitude of a vector-shaped matrix.
+
+    `dot_product(a: "SparseMatrix", b: Union["SparseMatrix", Matrix]) -> float`:
+        Static method to calculate the dot product of vector-shaped matrices.
+
+    `__add__`, `__iadd__`, `__mul__`:
+        Addition and multiplication with sparse or dense matrices.
+    """
+
+    height: int
+    width: int
+
+    @abstractmethod
+    def to_csr(self) -> "CSRMatrix":
+        """
+        Returns the matrix in compressed sparse row form.
+        """
+
+    @abstractmethod
+    def transpose(self) -> "SparseMatrix":
+        """
+        Returns the transpose of the matrix.
+        """
+
+    @property
+    @abstractmethod
+    def nnz(self) -> int:
+        """
+        The number of stored elements.
+        """
+
+    def to_dense(self) -> Matrix:
+        """
+        Returns the matrix as a dense `Matrix`.
+        """
+
+        csr = self.to_csr()
+        storage = MatrixStorage.zeros(csr.height, csr.width)
+
+        for i, j, value in csr.items():
+            storage.data[i * csr.width + j] += value
+
+        return Matrix._from_storage(storage)
+
+    def to_list(self) -> list[list[float]]:
+        """
+        Returns the elements of the matrix as a list of lists.
+        """
+
+        return self.to_dense().to_list()
+
+    def __add__(
+        self, other: Union["SparseMatrix", Matrix]
+    ) -> Union["CSRMatrix", Matrix]:
+        """
+        Adds two matrices. The result is sparse only if both operands are.
+        """
+
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+
+        if self.height != other.height or self.width != other.width:
+            raise ValueError("Matrix 'other' has wrong dimension.")
+
+        if isinstance(other, SparseMatrix):
+            return _add_sparse(self.to_csr(), other.to_csr())
+
+        storage = other._storage.copy()
+        for i, j, value in self.to_csr().items():
+            storage.data[i * storage.width + j] += value
+
+        return Matrix._from_storage(storage)
+
+    def __radd__(self, other: Matrix) -> Union["CSRMatrix", Matrix]:
+        """
+        Adds a sparse matrix to a dense one (dense + sparse).
+        """
+
+        return self.__add__(other)
+
+    def __mul__(
+        self, other: Union["SparseMatrix", Matrix]
+    ) -> Union["CSRMatrix", Matrix]:
+        """
+        Multiplies two matrices. The result is sparse only if both operands
+        are.
+        """
+
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+
+        if self.width != other.height:
+            raise ValueError(f"Matrices can't be multiplied.")
+
+        if isinstance(other, SparseMatrix):
+            return _mul_sparse(self.to_csr(), other.to_csr())
+
+        return _mul_sparse_dense(self.to_csr(), other)
+
+    def __rmul__(self, other: Matrix) -> Matrix:
+        """
+        Multiplies a dense matrix by a sparse one (dense * sparse).
+        """
+
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        if other.width != self.height:
+            raise ValueError(f"Matrices can't be multiplied.")
+
+        # (A * B) = (B^T * A^T)^T, which only needs sparse * dense products.
+        transposed = _mul_sparse_dense(
+            self.to_csr().transpose(), other.transpose()
+        )
+
+        return transposed.transpose()
+
+    def length(self) -> float:
+        """
+        Returns the magnitude (length) of a vector-shaped matrix.
+        """
+
+        if self.height != 1 and self.width != 1:
+            raise TypeError("Matrix must be a valid vector.")
+
+        return hypot(*self.to_csr().values)
+
+    @staticmethod
+    def dot_product(
+        a: "SparseMatrix", b: Union["SparseMatrix", Matrix]
+    ) -> float:
+        """
+        Calculates the dot product of a sparse vector and a sparse or dense
+        vector of the same dimensions.
+        """
+
+        if a.height != b.height or a.width != b.width:
+            raise ValueError("Vectors have incompatible dimensions.")
+
+        if a.height != 1 and a.width != 1:
+            raise TypeError("Matrix must be a valid vector.")
+
+        entries = list(a.to_csr().items())
+
+        if isinstance(b, Matrix):
+            return sumprod(
+                (value for _, _, value in entries),
+                (b[i, j] for i, j, _ in entries),
+            )
+
+        other = {(i, j): value for i, j, value in b.to_csr().items()}
+        return sumprod(
+            (value for _, _, value in entries),
+            (other.get((i, j), 0.0) for i, j, _ in entries),
+        )
+
+
+class COOMatrix(SparseMatrix):
+    """
+    A sparse matrix in coordinate (COO) form: parallel arrays of row indices,
+    column indices and values. It is cheap to build incrementally and is
+    converted to CSR for arithmetic. Duplicate entries are summed.
+
+    Methods:
+    -------
+    `append(i: int, j: int, value: float) -> None`:
+        Adds an entry to the matrix.
+
+    `from_dense(matrix: Matrix) -> "COOMatrix"`:
+        Class method to collect the non-zero elements of a dense matrix.
+    """
+
+    def __init__(self, height: int, width: int) -> None:
+        """
+        Initializes an empty COO matrix of the given shape.
+        """
+
+        if height <= 0 or width <= 0:
+            raise ValueError("Matrix dimensions must be positive.")
+
+        self.height = height
+        self.width = width
+        self.rows = array("q")
+        self.cols = array("q")
+        self.values = array("d")
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix) -> "COOMatrix":
+        """
+        Collects the non-zero elements of a dense matrix.
+        """
+
+        coo = cls(matrix.height, matrix.width)
+
+        for i, row in enumerate(matrix.rows()):
+            for j, value in enumerate(row):
+                if value:
+                    coo.append(i, j, value)
+
+        return coo
+
+    @property
+    def nnz(self) -> int:
+        return len(self.values)
+
+    def append(self, i: int, j: int, value: float) -> None:
+        """
+        Adds `value` at position (i, j). Entries at the same position are
+        summed on conversion to CSR.
+        """
+
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"Index ({i}, {j}) is out of range.")
+
+        self.rows.append(i)
+        self.cols.append(j)
+        self.values.append(value)
+
+    def to_csr(self) -> "CSRMatrix":
+        """
+        Converts the matrix to CSR form, grouping the entries by row and
+        summing duplicates.
+        """
+
+        per_row: Dict[int, Dict[int, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        for i, j, value in zip(self.rows, self.cols, self.values):
+            per_row[i][j] += value
+
+        return CSRMatrix._from_rows(
+            self.height,
+            self.width,
+            (sorted(per_row[i].items()) for i in range(self.height)),
+        )
+
+    def transpose(self) -> "COOMatrix":
+        """
+        Returns the transpose by swapping the index arrays.
+        """
+
+        transposed = COOMatrix(self.width, self.height)
+        transposed.rows = array("q", self.cols)
+        transposed.cols = array("q", self.rows)
+        transposed.values = array("d", self.values)
+
+        return transposed
+
+
+class CSRMatrix(SparseMatrix):
+    """
+    A sparse matrix in compressed sparse row (CSR) form.
+
+    The column indices and values of row `i` are stored in
+    `indices[indptr[i]:indptr[i + 1]]` and `values[indptr[i]:indptr[i + 1]]`,
+    sorted by column, so rows can be read and multiplied without scanning
+    the rest of the matrix.
+
+    Methods:
+    -------
+    `from_dense(matrix: Matrix) -> "CSRMatrix"`:
+        Class method to compress the non-zero elements of a dense matrix.
+
+    `row(i: int) -> Tuple[array, array]`:
+        Returns the column indices and values of a row.
+
+    `items() -> Iterator[Tuple[int, int, float]]`:
+        Iterates over the stored elements in row-major order.
+
+    `__getitem__(index: tuple[int, int]) -> float`:
+        Returns the element at the given (row, column) position.
+    """
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        indptr: "array[int]",
+        indices: "array[int]",
+        values: "array[float]",
+    ) -> None:
+        """
+        Initializes a CSR matrix from its three arrays.
+        """
+
+        if height <= 0 or width <= 0:
+            raise ValueError("Matrix dimensions must be positive.")
+
+        if len(indptr) != height + 1 or len(indices) != len(values):
+            raise ValueError("CSR arrays do not match the matrix shape.")
+
+        self.height = height
+        self.width = width
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix) -> "CSRMatrix":
+        """
+        Compresses the non-zero elements of a dense matrix.
+        """
+
+        return cls._from_rows(
+            matrix.height,
+            matrix.width,
+            (
+                [(j, value) for j, value in enumerate(row) if value]
+                for row in matrix.rows()
+            ),
+        )
+
+    @classmethod
+    def _from_rows(
+        cls,
+        height: int,
+        width: int,
+        rows: Iterator[list[Tuple[int, float]]],
+    ) -> "CSRMatrix":
+        """
+        Builds a CSR matrix from the (column, value) pairs of each row,
+        already sorted by column.
+        """
+
+        indptr = array("q", [0])
+        indices = array("q")
+        values = array("d")
+
+        for row in rows:
+            for j, value in row:
+                indices.append(j)
+                values.append(value)
+            indptr.append(len(indices))
+
+        return cls(height, width, indptr, indices, values)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.values)
+
+    def to_csr(self) -> "CSRMatrix":
+        return self
+
+    def row(self, i: int) -> Tuple["array[int]", "array[float]"]:
+        """
+        Returns the column indices and values of the i-th row.
+        """
+
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.values[start:end]
+
+    def items(self) -> Iterator[Tuple[int, int, float]]:
+        """
+        Iterates over (row, column, value) of the stored elements in
+        row-major order.
+        """
+
+        for i in range(self.height):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                yield i, self.indices[k], self.values[k]
+
+    def transpose(self) -> "CSRMatrix":
+        """
+        Returns the transpose in CSR form, built with a counting sort by
+        column in O(nnz + height + width).
+        """
+
+        counts = [0] * (self.width + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        indptr = array("q", accumulate(counts))
+
+        position = list(indptr[:-1])
+        indices = array("q", bytes(8 * self.nnz))
+        values = array("d", bytes(8 * self.nnz))
+
+        for i, j, value in self.items():
+            indices[position[j]] = i
+            values[position[j]] = value
+            position[j] += 1
+
+        return CSRMatrix(self.width, self.height, indptr, indices, values)
+
+    def __iadd__(self, other: Union[SparseMatrix, Matrix]) -> "CSRMatrix":
+        """
+        Performs in-place addition of another sparse matrix (self += other).
+        Adding a dense matrix falls back to `+`, which returns a dense one.
+        """
+
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+
+        if self.height != other.height or self.width != other.width:
+            raise ValueError("Matrix 'other' has wrong dimension.")
+
+        result = _add_sparse(self, other.to_csr())
+        self.indptr = result.indptr
+        self.indices = result.indices
+        self.values = result.values
+
+        return self
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """
+        Returns the element at the given (row, column) position, found by
+        binary search within the row.
+        """
+
+        i, j = index
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"Index ({i}, {j}) is out of range.")
+
+        start, end = self.indptr[i], self.indptr[i + 1]
+        position = bisect_left(self.indices, j, start, end)
+
+        if position < end and self.indices[position] == j:
+            return self.values[position]
+
+        return 0.0
+
+
+def _add_sparse(a: CSRMatrix, b: CSRMatrix) -> CSRMatrix:
+    """
+    Adds two CSR matrices by merging their sorted rows.
+    """
+
+    def merged_rows() -> Iterator[list[Tuple[int, float]]]:
+        for i in range(a.height):
+            row: Dict[int, float] = dict(zip(*a.row(i)))
+            for j, value in zip(*b.row(i)):
+                row[j] = row.get(j, 0.0) + value
+            yield sorted(row.items())
+
+    return CSRMatrix._from_rows(a.height, a.width, merged_rows())
+
+
+def _mul_sparse(a: CSRMatrix, b: CSRMatrix) -> CSRMatrix:
+    """
+    Multiplies two CSR matrices row by row (Gustavson's algorithm): each row
+    of the result accumulates the rows of `b` selected by the non-zero
+    elements of the matching row of `a`.
+    """
+
+    def product_rows() -> Iterator[list[Tuple[int, float]]]:
+        for i in range(a.height):
+            row: Dict[int, float] = defaultdict(float)
+            for k, a_value in zip(*a.row(i)):
+                for j, b_value in zip(*b.row(k)):
+                    row[j] += a_value * b_value
+            yield sorted(row.items())
+
+    return CSRMatrix._from_rows(a.height, b.width, product_rows())
+
+
+def _mul_sparse_dense(a: CSRMatrix, b: Matrix) -> Matrix:
+    """
+    Multiplies a CSR matrix by a dense one. Only the rows of `b` selected by
+    the non-zero elements of each row of `a` are read.
+    """
+
+    storage = MatrixStorage.zeros(a.height, b.width)
+
+    for i in range(a.height):
+        ks, a_values = a.row(i)
+        if not ks:
+            continue
+
+        selected = [b._storage.row(k).tolist() for k in ks]
+        start = i * b.width
+        storage.data[start : start + b.width] = array(
+            "d", [sumprod(a_values, column) for column in zip(*selected)]
+        )
+
+    return Matrix._from_storage(storage)
@@ -0,0 +1,134 @@
+from typing import Optional
+
+from project.matrix_vector_operations.backends import MatrixBackend
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+
+def strassen_matmul(
+    backend: MatrixBackend,
+    a: MatrixStorage,
+    b: MatrixStorage,
+    cutoff: int,
+    tile_size: Optional[int] = None,
+    out: Optional[MatrixStorage] = None,
+) -> MatrixStorage:
+    """
+    Multiplies two storages with Strassen's algorithm.
+
+    Both operands are split into quadrants and the product is assembled from
+    seven quadrant products instead of eight, recursively, which brings the
+    cost down to O(n^2.81). The quadrants are views, so only the sums fed to
+    the products and the products themselves are allocated. Odd dimensions
+    are padded with a zero row or column for the level at hand only. Once
+    some dimension is at most `cutoff`, the backend's own multiplication
+    takes over, as the extra additions no longer pay for the saved products.
+
+    Args:
+        backend: The backend carrying out the additions and the products
+            below the cutoff.
+        a: Left operand of shape (n, m).
+        b: Right operand of shape (m, k).
+        cutoff: The dimension at or below which recursion stops.
+        tile_size: The tile size passed on to the backend's multiplication.
+        out: Optional storage of shape (n, k) to write the result into.
+
+    Returns:
+        `out`, or a new contiguous storage of shape (n, k).
+
+    Raises:
+    ValueError: If `cutoff` is not positive.
+    """
+
+    if cutoff <= 0:
+        raise ValueError("Strassen cutoff must be positive.")
+
+    result = _strassen(backend, a, b, cutoff, tile_size)
+
+    if out is not None:
+        out.assign(result.values())
+        return out
+
+    return result if result.is_contiguous else backend.copy(result)
+
+
+def _strassen(
+    backend: MatrixBackend,
+    a: MatrixStorage,
+    b: MatrixStorage,
+    cutoff: int,
+    tile_size: Optional[int],
+) -> MatrixStorage:
+    """
+    Recursive step of `strassen_matmul`. The result may be a view.
+    """
+
+    n, m, k = a.height, a.width, b.width
+
+    if min(n, m, k) <= cutoff:
+        return backend.matmul(a, b, tile_size)
+
+    if n % 2 or m % 2 or k % 2:
+        product = _strassen(
+            backend,
+            _padded(a, n + n % 2, m + m % 2),
+            _padded(b, m + m % 2, k + k % 2),
+            cutoff,
+            tile_size,
+        )
+        return product.block(0, 0, n, k)
+
+    a11, a12, a21, a22 = _quadrants(a)
+    b11, b12, b21, b22 = _quadrants(b)
+    add, sub = backend.add, backend.subtract
+
+    def multiply(x: MatrixStorage, y: MatrixStorage) -> MatrixStorage:
+        return _strassen(backend, x, y, cutoff, tile_size)
+
+    m1 = multiply(add(a11, a22), add(b11, b22))
+    m2 = multiply(add(a21, a22), b11)
+    m3 = multiply(a11, sub(b12, b22))
+    m4 = multiply(a22, sub(b21, b11))
+    m5 = multiply(add(a11, a12), b22)
+    m6 = multiply(sub(a21, a11), add(b11, b12))
+    m7 = multiply(sub(a12, a22), add(b21, b22))
+
+    result = MatrixStorage.zeros(n, k)
+    c11, c12, c21, c22 = _quadrants(result)
+
+    add(sub(add(m1, m4), m5), m7, c11)
+    add(m3, m5, c12)
+    add(m2, m4, c21)
+    add(add(sub(m1, m2), m3), m6, c22)
+
+    return result
+
+
+def _quadrants(
+    storage: MatrixStorage,
+) -> tuple[MatrixStorage, MatrixStorage, MatrixStorage, MatrixStorage]:
+    """
+    Splits a storage with even dimensions into four quadrant views.
+    """
+
+    height, width = storage.height // 2, storage.width // 2
+
+    return (
+        storage.block(0, 0, height, width),
+        storage.block(0, width, height, width),
+        storage.block(height, 0, height, width),
+        storage.block(height, width, height, width),
+    )
+
+
+def _padded(storage: MatrixStorage, height: int, width: int) -> MatrixStorage:
+    """
+    Copies a storage into the top-left corner of a larger zero storage.
+    """
+
+    if (height, width) == (storage.height, storage.width):
+        return storage
+
+    padded = MatrixStorage.zeros(height, width)
+    padded.block(0, 0, storage.height, storage.width).assign(storage.values())
+
+    return padded
@@ -0,0 +1,364 @@
+from array import array
+from itertools import repeat
+from types import TracebackType
+from typing import BinaryIO, Iterable, Iterator, Optional, Type, Union
+
+from project.matrix_vector_operations.backends import get_backend
+from project.matrix_vector_operations.matrix_io import (
+    Path,
+    load_storage,
+    pack_header,
+    write_values,
+)
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.vector_operations import Vector
+
+# A row of numbers, or of their text as read by `csv.reader`.
+Row = Iterable[Union[float, str]]
+
+# A matrix already in memory (or memory-mapped), or a stream of its rows.
+RowSource = Union[Matrix, Iterable[Row]]
+
+# Rows per chunk processed at once by the streaming reductions.
+CHUNK_ROWS = 1024
+
+
+class MatrixBuilder:
+    """
+    A class to build a matrix from rows arriving one at a time, for example
+    from a CSV reader or a generator. Each row is checked against the width
+    as it arrives and packed straight into a flat buffer of doubles, or
+    written to a binary matrix file (see `matrix_io`) when a path is given,
+    so the rows never need to be held as Python lists all at once.
+
+    Methods:
+    -------
+    `width -> Optional[int]`:
+        Property returning the row length, once known.
+
+    `append(row: Row) -> None`:
+        Adds a row to the bottom of the matrix.
+
+    `extend(rows: Iterable[Row]) -> None`:
+        Adds several rows to the bottom of the matrix.
+
+    `build() -> Matrix`:
+        Returns the matrix built so far and starts a new one.
+
+    `close() -> None`:
+        Discards the rows not built and closes the file, if any.
+
+    The builder is a context manager that closes it on exit.
+    """
+
+    def __init__(
+        self, width: Optional[int] = None, path: Optional[Path] = None
+    ) -> None:
+        """
+        Initializes an empty builder. The width is taken from the first row
+        unless given. With `path` the rows are written to that file and the
+        built matrix is memory-mapped from it.
+        """
+
+        self._width = width
+        self._height = 0
+        self._data = array("d")
+        self._path = path
+        self._file: Optional[BinaryIO] = None
+
+        if path is not None:
+            self._file = open(path, "wb")
+            # The real shape is filled in by `build`.
+            self._file.write(pack_header(0, 0))
+
+    @property
+    def width(self) -> Optional[int]:
+        """
+        Returns the length of the rows, or None before the first row.
+        """
+
+        return self._width
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows added so far.
+        """
+
+        return self._height
+
+    def append(self, row: Row) -> None:
+        """
+        Adds a row to the bottom of the matrix. Its elements are converted
+        with `float`, so rows of text, such as those of `csv.reader`, are
+        accepted.
+
+        Raises:
+        ValueError: If the row is empty, its length differs from the width
+            or an element is not a number, or if the builder is file-backed
+            and was already built or closed.
+        """
+
+        if self._path is not None and self._file is None:
+            raise ValueError(
+                "The file of this builder was already built or closed: "
+                "use a new builder."
+            )
+
+        values = array("d", map(float, row))
+
+        if not values:
+            raise ValueError("Matrix rows must not be empty.")
+
+        if self._width is None:
+            self._width = len(values)
+        elif len(values) != self._width:
+            raise ValueError(
+                f"Row {self._height} has {len(values)} elements, "
+                f"expected {self._width}."
+            )
+
+        if self._file is None:
+            self._data.extend(values)
+        else:
+            write_values(self._file, values)
+
+        self._height += 1
+
+    def extend(self, rows: Iterable[Row]) -> None:
+        """
+        Adds several rows to the bottom of the matrix.
+        """
+
+        for row in rows:
+            self.append(row)
+
+    def build(self) -> Matrix:
+        """
+        Returns the matrix made of the rows added so far, without copying
+        them, and leaves the builder empty. A file-backed builder is closed
+        and the matrix is memory-mapped from its file: the builder can't be
+        reused, since its file now belongs to the matrix.
+
+        Raises:
+        ValueError: If no rows were added.
+        """
+
+        if self._width is None or self._height == 0:
+            raise ValueError("Cannot build a matrix without rows.")
+
+        if self._file is not None and self._path is not None:
+            self._file.seek(0)
+            self._file.write(pack_header(self._height, self._width))
+            self._file.close()
+            self._file = None
+            self._height = 0
+
+            return Matrix._from_storage(load_storage(self._path))
+
+        # The matrix takes over the buffer.
+        data, self._data = self._data, array("d")
+        height, self._height = self._height, 0
+
+        return Matrix.from_buffer(data, height, self._width)
+
+    def close(self) -> None:
+        """
+        Discards the rows not built yet and closes the file of a file-backed
+        builder, which then can't be used any more.
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._data = array("d")
+        self._height = 0
+
+    def __enter__(self) -> "MatrixBuilder":
+        """
+        Returns the builder, closed when the `with` block exits.
+        """
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Closes the builder.
+        """
+
+        self.close()
+
+
+def build_matrix(rows: Iterable[Row], path: Optional[Path] = None) -> Matrix:
+    """
+    Builds a matrix from a stream of rows with a `MatrixBuilder`.
+
+    Args:
+        rows: Non-empty iterable of rows of equal length.
+        path: Optional binary matrix file to stream the rows into.
+
+    Returns:
+        A new matrix, memory-mapped from `path` when it is given.
+
+    Raises:
+    ValueError: If there are no rows, or they are empty or of different
+        lengths.
+    """
+
+    with MatrixBuilder(path=path) as builder:
+        builder.extend(rows)
+        return builder.build()
+
+
+def chunks(
+    source: RowSource, chunk_rows: int = CHUNK_ROWS
+) -> Iterator[MatrixStorage]:
+    """
+    Splits a matrix or a stream of rows into storages of at most
+    `chunk_rows` rows. Chunks of a matrix are views of its buffer; rows
+    from a stream are packed one chunk at a time.
+
+    Raises:
+    ValueError: If `chunk_rows` is not positive, or the rows are empty or of
+        different lengths.
+    """
+
+    if chunk_rows <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    if isinstance(source, Matrix):
+        storage = source._storage
+        for start in range(0, storage.height, chunk_rows):
+            height = min(chunk_rows, storage.height - start)
+            yield storage.block(start, 0, height, storage.width)
+        return
+
+    builder = MatrixBuilder()
+    for row in source:
+        builder.append(row)
+
+        if len(builder) == chunk_rows:
+            yield builder.build()._storage
+            builder = MatrixBuilder(builder.width)
+
+    if len(builder):
+        yield builder.build()._storage
+
+
+def row_sums(
+    source: RowSource,
+    chunk_rows: int = CHUNK_ROWS,
+    backend: Optional[str] = None,
+) -> Iterator[float]:
+    """
+    Lazily yields the sum of every row, holding one chunk at a time.
+    """
+
+    ones = None
+    for chunk in chunks(source, chunk_rows):
+        if ones is None:
+            ones = _ones(chunk.width)
+        yield from get_backend(backend).row_dots(chunk, ones)
+
+
+def column_sums(
+    source: RowSource,
+    chunk_rows: int = CHUNK_ROWS,
+    backend: Optional[str] = None,
+) -> Vector:
+    """
+    Returns the sums of the columns as a row vector, holding one chunk of
+    rows and the running sums at a time.
+
+    Raises:
+    ValueError: If the source has no rows.
+    """
+
+    total = None
+    for chunk in chunks(source, chunk_rows):
+        sums = get_backend(backend).row_dots(
+            chunk.transposed(), _ones(chunk.height)
+        )
+
+        if total is None:
+            total = MatrixStorage.from_buffer(sums, 1, chunk.width)
+        else:
+            get_backend(backend).add(
+                total, MatrixStorage.from_buffer(sums, 1, chunk.width), total
+            )
+
+    if total is None:
+        raise ValueError("Cannot reduce a matrix without rows.")
+
+    return Vector._from_storage(total)
+
+
+def gram(
+    source: RowSource,
+    chunk_rows: int = CHUNK_ROWS,
+    backend: Optional[str] = None,
+) -> Matrix:
+    """
+    Returns the Gram matrix A.T * A of the matrix A whose rows are given.
+    It is accumulated chunk by chunk as the sum of C.T * C over the chunks
+    C, so memory is bounded by one chunk plus the width x width result.
+
+    Raises:
+    ValueError: If the source has no rows.
+    """
+
+    total = None
+    for chunk in chunks(source, chunk_rows):
+        tile_size = (
+            Matrix.TILE_SIZE
+            if chunk.width >= Matrix.TILED_MATMUL_THRESHOLD
+            else None
+        )
+        product = get_backend(backend).matmul(
+            chunk.transposed(), chunk, tile_size
+        )
+
+        if total is None:
+            total = product
+        else:
+            get_backend(backend).add(total, product, total)
+
+    if total is None:
+        raise ValueError("Cannot reduce a matrix without rows.")
+
+    return Matrix._from_storage(total)
+
+
+def matvec(
+    source: RowSource,
+    vector: Vector,
+    chunk_rows: int = CHUNK_ROWS,
+    backend: Optional[str] = None,
+) -> Iterator[float]:
+    """
+    Lazily yields the elements of the product A * v of the matrix A whose
+    rows are given with a vector v, holding one chunk at a time.
+
+    Raises:
+    ValueError: If the length of `vector` differs from the row length.
+    """
+
+    for chunk in chunks(source, chunk_rows):
+        if vector.height * vector.width != chunk.width:
+            raise ValueError("Matrix and vector can't be multiplied.")
+
+        yield from get_backend(backend).row_dots(chunk, vector._storage)
+
+
+def _ones(size: int) -> MatrixStorage:
+    """
+    Returns a column of ones, used to sum rows as dot products.
+    """
+
+    return MatrixStorage.from_iterable(repeat(1.0, size), size, 1)
@@ -0,0 +1,302 @@
+from array import array
+from typing import Iterable, List, Optional, Union
+
+from project.matrix_vector_operations.backends import get_backend
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.vector_operations import Vector
+
+
+class VectorBatch:
+    """
+    A class to represent a batch of equal-length vectors, stacked row by row
+    in one flat `array('d')`. Queries against the whole batch are computed
+    by the backend in a single pass and returned as packed arrays, so no
+    Python object is allocated per vector or per element of the result.
+
+    Methods:
+    -------
+    `from_vectors(vectors: Iterable[Vector]) -> VectorBatch`:
+        Class method to stack vectors into a new batch.
+
+    `from_matrix(matrix: Matrix) -> VectorBatch`:
+        Class method to build a batch from the rows of a matrix.
+
+    `dimension -> int`:
+        Property returning the length of every vector in the batch.
+
+    `__delitem__(index: int) -> None`:
+        Removes the vector at `index`.
+
+    `append(vector: Vector) -> None`:
+        Adds a vector to the end of the batch.
+
+    `extend(vectors: Iterable[Vector]) -> None`:
+        Adds several vectors to the end of the batch.
+
+    `dot(query: Vector, backend: Optional[str] = None) -> array`:
+        Returns the dot products of every vector with `query`.
+
+    `norms(backend: Optional[str] = None) -> array`:
+        Returns the magnitudes of every vector, cached across queries.
+
+    `cosine_similarity(query: Vector, backend: Optional[str] = None) -> array`:
+        Returns the cosine similarities of every vector with `query`.
+
+    `angles(query: Vector, backend: Optional[str] = None) -> array`:
+        Returns the angles (in radians) between every vector and `query`.
+
+    `to_list() -> List[List[float]]`:
+        Returns the vectors of the batch as a list of lists.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        """
+        Initializes an empty batch of vectors of the given length.
+        """
+
+        if dimension <= 0:
+            raise ValueError("Vector dimension must be positive.")
+
+        self._dimension = dimension
+        self._data = array("d")
+        self._norms: Optional["array[float]"] = None
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> "VectorBatch":
+        """
+        Stacks vectors into a new batch. The dimension is taken from the
+        first vector.
+
+        Args:
+            vectors: Non-empty iterable of vectors of equal length.
+
+        Returns:
+            A new batch holding copies of the vectors.
+
+        Raises:
+        ValueError: If there are no vectors or their lengths differ.
+        """
+
+        vectors = list(vectors)
+        if not vectors:
+            raise ValueError("Cannot infer the dimension of an empty batch.")
+
+        first = vectors[0]
+        batch = cls(first.height * first.width)
+        batch.extend(vectors)
+
+        return batch
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> "VectorBatch":
+        """
+        Builds a batch whose vectors are the rows of `matrix`.
+        """
+
+        batch = cls(matrix.width)
+        storage = matrix._storage
+
+        if storage.is_contiguous:
+            start = storage.offset
+            values = storage.data[
+                start : start + storage.height * storage.width
+            ]
+            batch._data.frombytes(values.cast("B"))
+        else:
+            batch._data.extend(storage.values())
+
+        return batch
+
+    @property
+    def dimension(self) -> int:
+        """
+        Returns the length of every vector in the batch.
+        """
+
+        return self._dimension
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the batch.
+        """
+
+        return len(self._data) // self._dimension
+
+    def __getitem__(self, index: int) -> Vector:
+        """
+        Returns a copy of the vector at `index` as a row vector.
+        """
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("Vector index out of range.")
+
+        start = (index % len(self)) * self._dimension
+
+        return Vector([self._data[start : start + self._dimension].tolist()])
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Removes the vector at `index`, shifting the following ones down.
+        """
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("Vector index out of range.")
+
+        index %= len(self)
+        start = index * self._dimension
+        del self._data[start : start + self._dimension]
+
+        if self._norms is not None:
+            del self._norms[index]
+
+    def append(self, vector: Vector) -> None:
+        """
+        Adds a copy of `vector` to the end of the batch.
+        """
+
+        self.extend((vector,))
+
+    def extend(self, vectors: Iterable[Vector]) -> None:
+        """
+        Adds copies of `vectors` to the end of the batch. Nothing is added if
+        any of them has the wrong length.
+        """
+
+        vectors = list(vectors)
+        for vector in vectors:
+            self._check_dimension(vector)
+
+        for vector in vectors:
+            self._data.extend(vector._storage.values())
+
+        # Keep the cached norms in step instead of recomputing all of them.
+        if self._norms is not None:
+            self._norms.extend(vector.length() for vector in vectors)
+
+    def dot(
+        self, query: Vector, backend: Optional[str] = None
+    ) -> "array[float]":
+        """
+        Returns the dot products of every vector in the batch with `query`.
+        """
+
+        self._check_dimension(query)
+        if not self._data:
+            return array("d")
+
+        return get_backend(backend).row_dots(self._storage(), query._storage)
+
+    def norms(self, backend: Optional[str] = None) -> "array[float]":
+        """
+        Returns the magnitudes of every vector in the batch. They are
+        computed once and then kept up to date as vectors are added and
+        removed.
+        """
+
+        if self._norms is None:
+            if not self._data:
+                return array("d")
+
+            self._norms = get_backend(backend).row_norms(self._storage())
+
+        return self._norms
+
+    def cosine_similarity(
+        self, query: Vector, backend: Optional[str] = None
+    ) -> "array[float]":
+        """
+        Returns the cosine similarities of every vector in the batch with
+        `query`. The similarity with a zero vector is NaN.
+        """
+
+        dots = self.dot(query, backend)
+        if not dots:
+            return dots
+
+        return get_backend(backend).cosines(
+            dots, self.norms(backend), query.length(backend)
+        )
+
+    def angles(
+        self, query: Vector, backend: Optional[str] = None
+    ) -> "array[float]":
+        """
+        Returns the angles (in radians) between every vector in the batch and
+        `query`. The angle with a zero vector is NaN.
+        """
+
+        cosines = self.cosine_similarity(query, backend)
+        if not cosines:
+            return cosines
+
+        return get_backend(backend).arccos(cosines)
+
+    def to_list(self) -> List[List[float]]:
+        """
+        Returns the vectors of the batch as a list of lists.
+        """
+
+        return [
+            self._data[start : start + self._dimension].tolist()
+            for start in range(0, len(self._data), self._dimension)
+        ]
+
+    def _storage(self) -> MatrixStorage:
+        """
+        Wraps the non-empty batch in a storage, one vector per row.
+        """
+
+        return MatrixStorage.from_buffer(
+            self._data, len(self), self._dimension
+        )
+
+    def _check_dimension(self, vector: Vector) -> None:
+        """
+        Raises ValueError if `vector` does not have the batch's dimension.
+        """
+
+        if vector.height * vector.width != self._dimension:
+            raise ValueError("Vector has wrong dimension.")
+
+
+def matvec_many(
+    matrix: Matrix,
+    vectors: Union[VectorBatch, Iterable[Vector]],
+    backend: Optional[str] = None,
+) -> VectorBatch:
+    """
+    Applies one matrix to many vectors in a single pass.
+
+    Stacking the vectors as the rows of a matrix V turns the products
+    matrix * v into the rows of V * matrix.T, computed by one call to the
+    backend's multiplication instead of a `matmul` per vector.
+
+    Args:
+        matrix: The matrix of shape (n, m) to apply.
+        vectors: A batch or an iterable of vectors with m elements each.
+        backend: The name of the backend to use, or None for the current one.
+
+    Returns:
+        A batch of vectors with n elements each, one per input vector.
+
+    Raises:
+    ValueError: If a vector does not have `matrix.width` elements.
+    """
+
+    if not isinstance(vectors, VectorBatch):
+        batch = VectorBatch(matrix.width)
+        batch.extend(vectors)
+        vectors = batch
+
+    if vectors.dimension != matrix.width:
+        raise ValueError("Matrix and vectors can't be multiplied.")
+
+    if not len(vectors):
+        return VectorBatch(matrix.height)
+
+    product = get_backend(backend).matmul(
+        vectors._storage(), matrix._storage.transposed(), None
+    )
+
+    return VectorBatch.from_matrix(Matrix._from_storage(product))
@@ -0,0 +1,315 @@
+from heapq import nlargest
+from itertools import chain
+from math import acos, isnan
+from operator import itemgetter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from project.matrix_vector_operations.vector_batch import VectorBatch
+from project.matrix_vector_operations.vector_operations import Vector
+
+METRICS = ("angle", "dot")
+
+
+class VectorIndex:
+    """
+    A class to represent a searchable collection of keyed vectors. Queries
+    return the `k` vectors with the smallest angle to (or the largest dot
+    product with) a query vector.
+
+    Vectors are kept in `VectorBatch` partitions whose norms are computed
+    once, so a query costs one batched pass over the candidates and a heap
+    selection of the best `k`, instead of a `Vector.angle` call per vector.
+    After `partition` the vectors are grouped around centroids (an inverted
+    file index), and a query only scans the `probes` partitions whose
+    centroids are closest to it.
+
+    Methods:
+    -------
+    `add(key: Hashable, vector: Vector) -> None`:
+        Inserts a vector under a new key.
+
+    `remove(key: Hashable) -> None`:
+        Deletes the vector stored under a key.
+
+    `search(query: Vector, k: int, probes: int = 1,
+            backend: Optional[str] = None) -> List[Tuple[Hashable, float]]`:
+        Returns the keys and scores of the `k` best matches, best first.
+
+    `partition(count: int, iterations: int = 10,
+               backend: Optional[str] = None) -> None`:
+        Groups the stored vectors into `count` partitions for faster search.
+    """
+
+    def __init__(self, dimension: int, metric: str = "angle") -> None:
+        """
+        Initializes an empty index of vectors of the given length. `metric`
+        is "angle" (smallest angle first) or "dot" (largest dot product
+        first).
+        """
+
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unknown metric {metric!r}; expected one of {METRICS}."
+            )
+
+        self._dimension = dimension
+        self._metric = metric
+        self._batches = [VectorBatch(dimension)]
+        self._keys: List[List[Hashable]] = [[]]
+        self._partition_of: Dict[Hashable, int] = {}
+        self._centroids: Optional[VectorBatch] = None
+
+    @property
+    def metric(self) -> str:
+        """
+        Returns the metric the index ranks vectors by.
+        """
+
+        return self._metric
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the index.
+        """
+
+        return len(self._partition_of)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks whether a vector is stored under `key`.
+        """
+
+        return key in self._partition_of
+
+    def add(self, key: Hashable, vector: Vector) -> None:
+        """
+        Inserts `vector` under `key`. In a partitioned index it goes to the
+        partition with the closest centroid.
+
+        Args:
+            key: A key not yet in the index.
+            vector: A vector of the index's dimension.
+
+        Raises:
+        KeyError: If `key` is already in the index.
+        ValueError: If `vector` has the wrong dimension.
+        """
+
+        if key in self._partition_of:
+            raise KeyError(f"Key {key!r} is already in the index.")
+
+        partition = self._closest_partitions(vector, 1)[0]
+        self._batches[partition].append(vector)
+        self._keys[partition].append(key)
+        self._partition_of[key] = partition
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Deletes the vector stored under `key`.
+
+        Raises:
+        KeyError: If `key` is not in the index.
+        """
+
+        partition = self._partition_of.pop(key)
+        keys = self._keys[partition]
+        position = keys.index(key)
+
+        del keys[position]
+        del self._batches[partition][position]
+
+    def search(
+        self,
+        query: Vector,
+        k: int,
+        probes: int = 1,
+        backend: Optional[str] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Finds the `k` stored vectors closest to `query`.
+
+        Args:
+            query: A vector of the index's dimension.
+            k: The number of matches to return.
+            probes: The number of partitions to scan. It only matters after
+                `partition`; more probes trade speed for recall.
+            backend: The name of the backend to use, or None for the current
+                one.
+
+        Returns:
+            Up to `k` pairs of key and score, best first. The score is the
+            angle in radians or the dot product, depending on the metric.
+            Zero vectors have no angle and never match by angle.
+
+        Raises:
+        ValueError: If `k` or `probes` is not positive, `query` has the
+            wrong dimension, or it is a zero vector searched by angle.
+        """
+
+        if k <= 0 or probes <= 0:
+            raise ValueError("Both k and probes must be positive.")
+
+        if self._metric == "angle" and query.length(backend) == 0:
+            raise ValueError("A zero vector has no angle to search by.")
+
+        candidates = chain.from_iterable(
+            zip(self._scores(partition, query, backend), self._keys[partition])
+            for partition in self._closest_partitions(query, probes, backend)
+        )
+
+        # Ranking by cosine gives the same order as ranking by angle, so
+        # only the winners are converted. NaN marks zero vectors.
+        best = nlargest(
+            k,
+            (pair for pair in candidates if not isnan(pair[0])),
+            key=itemgetter(0),
+        )
+
+        if self._metric == "dot":
+            return [(key, score) for score, key in best]
+
+        return [(key, acos(max(-1.0, min(1.0, score)))) for score, key in best]
+
+    def partition(
+        self, count: int, iterations: int = 10, backend: Optional[str] = None
+    ) -> None:
+        """
+        Groups the stored vectors into `count` partitions by spherical
+        k-means, so that searches only scan the partitions closest to the
+        query. Vectors added later join their closest partition; calling
+        this again rebuilds the partitions around the current contents.
+
+        Args:
+            count: The number of partitions, at most the number of vectors.
+            iterations: The number of k-means refinement passes.
+            backend: The name of the backend to use, or None for the current
+                one.
+
+        Raises:
+        ValueError: If `count` is not between 1 and the number of vectors,
+            or `iterations` is negative.
+        """
+
+        if not 1 <= count <= len(self) or iterations < 0:
+            raise ValueError("Invalid number of partitions or iterations.")
+
+        keys = list(chain.from_iterable(self._keys))
+        vectors = VectorBatch(self._dimension)
+        vectors.extend(
+            vector for batch in self._batches for vector in _vectors(batch)
+        )
+
+        # Start from vectors spread evenly through the index.
+        step = len(keys) // count
+        centroids = VectorBatch(self._dimension)
+        centroids.extend(_unit(vectors[i * step]) for i in range(count))
+        assignment = _assign(vectors, centroids, backend)
+
+        for _ in range(iterations):
+            centroids = _centroids(vectors, assignment, centroids, backend)
+            refined = _assign(vectors, centroids, backend)
+            if refined == assignment:
+                break
+            assignment = refined
+
+        self._centroids = centroids
+        self._batches = [VectorBatch(self._dimension) for _ in range(count)]
+        self._keys = [[] for _ in range(count)]
+
+        for position, (key, partition) in enumerate(zip(keys, assignment)):
+            self._batches[partition].append(vectors[position])
+            self._keys[partition].append(key)
+            self._partition_of[key] = partition
+
+    def _scores(
+        self, partition: int, query: Vector, backend: Optional[str]
+    ) -> Iterable[float]:
+        """
+        Returns the cosine similarities or the dot products of the vectors
+        of a partition with `query`.
+        """
+
+        batch = self._batches[partition]
+        if self._metric == "dot":
+            return batch.dot(query, backend)
+
+        return batch.cosine_similarity(query, backend)
+
+    def _closest_partitions(
+        self, vector: Vector, count: int, backend: Optional[str] = None
+    ) -> List[int]:
+        """
+        Returns the indices of the `count` partitions whose centroids are
+        closest to `vector`.
+        """
+
+        if vector.height * vector.width != self._dimension:
+            raise ValueError("Vector has wrong dimension.")
+
+        if self._centroids is None:
+            return [0]
+
+        # Centroids have unit length, so the dot product ranks them by angle.
+        dots = self._centroids.dot(vector, backend)
+        return nlargest(count, range(len(dots)), key=dots.__getitem__)
+
+
+def _vectors(batch: VectorBatch) -> Iterable[Vector]:
+    """
+    Yields the vectors of a batch.
+    """
+
+    return (batch[i] for i in range(len(batch)))
+
+
+def _unit(vector: Vector) -> Vector:
+    """
+    Returns a copy of `vector` scaled to unit length, or a zero vector.
+    """
+
+    unit = Vector([[0.0] * (vector.height * vector.width)])
+    length = vector.length()
+    if length:
+        unit.add_scaled(1 / length, vector)
+
+    return unit
+
+
+def _assign(
+    vectors: VectorBatch, centroids: VectorBatch, backend: Optional[str]
+) -> List[int]:
+    """
+    Returns the index of the closest unit centroid for every vector.
+    """
+
+    # One batched pass per centroid; a vector's own norm scales all its dot
+    # products alike, so the largest one marks the smallest angle.
+    dots = [vectors.dot(centroid, backend) for centroid in _vectors(centroids)]
+    return [row.index(max(row)) for row in zip(*dots)]
+
+
+def _centroids(
+    vectors: VectorBatch,
+    assignment: List[int],
+    previous: VectorBatch,
+    backend: Optional[str],
+) -> VectorBatch:
+    """
+    Returns the normalized mean direction of every partition. Partitions
+    left empty keep their previous centroid.
+    """
+
+    sums = [Vector([[0.0] * vectors.dimension]) for _ in range(len(previous))]
+    norms = vectors.norms(backend)
+
+    for position, partition in enumerate(assignment):
+        if norms[position]:
+            sums[partition].add_scaled(1 / norms[position], vectors[position])
+
+    centroids = VectorBatch(vectors.dimension)
+    centroids.extend(
+        _unit(total) if total.length() else previous[partition]
+        for partition, total in enumerate(sums)
+    )
+
+    return centroids
@@ -1,8 +1,8 @@
-from typing import List
-from math import acos, hypot, sumprod
-from itertools import chain
+from typing import List, Optional, Self
 
 from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.backends import get_backend
 
 
 class Vector(Matrix):
@@ -13,13 +13,13 @@ class Vector(Matrix):
 
     Methods:
     -------
-    `length() -> float`:
+    `length(backend: Optional[str] = None) -> float`:
         Returns the magnitude (length) of the vector.
 
-    `dot_product(a: "Vector", b: "Vector") -> float`:
+    `dot_product(a: "Vector", b: "Vector", backend: Optional[str] = None) -> float`:
         Static method to calculate the dot product of two vectors.
 
-    `angle(a: "Vector", b: "Vector") -> float`:
+    `angle(a: "Vector", b: "Vector", backend: Optional[str] = None) -> float`:
         Static method to calculate the angle (in radians) between two vectors.
 
     `is_vector(list_of_lists: List[List[float]]) -> bool`:
@@ -36,15 +36,28 @@ class Vector(Matrix):
         if not Vector.is_vector(list_of_lists):
             raise TypeError("Input must be a valid vector.")
 
-    def length(self) -> float:
+    @classmethod
+    def _from_storage(cls, storage: MatrixStorage) -> Self:
+        """
+        Wraps an existing storage, checking that it has a vector shape.
+        """
+
+        if storage.height != 1 and storage.width != 1:
+            raise TypeError("Input must be a valid vector.")
+
+        return super()._from_storage(storage)
+
+    def length(self, backend: Optional[str] = None) -> float:
         """
         Returns the magnitude (length) of the vector.
         """
 
-        return hypot(*chain.from_iterable(self._matrix))
+        return get_backend(backend).norm(self._storage)
 
     @staticmethod
-    def dot_product(a: "Vector", b: "Vector") -> float:
+    def dot_product(
+        a: "Vector", b: "Vector", backend: Optional[str] = None
+    ) -> float:
         """
         Calculates the dot product of two vectors.
         """
@@ -52,17 +65,20 @@ class Vector(Matrix):
         if not a._has_same_dimension(b):
             raise ValueError("Vectors have incompatible dimensions.")
 
-        return sumprod(
-            chain.from_iterable(a._matrix), chain.from_iterable(b._matrix)
-        )
+        return get_backend(backend).dot(a._storage, b._storage)
 
     @staticmethod
-    def angle(a: "Vector", b: "Vector") -> float:
+    def angle(
+        a: "Vector", b: "Vector", backend: Optional[str] = None
+    ) -> float:
         """
         Calculates the angle (in radians) between two vectors.
         """
 
-        return acos(Vector.dot_product(a, b) / (a.length() * b.length()))
+        if not a._has_same_dimension(b):
+            raise ValueError("Vectors have incompatible dimensions.")
+
+        return get_backend(backend).angle(a._storage, b._storage)
 
     @staticmethod
     def is_vector(list_of_lists: List[List[float]]) -> bool:
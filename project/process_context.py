@@ -0,0 +1,9 @@
+from multiprocessing import get_all_start_methods, get_context
+
+# The context worker processes are started from, by every process pool of
+# the project. Forking a parent that already runs threads (NumPy's BLAS
+# does) may deadlock, so workers are started by a fork server, or spawned
+# where there is none.
+PROCESS_CONTEXT = get_context(
+    "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+)
@@ -0,0 +1,249 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from random import Random
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.matrix_vector_operations.backends import (
+    available_backends,
+    get_backend,
+    use_backend,
+)
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.vector_operations import Vector
+
+BASELINE = shared.ROOT / "benchmark_baseline.json"
+
+MATRIX_SHAPES = [(8, 8), (64, 64), (256, 32), (32, 256)]
+VECTOR_LENGTHS = [16, 1024, 65536]
+
+
+def random_matrix(height, width, rng):
+    return Matrix(
+        [[rng.uniform(-1, 1) for _ in range(width)] for _ in range(height)]
+    )
+
+
+def random_vector(length, rng):
+    return Vector([[rng.uniform(-1, 1) for _ in range(length)]])
+
+
+def matrix_add(shape, rng):
+    a, b = random_matrix(*shape, rng), random_matrix(*shape, rng)
+    return lambda: a + b
+
+
+def matrix_iadd(shape, rng):
+    a, b = random_matrix(*shape, rng), random_matrix(*shape, rng)
+
+    def iadd():
+        nonlocal a
+        a += b
+
+    return iadd
+
+
+def matrix_mul(shape, rng):
+    height, width = shape
+    a, b = random_matrix(height, width, rng), random_matrix(width, height, rng)
+    return lambda: a * b
+
+
+def matrix_transpose(shape, rng):
+    a = random_matrix(*shape, rng)
+    return a.transpose
+
+
+def vector_dot_product(length, rng):
+    a, b = random_vector(length, rng), random_vector(length, rng)
+    return lambda: Vector.dot_product(a, b)
+
+
+def vector_length(length, rng):
+    a = random_vector(length, rng)
+    return a.length
+
+
+def vector_angle(length, rng):
+    a, b = random_vector(length, rng), random_vector(length, rng)
+    return lambda: Vector.angle(a, b)
+
+
+# Every benchmark: its name, the function building the operation to time,
+# and the shapes it is run at.
+BENCHMARKS = [
+    ("Matrix.__add__", matrix_add, MATRIX_SHAPES),
+    ("Matrix.__iadd__", matrix_iadd, MATRIX_SHAPES),
+    ("Matrix.__mul__", matrix_mul, MATRIX_SHAPES),
+    ("Matrix.transpose", matrix_transpose, MATRIX_SHAPES),
+    ("Vector.dot_product", vector_dot_product, VECTOR_LENGTHS),
+    ("Vector.length", vector_length, VECTOR_LENGTHS),
+    ("Vector.angle", vector_angle, VECTOR_LENGTHS),
+]
+
+
+def shape_name(shape):
+    if isinstance(shape, tuple):
+        return "x".join(map(str, shape))
+    return str(shape)
+
+
+def measure(operation, repeat):
+    """
+    Returns the best throughput over `repeat` runs of at least 0.2 seconds
+    each, and the peak memory allocated by a single call.
+    """
+
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"ops_per_sec": number / best, "peak_bytes": peak}
+
+
+def run(args):
+    results = {}
+
+    with use_backend(args.backend):
+        for name, build, shapes in BENCHMARKS:
+            for shape in shapes:
+                key = f"{name}[{shape_name(shape)}]"
+                if args.filter and args.filter not in key:
+                    continue
+
+                operation = build(shape, Random(0))
+                results[key] = measure(operation, args.repeat)
+                print(
+                    f"{key:<32} {results[key]['ops_per_sec']:>14,.1f} ops/s "
+                    f"{results[key]['peak_bytes']:>12,} B",
+                    flush=True,
+                )
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "backend": args.backend,
+        "results": results,
+    }
+
+
+def compare(baseline, current, tolerance):
+    """
+    Prints every benchmark of `current` next to `baseline` and returns the
+    names of those that got slower, or use more memory, by more than
+    `tolerance` (a fraction).
+    """
+
+    print(
+        f"{'benchmark':<32} {'baseline ops/s':>14} {'ops/s':>14} "
+        f"{'change':>8} {'memory':>8}"
+    )
+
+    regressions = []
+    for key, result in current["results"].items():
+        if key not in baseline["results"]:
+            print(f"{key:<32} {'(new)':>14}")
+            continue
+
+        before = baseline["results"][key]
+        speed = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        memory = (result["peak_bytes"] + 1) / (before["peak_bytes"] + 1) - 1
+
+        regressed = speed < -tolerance or memory > tolerance
+        if regressed:
+            regressions.append(key)
+
+        print(
+            f"{key:<32} {before['ops_per_sec']:>14,.1f} "
+            f"{result['ops_per_sec']:>14,.1f} {speed:>+8.1%} {memory:>+8.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark matrix and vector operations, save the "
+        "results as a JSON baseline and compare later runs against it."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="run the benchmarks and save the results"
+    )
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="run the benchmarks (or load a saved run) and compare them "
+        "with the baseline; exits with status 1 on a regression",
+    )
+
+    for subparser in (run_parser, compare_parser):
+        subparser.add_argument(
+            "--backend",
+            choices=available_backends(),
+            default=get_backend().name,
+        )
+        subparser.add_argument("--repeat", type=int, default=5)
+        subparser.add_argument(
+            "--filter", help="only run benchmarks whose name contains this"
+        )
+        subparser.add_argument("--baseline", default=BASELINE)
+
+    run_parser.add_argument(
+        "--output", help="where to save the results (default: the baseline)"
+    )
+    compare_parser.add_argument(
+        "--current", help="a saved run to compare instead of running again"
+    )
+    compare_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="allowed slowdown or memory growth, as a fraction",
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        output = args.output or args.baseline
+        with open(output, "w") as file:
+            json.dump(run(args), file, indent=2)
+        print(f"Saved to {output}")
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    if args.current:
+        with open(args.current) as file:
+            current = json.load(file)
+    else:
+        if baseline["backend"] != args.backend:
+            print(
+                f"Warning: the baseline used the {baseline['backend']} backend"
+            )
+        current = run(args)
+        print()
+
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import sys
+import timeit
+from random import Random
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.matrix_vector_operations.backends import available_backends
+from project.matrix_vector_operations.matrix_operations import Matrix
+
+
+def random_matrix(size, rng):
+    return Matrix(
+        [[rng.uniform(-1, 1) for _ in range(size)] for _ in range(size)]
+    )
+
+
+def best_time(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare Strassen and standard multiplication of square "
+        "matrices to find where Strassen starts to pay off."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[64, 128, 192, 256, 384, 512],
+    )
+    parser.add_argument("--cutoff", type=int, default=Matrix.STRASSEN_CUTOFF)
+    parser.add_argument(
+        "--backend", choices=available_backends(), default="python"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    Matrix.STRASSEN_CUTOFF = args.cutoff
+    rng = Random(0)
+
+    print(f"backend={args.backend} cutoff={args.cutoff}")
+    print(
+        f"{'size':>6} {'standard, s':>12} {'strassen, s':>12} {'speedup':>8}"
+    )
+
+    for size in args.sizes:
+        a, b = random_matrix(size, rng), random_matrix(size, rng)
+
+        standard = best_time(
+            lambda: a.matmul(b, backend=args.backend), args.repeat
+        )
+        strassen = best_time(
+            lambda: a.matmul(b, backend=args.backend, algorithm="strassen"),
+            args.repeat,
+        )
+        print(
+            f"{size:>6} {standard:>12.4f} {strassen:>12.4f} "
+            f"{standard / strassen:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
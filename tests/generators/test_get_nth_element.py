@@ -0,0 +1,101 @@
+import pytest
+from typing import Generator, Iterator, List, Optional
+
+from project.generators.get_nth_element import get_nth_element
+from project.generators.rgba_gen import RGBA_COUNT, RGBASequence
+
+
+class CountingRange:
+    """An iterator over range(stop) that records how it is advanced."""
+
+    def __init__(self, stop: int) -> None:
+        self.value = 0
+        self.stop = stop
+        self.skips: List[int] = []
+
+    def __iter__(self) -> Iterator[int]:
+        return self
+
+    def __next__(self) -> int:
+        if self.value >= self.stop:
+            raise StopIteration
+
+        self.value += 1
+        return self.value - 1
+
+    def skip(self, k: int) -> None:
+        self.skips.append(k)
+        self.value += k
+
+
+class TestGetNthElement:
+    def test_forward_only(self) -> None:
+        get = get_nth_element(lambda: iter(range(100)))
+
+        assert get(3) == 2
+        assert get(50) == 49
+        assert get(51) == 50
+
+        with pytest.raises(IndexError):
+            get(51)
+
+        with pytest.raises(IndexError):
+            get(101)
+
+    def test_none_elements(self) -> None:
+        def gen() -> Generator[Optional[int], None, None]:
+            yield None
+            yield 1
+
+        get = get_nth_element(gen)
+
+        assert get(1) is None
+        assert get(2) == 1
+
+    def test_memo_window(self) -> None:
+        get = get_nth_element(lambda: iter(range(100)), memo=3)
+
+        assert get(10) == 9
+        assert [get(8), get(9), get(10)] == [7, 8, 9]
+        assert get(12) == 11
+        assert get(10) == 9
+
+        with pytest.raises(IndexError):
+            get(9)
+
+        assert get(80) == 79
+        assert get(78) == 77
+
+        with pytest.raises(IndexError):
+            get(77)
+
+    def test_skippable_source(self) -> None:
+        source = CountingRange(1000)
+        get = get_nth_element(lambda: source)
+
+        assert get(500) == 499
+        assert get(502) == 501
+        assert source.skips == [499, 1]
+
+        with pytest.raises(IndexError):
+            get(2000)
+
+    def test_random_access_source(self) -> None:
+        get = get_nth_element(RGBASequence)
+
+        assert get(RGBA_COUNT) == (255, 255, 255, 100)
+        assert get(52) == (0, 0, 1, 0)
+        assert get(1) == (0, 0, 0, 0)
+
+        for invalid_index in (0, -1, RGBA_COUNT + 1):
+            with pytest.raises(IndexError):
+                get(invalid_index)
+
+    def test_mapping_source(self) -> None:
+        get = get_nth_element(lambda: {"a": 1, "b": 2})
+
+        # Mappings are iterated over their keys, not indexed
+        assert get(2) == "b"
+
+        with pytest.raises(IndexError):
+            get(3)
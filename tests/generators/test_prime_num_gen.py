@@ -1,7 +1,11 @@
+import math
 import pytest
+from itertools import islice
 
+from project.generators import prime_num_gen as prime_num_gen_module
 from project.generators.get_nth_element import get_nth_element
 from project.generators.prime_num_gen import prime_num_gen
+from project.generators.primes import Primes
 
 
 class TestPrimeNumGen:
@@ -44,6 +48,35 @@ class TestPrimeNumGen:
         with pytest.raises(IndexError):
             decorated_gen(index)
 
+    def test_prime_gen_segments(self) -> None:
+        """Test the sieve against trial division across several segments."""
+        primes = list(islice(prime_num_gen(), 8000))
+
+        candidates = range(2, primes[-1] + 1)
+        expected = [
+            n
+            for n in candidates
+            if all(n % d for d in range(2, math.isqrt(n) + 1))
+        ]
+        assert primes == expected
+
+    def test_prime_gen_far(self) -> None:
+        """Test a prime far beyond the first segment."""
+        assert next(islice(prime_num_gen(), 99999, None)) == 1299709
+
+    def test_prime_gen_parallel(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that worker processes produce the same ordered sequence."""
+        monkeypatch.setattr(
+            prime_num_gen_module, "PARALLEL_SEGMENT_SIZE", 10000
+        )
+
+        gen = prime_num_gen(workers=2)
+        assert list(islice(gen, 5000)) == list(islice(prime_num_gen(), 5000))
+        gen.close()
+
+        with pytest.raises(ValueError):
+            next(prime_num_gen(workers=0))
+
     @pytest.mark.parametrize(
         "invalid_index", [-1, 0]  # Invalid negative index and zero
     )
@@ -52,3 +85,14 @@ class TestPrimeNumGen:
         with pytest.raises(IndexError):
             decorated_gen = get_nth_element(prime_num_gen)
             decorated_gen(invalid_index)
+
+    def test_random_access(self) -> None:
+        """Test that a random-access source can be read in any order."""
+        decorated_gen = get_nth_element(Primes)
+
+        assert decorated_gen(100000) == 1299709
+        assert decorated_gen(500) == 3571
+        assert list(islice(Primes(), 5)) == [2, 3, 5, 7, 11]
+
+        with pytest.raises(IndexError):
+            decorated_gen(0)
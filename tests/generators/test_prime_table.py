@@ -0,0 +1,118 @@
+import pytest
+from itertools import islice
+from pathlib import Path
+from typing import Iterator
+
+from project.generators import primes
+from project.generators.prime_num_gen import prime_num_gen
+from project.generators.prime_table import BLOCK_SPAN, PrimeTable
+from project.generators.primes import primes_between
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> Iterator[PrimeTable]:
+    table = PrimeTable.create(tmp_path / "table.primes", 2 * BLOCK_SPAN + 1)
+    yield table
+    table.close()
+
+
+class TestPrimeTable:
+    def test_create(self, table: PrimeTable) -> None:
+        expected = list(primes_between(0, 3 * BLOCK_SPAN))
+
+        assert table.limit == 3 * BLOCK_SPAN
+        assert len(table) == len(expected)
+        assert list(table.primes()) == expected
+
+    def test_is_prime(self, table: PrimeTable) -> None:
+        expected = set(primes_between(0, table.limit))
+        numbers = [*range(1000), *range(BLOCK_SPAN - 500, BLOCK_SPAN + 500)]
+
+        assert [x for x in numbers if table.is_prime(x)] == [
+            x for x in numbers if x in expected
+        ]
+        assert not table.is_prime(table.limit - 1)
+
+        with pytest.raises(ValueError):
+            table.is_prime(table.limit)
+
+    @pytest.mark.parametrize(
+        "x", [-1, -2, -3, -7, -BLOCK_SPAN - 1, -(10**12)]
+    )
+    def test_negative(self, table: PrimeTable, x: int) -> None:
+        assert not table.is_prime(x)
+        assert table.prime_pi(x) == 0
+
+    @pytest.mark.parametrize(
+        "x", [0, 1, 2, 3, 100, BLOCK_SPAN - 1, BLOCK_SPAN, BLOCK_SPAN + 1]
+    )
+    def test_prime_pi(self, table: PrimeTable, x: int) -> None:
+        assert table.prime_pi(x) == len(primes_between(0, x + 1))
+
+    def test_nth_prime(self, table: PrimeTable) -> None:
+        expected = list(primes_between(0, table.limit))
+
+        for n in (1, 2, 3, 1000, 12251, 12252, len(expected)):
+            assert table.nth_prime(n) == expected[n - 1]
+
+        for n in (0, len(expected) + 1):
+            with pytest.raises(IndexError):
+                table.nth_prime(n)
+
+    @pytest.mark.parametrize(
+        "start, stop",
+        [(0, 10), (2, 3), (3, 3), (1000, BLOCK_SPAN + 1000), (-5, 10**9)],
+    )
+    def test_primes_range(
+        self, table: PrimeTable, start: int, stop: int
+    ) -> None:
+        assert list(table.primes(start, stop)) == list(
+            primes_between(start, min(stop, table.limit))
+        )
+
+    def test_extend_and_reopen(self, table: PrimeTable) -> None:
+        table.extend(5 * BLOCK_SPAN)
+        table.close()
+
+        reopened = PrimeTable(table.path)
+        try:
+            assert reopened.limit == 5 * BLOCK_SPAN
+            assert list(reopened.primes()) == list(
+                primes_between(0, 5 * BLOCK_SPAN)
+            )
+        finally:
+            reopened.close()
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "invalid.primes"
+        path.write_bytes(b"not a prime table at all")
+
+        with pytest.raises(ValueError):
+            PrimeTable(path)
+
+
+class TestUsePrimeTable:
+    @pytest.fixture(autouse=True)
+    def drop_table(self) -> Iterator[None]:
+        yield
+        primes.drop_prime_table()
+
+    def test_use_prime_table(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.primes"
+        table = primes.use_prime_table(path, BLOCK_SPAN)
+
+        assert primes.get_prime_table() is table
+        assert primes.nth_prime(len(table)) == list(table.primes())[-1]
+        assert primes.prime_pi(BLOCK_SPAN - 1) == len(table)
+        assert primes.is_prime(131101)  # Past the table
+
+        # Opening the file again extends it
+        table = primes.use_prime_table(path, 2 * BLOCK_SPAN)
+        assert table.limit == 2 * BLOCK_SPAN
+
+    def test_prime_num_gen(self, tmp_path: Path) -> None:
+        expected = list(islice(prime_num_gen(), 30000))
+
+        primes.use_prime_table(tmp_path / "table.primes", BLOCK_SPAN)
+
+        assert list(islice(prime_num_gen(), 30000)) == expected
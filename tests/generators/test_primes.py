@@ -0,0 +1,103 @@
+import math
+import pytest
+
+from project.generators import primes
+from project.generators.primes import (
+    is_prime,
+    nth_prime,
+    prime_pi,
+    primes_between,
+)
+
+
+def trial_division(x: int) -> bool:
+    return x >= 2 and all(x % d for d in range(2, math.isqrt(x) + 1))
+
+
+class TestPrimes:
+    def test_is_prime_small(self) -> None:
+        assert [x for x in range(-5, 100) if is_prime(x)] == [
+            x for x in range(100) if trial_division(x)
+        ]
+        assert is_prime(65537) == trial_division(65537)
+
+    @pytest.mark.parametrize(
+        "x, expected",
+        [
+            (2**61 - 1, True),  # Mersenne prime
+            (2**64 - 59, True),  # Largest 64-bit prime
+            (2**64 + 1, False),
+            (3215031751, False),  # Strong pseudoprime to bases 2, 3, 5, 7
+            (3825123056546413051, False),  # ... and to bases 2 to 23
+            (1000000007 * 998244353, False),
+        ],
+    )
+    def test_is_prime_large(self, x: int, expected: bool) -> None:
+        assert is_prime(x) == expected
+
+    @pytest.mark.parametrize(
+        "x, expected",
+        [(-1, 0), (1, 0), (2, 1), (100, 25), (7919, 1000), (10**6, 78498)],
+    )
+    def test_prime_pi(self, x: int, expected: int) -> None:
+        assert prime_pi(x) == expected
+
+    def test_prime_pi_above_sieve(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Past the shared sieve the primes are counted without sieving
+        monkeypatch.setattr(primes, "SIEVE_LIMIT", 1000)
+        assert prime_pi(10**6) == 78498
+        assert prime_pi(10**9) == 50847534
+
+    @pytest.mark.parametrize(
+        "n, expected",
+        [(1, 2), (5, 11), (6, 13), (500, 3571), (100000, 1299709)],
+    )
+    def test_nth_prime(self, n: int, expected: int) -> None:
+        assert nth_prime(n) == expected
+        assert prime_pi(expected) == n
+
+    def test_nth_prime_above_sieve(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # The gap between the bounds is sieved segment by segment
+        monkeypatch.setattr(primes, "SIEVE_LIMIT", 1000)
+        monkeypatch.setattr(primes, "SEGMENT_SIZE", 1000)
+        assert nth_prime(1000) == 7919
+        assert nth_prime(10**6) == 15485863
+
+    @pytest.mark.parametrize("n", [0, -1])
+    def test_nth_prime_invalid(self, n: int) -> None:
+        with pytest.raises(IndexError):
+            nth_prime(n)
+
+    @pytest.mark.parametrize(
+        "low, high",
+        [
+            (0, 30),
+            (10, 30),
+            (-5, 3),
+            (30, 10),
+            (65000, 66000),
+            (10**8, 10**8 + 1000),
+        ],
+    )
+    def test_primes_between(self, low: int, high: int) -> None:
+        expected = [x for x in range(low, high) if trial_division(x)]
+        assert list(primes_between(low, high)) == expected
+
+    def test_primes_between_above_sieve(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Base primes past the shared sieve don't grow it
+        monkeypatch.setattr(primes, "_cache", primes._PrimeCache())
+        monkeypatch.setattr(primes, "INITIAL_LIMIT", 256)
+        monkeypatch.setattr(primes, "SIEVE_LIMIT", 1000)
+
+        low, high = 10**8, 10**8 + 1000
+        expected = [x for x in range(low, high) if trial_division(x)]
+        assert list(primes_between(low, high)) == expected
+        assert primes._cache.limit <= 1000
+        assert nth_prime(10**5) == 1299709
+        assert primes._cache.limit <= 1000
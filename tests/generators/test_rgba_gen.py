@@ -1,6 +1,16 @@
 import pytest
+from array import array
+from itertools import chain, islice
 
-from project.generators.rgba_gen import get_nth_rgba_vec
+from project.generators.rgba_gen import (
+    RGBA_COUNT,
+    RGBASequence,
+    fill_rgba,
+    get_nth_rgba_vec,
+    get_rgba_gen,
+    rgba_bytes,
+    rgba_index,
+)
 
 
 class TestRGBAGen:
@@ -25,3 +35,122 @@ class TestRGBAGen:
         """Test that invalid indices raise an IndexError in the decorated function."""
         with pytest.raises(IndexError):
             get_nth_rgba_vec(invalid_index)
+
+    @pytest.mark.parametrize("index", [0, 50, 51, 123456])
+    def test_get_nth_rgba_vec_matches_generator(self, index: int) -> None:
+        expected = next(islice(get_rgba_gen(), index, None))
+
+        assert get_nth_rgba_vec(index) == expected
+
+    def test_last_index(self) -> None:
+        assert get_nth_rgba_vec(RGBA_COUNT - 1) == (255, 255, 255, 100)
+
+        with pytest.raises(IndexError):
+            get_nth_rgba_vec(RGBA_COUNT)
+
+    @pytest.mark.parametrize("index", [0, 1, 51, 999999, RGBA_COUNT - 1])
+    def test_rgba_index(self, index: int) -> None:
+        assert rgba_index(*get_nth_rgba_vec(index)) == index
+
+    @pytest.mark.parametrize(
+        "vector", [(256, 0, 0, 0), (0, -1, 0, 0), (0, 0, 0, 3), (0, 0, 0, 102)]
+    )
+    def test_rgba_index_invalid(
+        self, vector: tuple[int, int, int, int]
+    ) -> None:
+        with pytest.raises(ValueError):
+            rgba_index(*vector)
+
+
+class TestRGBASequence:
+    def test_len_and_indexing(self) -> None:
+        colors = RGBASequence()
+
+        assert len(colors) == RGBA_COUNT
+        assert colors[51] == (0, 0, 1, 0)
+        assert colors[-1] == (255, 255, 255, 100)
+
+        with pytest.raises(IndexError):
+            colors[RGBA_COUNT]
+
+    def test_slicing(self) -> None:
+        colors = RGBASequence()[10:200:3]
+
+        assert isinstance(colors, RGBASequence)
+        assert list(colors) == list(islice(get_rgba_gen(), 10, 200, 3))
+        assert list(reversed(colors)) == list(colors)[::-1]
+        assert list(colors[1:3]) == list(RGBASequence(range(13, 19, 3)))
+        assert len(RGBASequence()[-5:]) == 5
+
+    def test_contains(self) -> None:
+        colors = RGBASequence()[51:102]
+
+        assert (0, 0, 1, 100) in colors
+        assert (0, 0, 0, 100) not in colors
+        assert (0, 0, 1, 1) not in colors
+
+    @pytest.mark.parametrize("value", [(0, 0, 1), (0, 0, 1, 2.0), "red"])
+    def test_contains_other_values(self, value: object) -> None:
+        assert value not in RGBASequence()
+
+    def test_index_and_count(self) -> None:
+        colors = RGBASequence()[51:102]
+
+        assert colors.index((0, 0, 1, 4)) == 2
+        assert colors.count((0, 0, 1, 4)) == 1
+        assert colors.count((0, 0, 2, 4)) == 0
+
+        with pytest.raises(ValueError):
+            colors.index((0, 0, 1, 4), 3)
+
+        with pytest.raises(ValueError):
+            colors.index((0, 0, 2, 4))
+
+    def test_invalid_indices(self) -> None:
+        with pytest.raises(ValueError):
+            RGBASequence(range(RGBA_COUNT - 1, RGBA_COUNT + 1))
+
+
+class TestRGBABulk:
+    @pytest.mark.parametrize(
+        "start, stop",
+        [(0, 0), (0, 3), (50, 52), (13000, 13100), (13056, 26112), (5, 40000)],
+    )
+    def test_rgba_bytes(self, start: int, stop: int) -> None:
+        expected = bytes(
+            chain.from_iterable(islice(get_rgba_gen(), start, stop))
+        )
+
+        assert rgba_bytes(start, stop) == expected
+
+    def test_rgba_bytes_end(self) -> None:
+        assert rgba_bytes(RGBA_COUNT - 2) == bytes(
+            [255, 255, 255, 98, 255, 255, 255, 100]
+        )
+
+    def test_fill_rgba_buffers(self) -> None:
+        start = rgba_index(1, 255, 255, 50)
+        expected = rgba_bytes(start, start + 100)
+
+        packed = array("B", bytes(400))
+        assert fill_rgba(packed, start) == 100
+        assert packed.tobytes() == expected
+
+        # A slice of a larger buffer, filled in place
+        image = bytearray(408)
+        assert fill_rgba(memoryview(image)[4:404], start) == 100
+        assert image[4:404] == expected
+        assert image[:4] == image[404:] == bytes(4)
+
+    @pytest.mark.parametrize(
+        "size, start", [(6, 0), (8, -1), (8, RGBA_COUNT - 1)]
+    )
+    def test_fill_rgba_invalid(self, size: int, start: int) -> None:
+        with pytest.raises((ValueError, IndexError)):
+            fill_rgba(bytearray(size), start)
+
+    @pytest.mark.parametrize("indices", [slice(100, 200), slice(100, 200, 7)])
+    def test_sequence_tobytes(self, indices: slice) -> None:
+        colors = RGBASequence()[indices]
+
+        assert colors.tobytes() == bytes(chain.from_iterable(colors))
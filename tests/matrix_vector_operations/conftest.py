@@ -0,0 +1,27 @@
+import pytest
+from random import Random
+from typing import Callable
+
+from project.matrix_vector_operations.backends import available_backends
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+# Builds a storage of the given height and width filled with random values
+# from a seed.
+RandomStorage = Callable[[int, int, int], MatrixStorage]
+
+
+@pytest.fixture(params=available_backends())
+def backend(request: pytest.FixtureRequest) -> str:
+    name: str = request.param
+    return name
+
+
+@pytest.fixture
+def random_storage() -> RandomStorage:
+    def build(height: int, width: int, seed: int) -> MatrixStorage:
+        rng = Random(seed)
+        return MatrixStorage.from_iterable(
+            [rng.uniform(-1, 1) for _ in range(height * width)], height, width
+        )
+
+    return build
@@ -0,0 +1,103 @@
+import pytest
+from math import isclose, pi
+
+from project.matrix_vector_operations.backends import (
+    get_backend,
+    set_backend,
+    use_backend,
+)
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.vector_operations import Vector
+
+
+class TestBackends:
+    def test_matrix_operations(self, backend: str) -> None:
+        matrix1 = Matrix([[1, 2], [3, 4]])
+        matrix2 = Matrix([[2, 0], [1, 2]])
+
+        assert matrix1.add(matrix2, backend=backend).to_list() == [
+            [3, 2],
+            [4, 6],
+        ]
+        assert matrix1.matmul(matrix2, backend=backend).to_list() == [
+            [4, 4],
+            [10, 8],
+        ]
+
+        # Products with transposed views work on the strided buffers
+        assert matrix1.matmul(
+            matrix2.transpose(), backend=backend
+        ).to_list() == [
+            [2, 5],
+            [6, 11],
+        ]
+
+        with use_backend(backend):
+            matrix1 += matrix2
+            assert matrix1.to_list() == [[3, 2], [4, 6]]
+
+            matrix1 -= matrix2
+            matrix1 *= 3
+            assert matrix1.to_list() == [[3, 6], [9, 12]]
+
+            matrix1.add_scaled(-1, matrix2)
+            assert matrix1.to_list() == [[1, 6], [8, 10]]
+
+        # Results written into operands, including strided views
+        matrix1.matmul(matrix2.transpose(), out=matrix1, backend=backend)
+        assert matrix1.to_list() == [[2, 13], [16, 28]]
+
+        matrix2.add(matrix2.transpose(), out=matrix2, backend=backend)
+        assert matrix2.to_list() == [[4, 1], [1, 4]]
+
+    def test_vector_operations(self, backend: str) -> None:
+        vector1 = Vector([[3, 4]])
+        vector2 = Vector([[-4, 3]])
+
+        assert isclose(vector1.length(backend), 5)
+        assert Vector.dot_product(vector1, vector2, backend) == 0
+        assert isclose(Vector.angle(vector1, vector2, backend), pi / 2)
+
+        # Column vectors go through the same code
+        column = Vector([[3], [4]])
+        assert Vector.dot_product(column, column, backend) == 25
+
+    def test_backend_selection(self) -> None:
+        default = get_backend()
+
+        with use_backend("python") as python_backend:
+            assert get_backend() is python_backend
+            assert python_backend.name == "python"
+        assert get_backend() is default
+
+        try:
+            set_backend("python")
+            assert get_backend().name == "python"
+        finally:
+            set_backend(default.name)
+
+        # Unknown backends are rejected
+        with pytest.raises(ValueError):
+            get_backend("fortran")
+        with pytest.raises(ValueError):
+            set_backend("fortran")
+
+    def test_numpy_conversion(self) -> None:
+        np = pytest.importorskip("numpy")
+
+        array = np.arange(6, dtype=np.float64).reshape(2, 3)
+        matrix = Matrix.from_numpy(array)
+        assert matrix.to_list() == [[0, 1, 2], [3, 4, 5]]
+
+        # The buffer is shared in both directions
+        array[0, 0] = 10
+        assert matrix[0, 0] == 10
+        matrix.to_numpy()[1, 2] = 50
+        assert array[1, 2] == 50
+
+        # Integer arrays are copied into doubles
+        matrix = Matrix.from_numpy(np.eye(2, dtype=np.int64))
+        assert matrix.to_list() == [[1, 0], [0, 1]]
+
+        with pytest.raises(ValueError):
+            Matrix.from_numpy(np.zeros(3))
@@ -0,0 +1,146 @@
+import pytest
+from math import isclose
+from random import Random
+from typing import List
+
+from project.matrix_vector_operations import decompositions
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.vector_operations import Vector
+
+
+@pytest.fixture
+def small_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Several panels even for the small matrices of the tests.
+    monkeypatch.setattr(decompositions, "BLOCK_SIZE", 4)
+
+
+def random_matrix(height: int, width: int, seed: int = 0) -> Matrix:
+    rng = Random(seed)
+    return Matrix(
+        [[rng.uniform(-1, 1) for _ in range(width)] for _ in range(height)]
+    )
+
+
+def assert_close(actual: Matrix, expected: Matrix) -> None:
+    assert (actual.height, actual.width) == (expected.height, expected.width)
+    for row, expected_row in zip(actual.to_list(), expected.to_list()):
+        for value, expected_value in zip(row, expected_row):
+            assert isclose(value, expected_value, abs_tol=1e-9)
+
+
+def identity(size: int) -> Matrix:
+    rows: List[List[float]] = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        rows[i][i] = 1.0
+    return Matrix(rows)
+
+
+@pytest.mark.usefixtures("small_blocks")
+class TestLUDecomposition:
+    def test_factors(self, backend: str) -> None:
+        matrix = random_matrix(10, 10)
+        lu = matrix.lu(backend)
+
+        rows = matrix.to_list()
+        permuted = Matrix([rows[i] for i in lu.permutation])
+        assert_close(lu.lower * lu.upper, permuted)
+        assert all(
+            value == 0
+            for i, row in enumerate(lu.upper.to_list())
+            for value in row[:i]
+        )
+
+    def test_solve(self, backend: str) -> None:
+        matrix = random_matrix(10, 10)
+        factor = matrix.lu(backend)
+
+        # One factorization, several right-hand sides
+        for seed in range(3):
+            b = random_matrix(10, 2, seed)
+            assert_close(matrix * factor.solve(b), b)
+
+        x = matrix.solve(Vector([[1.0] * 10]), backend)
+        assert isinstance(x, Vector) and (x.height, x.width) == (1, 10)
+        assert_close(matrix * x.transpose(), Matrix([[1.0]] * 10))
+
+        with pytest.raises(ValueError):
+            factor.solve(Matrix([[1.0], [2.0]]))
+
+    def test_det_and_inverse(self, backend: str) -> None:
+        matrix = Matrix([[0, 2, 1], [1, 1, 0], [2, 0, 3]])
+
+        # The zero in the corner forces a row swap
+        assert isclose(matrix.det(backend), -8)
+        assert_close(matrix * matrix.inverse(backend), identity(3))
+
+        matrix = random_matrix(9, 9)
+        assert_close(matrix.inverse(backend) * matrix, identity(9))
+
+    def test_singular(self, backend: str) -> None:
+        lu = Matrix([[1, 2], [2, 4]]).lu(backend)
+
+        assert lu.det() == 0
+        with pytest.raises(ValueError):
+            lu.solve(Matrix([[1], [1]]))
+        with pytest.raises(ValueError):
+            Matrix([[1, 2, 3]]).lu(backend)
+
+
+@pytest.mark.usefixtures("small_blocks")
+class TestCholeskyDecomposition:
+    def test_factor_and_solve(self, backend: str) -> None:
+        a = random_matrix(9, 9)
+        matrix = a * a.transpose() + 9 * identity(9)
+        cholesky = matrix.cholesky(backend)
+
+        lower = cholesky.lower
+        assert_close(lower * lower.transpose(), matrix)
+        assert all(
+            value == 0
+            for i, row in enumerate(lower.to_list())
+            for value in row[i + 1 :]
+        )
+
+        b = random_matrix(9, 3)
+        assert_close(matrix * cholesky.solve(b), b)
+        assert isclose(cholesky.det(), matrix.det(backend), rel_tol=1e-9)
+
+    def test_not_positive_definite(self, backend: str) -> None:
+        with pytest.raises(ValueError):
+            Matrix([[1, 2], [2, 1]]).cholesky(backend)
+
+
+@pytest.mark.usefixtures("small_blocks")
+class TestQRDecomposition:
+    @pytest.mark.parametrize("height", [9, 14])
+    def test_factors(self, backend: str, height: int) -> None:
+        matrix = random_matrix(height, 9)
+        qr = matrix.qr(backend)
+
+        assert_close(qr.q * qr.r, matrix)
+        assert_close(qr.q.transpose() * qr.q, identity(9))
+
+    def test_least_squares(self, backend: str) -> None:
+        # Fit a line through points on it, then through points off it
+        points = Matrix([[1, 0], [1, 1], [1, 2], [1, 3]])
+        qr = points.qr(backend)
+
+        assert_close(
+            qr.solve(Matrix([[1], [3], [5], [7]])), Matrix([[1], [2]])
+        )
+        assert_close(
+            qr.solve(Matrix([[0], [1], [0], [1]])), Matrix([[0.2], [0.2]])
+        )
+
+        with pytest.raises(ValueError):
+            points.transpose().qr(backend)
+
+        # A rank-deficient matrix factors, but can't be solved with
+        qr = Matrix([[1, 1], [1, 1]]).qr(backend)
+        assert_close(qr.r, Matrix([[-(2**0.5), -(2**0.5)], [0, 0]]))
+        with pytest.raises(ValueError):
+            qr.solve(Matrix([[1], [1]]))
+
+    def test_det(self, backend: str) -> None:
+        matrix = random_matrix(6, 6)
+        assert isclose(matrix.qr(backend).det(), matrix.det(backend))
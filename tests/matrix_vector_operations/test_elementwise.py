@@ -0,0 +1,157 @@
+import math
+import pytest
+from typing import List
+
+from project.matrix_vector_operations.backends import use_backend
+from project.matrix_vector_operations.elementwise import (
+    broadcast_shape,
+    broadcast_values,
+)
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.vector_operations import Vector
+
+
+def storage(rows: List[List[float]]) -> MatrixStorage:
+    return MatrixStorage.from_iterable(
+        [value for row in rows for value in row], len(rows), len(rows[0])
+    )
+
+
+class TestBroadcasting:
+    def test_broadcast_shape(self) -> None:
+        matrix = storage([[1, 2, 3], [4, 5, 6]])
+        row = storage([[1, 2, 3]])
+        column = storage([[1], [2]])
+
+        assert broadcast_shape([matrix, row, 2.0]) == (2, 3)
+        assert broadcast_shape([row, column]) == (2, 3)
+        assert broadcast_shape([storage([[1]]), 2.0]) == (1, 1)
+
+        with pytest.raises(ValueError):
+            broadcast_shape([matrix, storage([[1, 2]])])
+        with pytest.raises(ValueError):
+            broadcast_shape([matrix, matrix.transposed()])
+
+    def test_broadcast_values(self) -> None:
+        assert list(broadcast_values(storage([[1, 2]]), 2, 2)) == [1, 2, 1, 2]
+        assert list(broadcast_values(storage([[1], [2]]), 2, 2)) == [
+            1,
+            1,
+            2,
+            2,
+        ]
+        assert list(broadcast_values(storage([[7]]), 1, 3)) == [7, 7, 7]
+        assert list(broadcast_values(3.0, 2, 1)) == [3, 3]
+
+
+class TestElementwise:
+    def test_scalar_functions(self, backend: str) -> None:
+        matrix = Matrix([[4.0, 9.0], [-1.0, 16.0]])
+
+        assert matrix.apply(abs, backend=backend).apply(
+            math.sqrt, backend=backend
+        ).to_list() == [[2, 3], [1, 4]]
+        assert matrix.apply(
+            lambda x, y: x if x > y else y, 5.0, backend=backend
+        ).to_list() == [[5, 9], [5, 16]]
+
+        with pytest.raises(ValueError):
+            matrix.apply(math.sqrt, backend=backend)
+
+    def test_reflected_operators(self, backend: str) -> None:
+        matrix = Matrix([[1, 2], [4, 8]])
+
+        with use_backend(backend):
+            assert (1 - matrix).to_list() == [[0, -1], [-3, -7]]
+            assert (8 / matrix).to_list() == [[8, 4], [2, 1]]
+            assert (1.5 - Vector([[1, 2]])).to_list() == [[0.5, -0.5]]
+
+        with pytest.raises(TypeError):
+            "1" - matrix  # type: ignore[operator]
+        with pytest.raises(TypeError):
+            "1" / matrix  # type: ignore[operator]
+
+    def test_arithmetic(self, backend: str) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        other = Matrix([[2, 4], [6, 8]])
+
+        assert matrix.multiply(other, backend=backend).to_list() == [
+            [2, 8],
+            [18, 32],
+        ]
+        assert other.divide(matrix, backend=backend).to_list() == [
+            [2, 2],
+            [2, 2],
+        ]
+        assert matrix.subtract(1, backend=backend).to_list() == [
+            [0, 1],
+            [2, 3],
+        ]
+
+        # Operators with scalars, in both orders
+        assert (
+            (2 * matrix).to_list()
+            == (matrix * 2).to_list()
+            == [
+                [2, 4],
+                [6, 8],
+            ]
+        )
+        assert (1 + matrix - 1).to_list() == matrix.to_list()
+        assert (matrix / 2).to_list() == [[0.5, 1], [1.5, 2]]
+
+        # `*` between matrices is still the matrix product
+        assert (matrix * other).to_list() == [[14, 20], [30, 44]]
+
+    def test_row_and_column_broadcasting(self, backend: str) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        means = Matrix([[2.5, 3.5, 4.5]])
+        scales = Matrix([[1], [2]])
+
+        centered = matrix.subtract(means, backend=backend)
+        assert centered.to_list() == [[-1.5] * 3, [1.5] * 3]
+        assert matrix.divide(scales, backend=backend).to_list() == [
+            [1, 2, 3],
+            [2, 2.5, 3],
+        ]
+
+        # A row and a column broadcast against each other
+        assert Matrix([[1, 2]]).add(scales, backend=backend).to_list() == [
+            [2, 3],
+            [3, 4],
+        ]
+
+        with pytest.raises(ValueError):
+            matrix.multiply(Matrix([[1, 2]]), backend=backend)
+
+    def test_fused_evaluation(self, backend: str) -> None:
+        a = Matrix([[1, 2], [3, 4]])
+        b = Matrix([[2, 2], [2, 2]])
+        c = Matrix([[10], [20]])
+
+        result = a.apply(lambda x, y, z: x * y + z, b, c, backend=backend)
+        assert result.to_list() == [[12, 14], [26, 28]]
+
+        # Results can be written into an operand
+        a.apply(lambda x, y: x * x - y, 1, out=a, backend=backend)
+        assert a.to_list() == [[0, 3], [8, 15]]
+
+        with pytest.raises(ValueError):
+            a.apply(lambda x, y: x + y, c, out=Matrix([[0, 0]]))
+
+    def test_in_place_and_views(self, backend: str) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        transposed = matrix.transpose()
+
+        # Views keep their values when the matrix is updated in place
+        matrix /= Matrix([[1, 2]])
+        matrix += 1
+        assert matrix.to_list() == [[2, 2], [4, 3]]
+        assert transposed.to_list() == [[1, 3], [2, 4]]
+
+        # Elementwise results keep the class of vectors
+        vector = Vector([[3, 4]])
+        assert isinstance(vector * 2, Vector)
+        assert isinstance(vector.multiply(vector, backend=backend), Vector)
+        assert not isinstance(vector + Matrix([[1], [2]]), Vector)
@@ -0,0 +1,95 @@
+import pytest
+from typing import List, Tuple
+
+from project.matrix_vector_operations.lazy import Expression, chain_order
+from project.matrix_vector_operations.matrix_operations import Matrix
+
+
+def filled(height: int, width: int, start: int = 0) -> Matrix:
+    return Matrix(
+        [[start + i * width + j for j in range(width)] for i in range(height)]
+    )
+
+
+class TestLazy:
+    def test_expression_matches_eager(self, backend: str) -> None:
+        a, b = filled(2, 3), filled(2, 3, 10)
+        c, d = filled(3, 2, 1), Matrix([[1, -1]])
+
+        expression = (a.lazy() + b) * c + d
+        assert isinstance(expression, Expression)
+        assert (expression.height, expression.width) == (2, 2)
+
+        expected = (a + b) * c + d
+        assert (
+            expression.evaluate(backend=backend).to_list()
+            == expected.to_list()
+        )
+
+    def test_elementwise_fusion(self, backend: str) -> None:
+        a, b, c = filled(2, 2), filled(2, 2, 1), Matrix([[10], [20]])
+
+        # A whole tree of elementwise operators is a single backend pass
+        expression = (2 * a.lazy().multiply(b) - c) / 2 + a
+        assert expression.evaluate(backend=backend).to_list() == [
+            [-5, -2],
+            [-2, 5],
+        ]
+
+        # Repeated operands and reflected operators
+        expression = 1 - a.lazy() / (a + 1)
+        assert expression.evaluate(backend=backend).to_list() == [
+            [1, 0.5],
+            [1 - 2 / 3, 0.25],
+        ]
+
+    def test_evaluate_into_operand(self, backend: str) -> None:
+        a, b = filled(2, 2), filled(2, 2, 1)
+
+        result = (a.lazy() + b).evaluate(out=a, backend=backend)
+        assert result is a
+        assert a.to_list() == [[1, 3], [5, 7]]
+
+        (a.lazy() * b).evaluate(out=a, backend=backend)
+        assert a.to_list() == [[10, 14], [26, 38]]
+
+        # A plain matrix evaluates to a copy
+        copy = b.lazy().evaluate(backend=backend)
+        assert copy is not b and copy.to_list() == b.to_list()
+
+    def test_chain_reordering(self, backend: str) -> None:
+        a, b, c = filled(10, 1), filled(1, 10), filled(10, 1)
+
+        expression = a.lazy() * b * c
+        assert (
+            expression.evaluate(backend=backend).to_list()
+            == (a * (b * c)).to_list()
+        )
+
+        # Matrices on the left of an expression join the chain
+        assert (b * (c.lazy() * b)).evaluate(backend=backend).to_list() == (
+            b * c * b
+        ).to_list()
+
+    @pytest.mark.parametrize(
+        "shapes, first",
+        [
+            # (A B) C costs 10*100*5 + 10*5*50, A (B C) ten times more
+            ([(10, 100), (100, 5), (5, 50)], 1),
+            ([(50, 5), (5, 100), (100, 10)], 0),
+        ],
+    )
+    def test_chain_order(
+        self, shapes: List[Tuple[int, int]], first: int
+    ) -> None:
+        assert chain_order(shapes)[0][len(shapes) - 1] == first
+
+    def test_shape_errors(self) -> None:
+        a = filled(2, 3)
+
+        with pytest.raises(ValueError):
+            a.lazy() + filled(3, 3)
+        with pytest.raises(ValueError):
+            a.lazy() * a
+        with pytest.raises(TypeError):
+            a.lazy() * "a"  # type: ignore[operator]
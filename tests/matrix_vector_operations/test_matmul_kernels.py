@@ -0,0 +1,53 @@
+import pytest
+from typing import Callable
+from math import isclose
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.matmul_kernels import (
+    naive_matmul,
+    tiled_matmul,
+)
+
+
+class TestMatmulKernels:
+    def test_naive_matmul(self) -> None:
+        a = MatrixStorage.from_iterable([1, 2, 3, 4, 5, 6], 2, 3)
+        b = MatrixStorage.from_iterable([1, 0, 0, 1, 1, 1], 3, 2)
+        assert naive_matmul(a, b).tolist() == [[4, 5], [10, 11]]
+
+    @pytest.mark.parametrize(
+        "height, shared, width, tile_size",
+        [
+            (1, 1, 1, 4),  # Singleton matrices
+            (10, 10, 10, 4),  # Tile size does not divide the dimension
+            (17, 9, 23, 8),  # Rectangular operands
+            (12, 12, 12, 32),  # A single tile covers the whole result
+        ],
+    )
+    def test_tiled_matches_naive(
+        self,
+        height: int,
+        shared: int,
+        width: int,
+        tile_size: int,
+        random_storage: Callable[[int, int, int], MatrixStorage],
+    ) -> None:
+        a = random_storage(height, shared, 1)
+        b = random_storage(shared, width, 2)
+
+        expected = naive_matmul(a, b).values()
+        result = tiled_matmul(a, b, tile_size).values()
+        assert all(map(isclose, result, expected))
+
+    @pytest.mark.parametrize("tile_size", [None, 1, 2])
+    def test_matmul_into_operand(self, tile_size: int | None) -> None:
+        a = MatrixStorage.from_iterable([1, 2, 3, 4], 2, 2)
+        b = MatrixStorage.from_iterable([2, 0, 1, 2], 2, 2)
+
+        if tile_size is None:
+            result = naive_matmul(a, b, out=a)
+        else:
+            result = tiled_matmul(a, b, tile_size, out=a)
+
+        assert result is a
+        assert a.tolist() == [[4, 4], [10, 8]]
@@ -0,0 +1,92 @@
+import os
+import pytest
+from pathlib import Path
+
+from project.matrix_vector_operations.matrix_io import HEADER
+from project.matrix_vector_operations.matrix_operations import Matrix
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "matrix.bin"
+
+
+@pytest.fixture
+def matrix() -> Matrix:
+    return Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]])
+
+
+class TestMatrixIO:
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_round_trip(self, path: Path, matrix: Matrix, mmap: bool) -> None:
+        matrix.save(path)
+        assert path.stat().st_size == HEADER.size + 8 * 12
+
+        loaded = Matrix.load(path, mmap=mmap)
+        assert loaded.to_list() == matrix.to_list()
+
+        # Strided views are written in row-major order. Overwriting the file
+        # leaves matrices loaded from it intact.
+        matrix.transpose().save(path)
+        assert loaded.to_list() == matrix.to_list()
+        assert Matrix.load(path, mmap=mmap).to_list() == [
+            [1, 4, 7, 10],
+            [2, 5, 8, 11],
+            [3, 6, 9, 12],
+        ]
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_row_slices(self, path: Path, matrix: Matrix, mmap: bool) -> None:
+        matrix.save(path)
+
+        rows = Matrix.load(path, mmap=mmap, rows=slice(1, 3))
+        assert rows.to_list() == [[4, 5, 6], [7, 8, 9]]
+        assert Matrix.load(
+            path, mmap=mmap, rows=slice(-1, None)
+        ).to_list() == [[10, 11, 12]]
+
+        with pytest.raises(ValueError):
+            Matrix.load(path, mmap=mmap, rows=slice(2, 2))
+        with pytest.raises(ValueError):
+            Matrix.load(path, mmap=mmap, rows=slice(0, 4, 2))
+
+    def test_mapped_matrix_is_copied_on_write(
+        self, path: Path, matrix: Matrix
+    ) -> None:
+        matrix.save(path)
+        loaded = Matrix.load(path)
+
+        loaded[0, 0] = 100
+        loaded += matrix
+        assert loaded.to_list()[0] == [101, 4, 6]
+
+        # The file is left untouched
+        assert Matrix.load(path).to_list() == matrix.to_list()
+
+    def test_temporary_files(
+        self, path: Path, matrix: Matrix, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        matrix.save(path)
+        assert list(path.parent.iterdir()) == [path]
+
+        # A failed save removes its temporary file and keeps the old one
+        def fail(source: str, target: str) -> None:
+            raise OSError("Disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            matrix.transpose().save(path)
+
+        assert list(path.parent.iterdir()) == [path]
+        assert Matrix.load(path).to_list() == matrix.to_list()
+
+    def test_invalid_files(self, path: Path, matrix: Matrix) -> None:
+        for contents in [b"", b"not a matrix" * 10]:
+            path.write_bytes(contents)
+            with pytest.raises(ValueError):
+                Matrix.load(path)
+
+        matrix.save(path)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError):
+            Matrix.load(path)
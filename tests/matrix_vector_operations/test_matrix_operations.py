@@ -1,13 +1,22 @@
+import copy
+import pickle
+from array import array
 import pytest
+from typing import Any, List
 
+from project.matrix_vector_operations import backends
+from project.matrix_vector_operations.backends import use_backend
 from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.parallel_matmul import parallel_matmul
+from project.matrix_vector_operations.vector_operations import Vector
 
 
 class TestMatrixOperations:
     def test_matrix_init(self) -> None:
         # Valid matrix
         matrix = Matrix([[1, 2], [3, 4]])
-        assert matrix._matrix == [[1, 2], [3, 4]]
+        assert matrix.to_list() == [[1, 2], [3, 4]]
 
         # Invalid matrix (jagged)
         with pytest.raises(TypeError):
@@ -21,7 +30,7 @@ class TestMatrixOperations:
         matrix1 = Matrix([[1, 2], [3, 4]])
         matrix2 = Matrix([[5, 6], [7, 8]])
         result = matrix1 + matrix2
-        assert result._matrix == [[6, 8], [10, 12]]
+        assert result.to_list() == [[6, 8], [10, 12]]
 
         # Matrices with different dimensions
         matrix1 = Matrix([[1, 2], [3, 4]])
@@ -33,31 +42,31 @@ class TestMatrixOperations:
         matrix1 = Matrix([[1, -2], [-3, 4]])
         matrix2 = Matrix([[-5, 6], [7, -8]])
         result = matrix1 + matrix2
-        assert result._matrix == [[-4, 4], [4, -4]]
+        assert result.to_list() == [[-4, 4], [4, -4]]
 
         # Addition with zero matrices
         matrix1 = Matrix([[0, 0], [0, 0]])
         matrix2 = Matrix([[0, 0], [0, 0]])
         result = matrix1 + matrix2
-        assert result._matrix == [[0, 0], [0, 0]]
+        assert result.to_list() == [[0, 0], [0, 0]]
 
     def test_matrix_inplace_addition(self) -> None:
         matrix1 = Matrix([[1, 2], [3, 4]])
         matrix2 = Matrix([[5, 6], [7, 8]])
         matrix1 += matrix2
-        assert matrix1._matrix == [[6, 8], [10, 12]]
+        assert matrix1.to_list() == [[6, 8], [10, 12]]
 
     def test_matrix_multiplication(self) -> None:
         matrix1 = Matrix([[1, 2], [3, 4]])
         matrix2 = Matrix([[2, 0], [1, 2]])
         result = matrix1 * matrix2
-        assert result._matrix == [[4, 4], [10, 8]]
+        assert result.to_list() == [[4, 4], [10, 8]]
 
         # Multiplication with singleton matrix
         matrix1 = Matrix([[3]])
         matrix2 = Matrix([[5]])
         result = matrix1 * matrix2
-        assert result._matrix == [[15]]
+        assert result.to_list() == [[15]]
 
         # Matrices with incompatible dimensions for multiplication
         matrix1 = Matrix([[1, 2]])
@@ -68,14 +77,341 @@ class TestMatrixOperations:
     def test_matrix_transpose(self) -> None:
         matrix = Matrix([[1, 2], [3, 4], [5, 6]])
         transposed = matrix.transpose()
-        assert transposed._matrix == [[1, 3, 5], [2, 4, 6]]
+        assert transposed.to_list() == [[1, 3, 5], [2, 4, 6]]
 
         # Transposing a square matrix
         matrix = Matrix([[1, 2], [3, 4]])
         transposed = matrix.transpose()
-        assert transposed._matrix == [[1, 3], [2, 4]]
+        assert transposed.to_list() == [[1, 3], [2, 4]]
 
         # Transposing a singleton matrix
         matrix = Matrix([[7]])
         transposed = matrix.transpose()
-        assert transposed._matrix == [[7]]
+        assert transposed.to_list() == [[7]]
+
+    def test_matrix_from_buffer(self) -> None:
+        buffer = array("d", [1, 2, 3, 4, 5, 6])
+        matrix = Matrix.from_buffer(buffer, 2, 3)
+        assert matrix.to_list() == [[1, 2, 3], [4, 5, 6]]
+
+        # The buffer is shared, not copied
+        matrix[1, 0] = 40
+        assert buffer[3] == 40
+        buffer[0] = 10
+        assert matrix[0, 0] == 10
+
+        # Offset into a larger buffer
+        matrix = Matrix.from_buffer(buffer, 1, 2, offset=4)
+        assert matrix.to_list() == [[5, 6]]
+
+        # Buffer too small for the requested shape
+        with pytest.raises(ValueError):
+            Matrix.from_buffer(buffer, 3, 3)
+
+    @pytest.mark.parametrize("typecode", ["f", "q", "i"])
+    def test_matrix_from_buffer_wrong_format(self, typecode: str) -> None:
+        with pytest.raises(TypeError):
+            Matrix.from_buffer(array(typecode, [1, 2, 3, 4]), 1, 2)
+
+    def test_matrix_pickle_and_deepcopy(self) -> None:
+        buffer = array("d", [1, 2, 3, 4, 5, 6])
+        matrix = Matrix.from_buffer(buffer, 2, 3)
+
+        for copied in (
+            pickle.loads(pickle.dumps(matrix)),
+            copy.deepcopy(matrix),
+        ):
+            assert copied.to_list() == [[1, 2, 3], [4, 5, 6]]
+
+            # The copy owns its elements
+            copied[0, 0] = 10
+            assert buffer[0] == 1
+
+        # Views are restored as contiguous matrices
+        transposed = pickle.loads(pickle.dumps(matrix.transpose()))
+        assert transposed.to_list() == [[1, 4], [2, 5], [3, 6]]
+
+        vector = copy.deepcopy(Vector([[1, 2, 3]]))
+        assert isinstance(vector, Vector)
+        assert vector.to_list() == [[1, 2, 3]]
+
+    def test_matrix_item_access(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        assert matrix[1, 0] == 3
+
+        matrix[0, 1] = 7
+        assert matrix.to_list() == [[1, 7], [3, 4]]
+
+        with pytest.raises(IndexError):
+            matrix[2, 0]
+
+    @pytest.mark.parametrize("tile_size", [1, 2, 3, 64])
+    def test_matrix_tiled_multiplication(self, tile_size: int) -> None:
+        matrix1 = Matrix([[i * 5 + j for j in range(5)] for i in range(7)])
+        matrix2 = Matrix([[i - j for j in range(3)] for i in range(5)])
+        expected = (matrix1 * matrix2).to_list()
+
+        result = matrix1.matmul(matrix2, tile_size=tile_size, backend="python")
+        assert result.to_list() == expected
+
+        with pytest.raises(ValueError):
+            matrix1.matmul(matrix2, tile_size=0)
+
+    def test_matrix_multiplication_threshold(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Above the threshold `*` switches to the tiled kernel
+        monkeypatch.setattr(Matrix, "TILED_MATMUL_THRESHOLD", 2)
+        monkeypatch.setattr(Matrix, "TILE_SIZE", 1)
+        matrix1 = Matrix([[1, 2], [3, 4]])
+        matrix2 = Matrix([[2, 0], [1, 2]])
+        with use_backend("python"):
+            result = matrix1 * matrix2
+        assert result.to_list() == [[4, 4], [10, 8]]
+
+    def test_matrix_vector_multiplication(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        column = Vector([[1], [0], [-1]])
+        row = Vector([[1, -1]])
+
+        # The result keeps the class of the vector operand
+        result = matrix * column
+        assert isinstance(result, Vector)
+        assert result.to_list() == [[-2], [-2]]
+
+        result = row * matrix
+        assert isinstance(result, Vector)
+        assert result.to_list() == [[-3, -3, -3]]
+
+        # Both paths agree with the general kernels
+        assert (matrix * column).to_list() == matrix.matmul(
+            column, tile_size=1, backend="python"
+        ).to_list()
+        assert (row * matrix).to_list() == row.matmul(
+            matrix, tile_size=1, backend="python"
+        ).to_list()
+
+        # Results can be written into a preallocated vector
+        out = Vector([[0, 0, 0]])
+        assert row.matmul(matrix, out=out) is out
+        assert out.to_list() == [[-3, -3, -3]]
+
+    def test_matrix_strassen_multiplication(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(Matrix, "STRASSEN_CUTOFF", 2)
+        matrix1 = Matrix([[i * 5 + j for j in range(5)] for i in range(7)])
+        matrix2 = Matrix([[i - j for j in range(6)] for i in range(5)])
+        expected = (matrix1 * matrix2).to_list()
+
+        result = matrix1.matmul(matrix2, algorithm="strassen")
+        assert result.to_list() == expected
+
+        with pytest.raises(ValueError):
+            matrix1.matmul(matrix2, algorithm="winograd")
+        with pytest.raises(ValueError):
+            matrix1.matmul(matrix2, algorithm="strassen", workers=2)
+
+    def test_matrix_transpose_view(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4], [5, 6]])
+        transposed = matrix.transpose()
+
+        # The transpose shares the buffer instead of copying it
+        assert transposed._storage.data.obj is matrix._storage.data.obj
+        assert transposed.transpose().to_list() == matrix.to_list()
+        assert [list(row) for row in transposed.rows()] == [
+            [1, 3, 5],
+            [2, 4, 6],
+        ]
+        assert [list(column) for column in transposed.columns()] == [
+            [1, 2],
+            [3, 4],
+            [5, 6],
+        ]
+
+        # Writing to the view copies it and leaves the original untouched
+        transposed[0, 1] = 30
+        assert transposed.to_list() == [[1, 30, 5], [2, 4, 6]]
+        assert matrix.to_list() == [[1, 2], [3, 4], [5, 6]]
+
+        # Writing to the original does not leak into an existing view
+        transposed = matrix.transpose()
+        matrix += Matrix([[1, 1], [1, 1], [1, 1]])
+        assert matrix.to_list() == [[2, 3], [4, 5], [6, 7]]
+        assert transposed.to_list() == [[1, 3, 5], [2, 4, 6]]
+
+    def test_matrix_transpose_view_released(self) -> None:
+        buffer = array("d", [1, 2, 3, 4])
+        matrix = Matrix.from_buffer(buffer, 2, 2)
+
+        # Once the view is gone the matrix writes to its buffer again
+        matrix.transpose()
+        matrix[0, 0] = 10
+        assert buffer[0] == 10
+
+    def test_matrix_from_buffer_with_transpose(self) -> None:
+        buffer = array("d", [1, 2, 3, 4])
+        matrix = Matrix.from_buffer(buffer, 2, 2)
+        transposed = matrix.transpose()
+
+        # Writes keep reaching the buffer while the view is alive
+        matrix[0, 0] = 9
+        matrix += Matrix([[1, 1], [1, 1]])
+        assert list(buffer) == [10, 3, 4, 5]
+        assert transposed.to_list() == [[1, 3], [2, 4]]
+
+        # Writing to the view leaves the buffer alone
+        view = matrix.transpose()
+        view[0, 1] = 0
+        assert view.to_list() == [[10, 0], [3, 5]]
+        assert list(buffer) == [10, 3, 4, 5]
+
+    def test_matrix_multiplication_by_transpose(self) -> None:
+        matrix1 = Matrix([[1, 2, 3], [4, 5, 6]])
+        matrix2 = Matrix([[1, 0, 1], [0, 1, 0]])
+        result = matrix1 * matrix2.transpose()
+        assert result.to_list() == [[4, 2], [10, 5]]
+
+    def test_matrix_inplace_operations(self) -> None:
+        buffer = array("d", [1, 2, 3, 4])
+        matrix = Matrix.from_buffer(buffer, 2, 2)
+
+        # In-place operators write into the existing buffer
+        matrix += Matrix([[1, 1], [1, 1]])
+        assert list(buffer) == [2, 3, 4, 5]
+
+        matrix -= Matrix([[2, 2], [2, 2]])
+        assert list(buffer) == [0, 1, 2, 3]
+
+        matrix *= 2
+        assert list(buffer) == [0, 2, 4, 6]
+
+        matrix.add_scaled(0.5, Matrix([[2, 2], [2, 2]]))
+        assert list(buffer) == [1, 3, 5, 7]
+
+        # `*=` with a matrix is still the matrix product
+        matrix *= Matrix([[1, 0], [0, 0]])
+        assert matrix.to_list() == [[1, 0], [5, 0]]
+
+        with pytest.raises(ValueError):
+            matrix -= Matrix([[1, 2, 3]])
+
+        with pytest.raises(ValueError):
+            matrix.add_scaled(1, Matrix([[1, 2]]))
+
+    def test_matrix_subtraction(self) -> None:
+        matrix1 = Matrix([[5, 6], [7, 8]])
+        matrix2 = Matrix([[1, 2], [3, 4]])
+        result = matrix1 - matrix2
+        assert result.to_list() == [[4, 4], [4, 4]]
+
+    def test_matrix_out_parameter(self) -> None:
+        matrix1 = Matrix([[1, 2], [3, 4]])
+        matrix2 = Matrix([[2, 0], [1, 2]])
+        out = Matrix([[0, 0], [0, 0]])
+
+        assert matrix1.add(matrix2, out=out) is out
+        assert out.to_list() == [[3, 2], [4, 6]]
+
+        assert matrix1.subtract(matrix2, out=out) is out
+        assert out.to_list() == [[-1, 2], [2, 2]]
+
+        assert matrix1.matmul(matrix2, out=out) is out
+        assert out.to_list() == [[4, 4], [10, 8]]
+
+        # The result may overwrite one of the operands
+        matrix1.matmul(matrix2, out=matrix1)
+        assert matrix1.to_list() == [[4, 4], [10, 8]]
+
+        with pytest.raises(ValueError):
+            matrix1.add(matrix2, out=Matrix([[0, 0]]))
+
+    @pytest.mark.parametrize("tile_size", [None, 2])
+    def test_matrix_parallel_multiplication(
+        self, tile_size: int | None
+    ) -> None:
+        matrix1 = Matrix([[i * 4 + j for j in range(4)] for i in range(5)])
+        matrix2 = Matrix([[i - j for j in range(3)] for i in range(4)])
+        expected = (matrix1 * matrix2).to_list()
+
+        result = matrix1.matmul(
+            matrix2, tile_size=tile_size, workers=2, backend="python"
+        )
+        assert result.to_list() == expected
+
+        # More workers than rows
+        out = Matrix([[0, 0, 0]])
+        Matrix([[1, 2, 3, 4]]).matmul(
+            matrix2, out=out, workers=4, backend="python"
+        )
+        assert out.to_list() == [[20, 10, 0]]
+
+        with pytest.raises(ValueError):
+            matrix1.matmul(matrix2, workers=0)
+
+    def test_matrix_parallel_multiplication_default_backend(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: List[int] = []
+
+        def spy(*args: Any) -> MatrixStorage:
+            calls.append(args[2])
+            return parallel_matmul(*args)
+
+        monkeypatch.setattr(backends, "parallel_matmul", spy)
+
+        matrix1 = Matrix([[i * 4 + j for j in range(4)] for i in range(5)])
+        matrix2 = Matrix([[i - j for j in range(3)] for i in range(4)])
+        expected = (matrix1 * matrix2).to_list()
+
+        # Whatever the default backend, the process pool does the work
+        assert matrix1.matmul(matrix2, workers=2).to_list() == expected
+        assert calls == [2]
+
+    @pytest.mark.parametrize("exponent", [0, 1, 2, 5, 8, 13])
+    def test_matrix_power(self, exponent: int) -> None:
+        matrix = Matrix([[1, 1, 0], [1, 0, 1], [0, 2, 1]])
+
+        expected = Matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        for _ in range(exponent):
+            expected = expected * matrix
+
+        assert (matrix**exponent).to_list() == expected.to_list()
+        # The matrix itself is left untouched
+        assert matrix.to_list() == [[1, 1, 0], [1, 0, 1], [0, 2, 1]]
+
+    def test_matrix_power_errors(self) -> None:
+        # Fibonacci numbers, then a negative power of an invertible matrix
+        fibonacci = Matrix([[1, 1], [1, 0]])
+        assert fibonacci.matrix_power(30)[0, 1] == 832040
+        assert (fibonacci**-3).to_list() == [[-1, 2], [2, -3]]
+
+        with pytest.raises(ValueError):
+            Matrix([[1, 2, 3]]) ** 2
+        with pytest.raises(ValueError):
+            Matrix([[1, 2], [2, 4]]) ** -1
+        with pytest.raises(TypeError):
+            fibonacci**0.5  # type: ignore[operator]
+
+    @pytest.mark.parametrize("exponent", [-2, 0, 1, 3, 40])
+    def test_matrix_apply_power(self, exponent: int) -> None:
+        matrix = Matrix([[0.5, 0.5], [0.25, 0.75]])
+        vector = Vector([[1], [2]])
+
+        result = matrix.apply_power(vector, exponent)
+        expected = (matrix**exponent) * vector
+        assert isinstance(result, Vector)
+        assert list(result._storage.values()) == pytest.approx(
+            list(expected._storage.values())
+        )
+
+        # Several columns at once
+        columns = Matrix([[1, 0], [2, 1]])
+        result = matrix.apply_power(columns, exponent)
+        expected = (matrix**exponent) * columns
+        assert list(result._storage.values()) == pytest.approx(
+            list(expected._storage.values())
+        )
+
+        with pytest.raises(ValueError):
+            matrix.apply_power(Vector([[1, 2]]), exponent)
@@ -0,0 +1,84 @@
+import pytest
+from array import array
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+
+
+class TestMatrixStorage:
+    def test_from_iterable(self) -> None:
+        storage = MatrixStorage.from_iterable(range(6), 2, 3)
+        assert storage.tolist() == [[0, 1, 2], [3, 4, 5]]
+        assert storage.is_contiguous
+
+        # Wrong number of values
+        with pytest.raises(ValueError):
+            MatrixStorage.from_iterable(range(5), 2, 3)
+
+    def test_from_buffer(self) -> None:
+        # Raw bytes are reinterpreted as doubles without copying
+        buffer = bytearray(array("d", [1, 2, 3, 4]).tobytes())
+        storage = MatrixStorage.from_buffer(buffer, 2, 2)
+        assert storage.tolist() == [[1, 2], [3, 4]]
+        assert storage.data.obj is buffer
+
+        # Non-positive dimensions
+        with pytest.raises(ValueError):
+            MatrixStorage.from_buffer(buffer, 0, 2)
+
+    def test_rows_and_columns(self) -> None:
+        storage = MatrixStorage.from_iterable(range(6), 2, 3)
+        assert [list(row) for row in storage.rows()] == [[0, 1, 2], [3, 4, 5]]
+        assert [list(column) for column in storage.columns()] == [
+            [0, 3],
+            [1, 4],
+            [2, 5],
+        ]
+
+    def test_strided_storage(self) -> None:
+        # A transposed layout of the 2x3 matrix above
+        base = MatrixStorage.from_iterable(range(6), 2, 3)
+        storage = MatrixStorage(base.data, 3, 2, row_stride=1, col_stride=3)
+        assert not storage.is_contiguous
+        assert storage.tolist() == [[0, 3], [1, 4], [2, 5]]
+        assert list(storage.values()) == [0, 3, 1, 4, 2, 5]
+        assert storage.index(2, 1) == 5
+
+        copy = storage.copy()
+        assert copy.is_contiguous
+        assert copy.tolist() == storage.tolist()
+
+    def test_zeros(self) -> None:
+        storage = MatrixStorage.zeros(2, 2)
+        assert storage.tolist() == [[0, 0], [0, 0]]
+
+    def test_transposed_view(self) -> None:
+        storage = MatrixStorage.from_iterable(range(6), 2, 3)
+        assert not storage.is_shared
+
+        view = storage.transposed()
+        assert view.data is storage.data
+        assert view.tolist() == [[0, 3], [1, 4], [2, 5]]
+        assert storage.is_shared and view.is_shared
+
+        # Dropping the view releases the alias
+        del view
+        assert not storage.is_shared
+
+    def test_block_view(self) -> None:
+        storage = MatrixStorage.from_iterable(range(12), 3, 4)
+
+        block = storage.block(1, 2, 2, 2)
+        assert block.tolist() == [[6, 7], [10, 11]]
+        assert not block.is_contiguous
+
+        # Blocks of transposed views follow the strides
+        assert storage.transposed().block(1, 0, 2, 2).tolist() == [
+            [1, 5],
+            [2, 6],
+        ]
+
+        block.assign([0, 0, 0, 0])
+        assert storage.tolist()[2] == [8, 9, 0, 0]
+
+        with pytest.raises(IndexError):
+            storage.block(2, 0, 2, 1)
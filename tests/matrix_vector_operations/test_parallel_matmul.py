@@ -0,0 +1,29 @@
+import pytest
+
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.matmul_kernels import naive_matmul
+from project.matrix_vector_operations.parallel_matmul import parallel_matmul
+
+
+class TestParallelMatmul:
+    @pytest.mark.parametrize("workers", [1, 2, 3])
+    def test_matches_serial(self, workers: int) -> None:
+        a = MatrixStorage.from_iterable(range(35), 7, 5)
+        b = MatrixStorage.from_iterable(range(10), 5, 2)
+
+        result = parallel_matmul(a, b, workers)
+        assert result.tolist() == naive_matmul(a, b).tolist()
+
+    def test_strided_operands(self) -> None:
+        # Transposed views are copied row-major into shared memory
+        a = MatrixStorage.from_iterable(range(6), 3, 2).transposed()
+        b = MatrixStorage.from_iterable(range(6), 3, 2)
+
+        result = parallel_matmul(a, b, 2, tile_size=1)
+        assert result.tolist() == naive_matmul(a, b).tolist()
+
+    def test_invalid_workers(self) -> None:
+        a = MatrixStorage.from_iterable(range(4), 2, 2)
+
+        with pytest.raises(ValueError):
+            parallel_matmul(a, a, 0)
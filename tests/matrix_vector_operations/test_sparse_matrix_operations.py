@@ -0,0 +1,112 @@
+import pytest
+from math import isclose
+
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.vector_operations import Vector
+from project.matrix_vector_operations.sparse_matrix_operations import (
+    COOMatrix,
+    CSRMatrix,
+)
+
+
+@pytest.fixture
+def dense() -> Matrix:
+    return Matrix([[1, 0, 0], [0, 0, 2], [0, 3, 0], [0, 0, 0]])
+
+
+class TestSparseMatrixOperations:
+    def test_conversion(self, dense: Matrix) -> None:
+        csr = CSRMatrix.from_dense(dense)
+        assert csr.nnz == 3
+        assert list(csr.indptr) == [0, 1, 2, 3, 3]
+        assert list(csr.indices) == [0, 2, 1]
+        assert csr.to_list() == dense.to_list()
+
+        coo = COOMatrix.from_dense(dense)
+        assert coo.to_csr().to_list() == dense.to_list()
+        assert coo.to_dense().to_list() == dense.to_list()
+
+    def test_coo_building(self) -> None:
+        coo = COOMatrix(2, 2)
+        coo.append(1, 0, 2)
+        coo.append(0, 1, 1)
+        coo.append(1, 0, 3)  # Duplicates are summed
+        assert coo.to_csr().to_list() == [[0, 1], [5, 0]]
+        assert coo.transpose().to_list() == [[0, 5], [1, 0]]
+
+        with pytest.raises(IndexError):
+            coo.append(2, 0, 1)
+
+        with pytest.raises(ValueError):
+            COOMatrix(0, 2)
+
+    def test_item_access(self, dense: Matrix) -> None:
+        csr = CSRMatrix.from_dense(dense)
+        assert csr[1, 2] == 2
+        assert csr[1, 1] == 0
+
+        with pytest.raises(IndexError):
+            csr[4, 0]
+
+    def test_addition(self, dense: Matrix) -> None:
+        csr = CSRMatrix.from_dense(dense)
+        other = CSRMatrix.from_dense(
+            Matrix([[-1, 1, 0], [0, 0, 0], [0, 1, 0], [4, 0, 0]])
+        )
+
+        # Sparse + sparse stays sparse
+        result = csr + other
+        assert isinstance(result, CSRMatrix)
+        assert result.to_list() == [[0, 1, 0], [0, 0, 2], [0, 4, 0], [4, 0, 0]]
+
+        # Mixed operands give a dense matrix, in both orders
+        ones = Matrix([[1] * 3] * 4)
+        assert (csr + ones).to_list() == [
+            [2, 1, 1],
+            [1, 1, 3],
+            [1, 4, 1],
+            [1] * 3,
+        ]
+        assert (ones + csr).to_list() == (csr + ones).to_list()
+
+        csr += other
+        assert csr.to_list() == result.to_list()
+
+        with pytest.raises(ValueError):
+            csr + CSRMatrix.from_dense(Matrix([[1]]))
+
+    def test_multiplication(self, dense: Matrix) -> None:
+        csr = CSRMatrix.from_dense(dense)
+        right = Matrix([[1, 2], [3, 4], [5, 6]])
+        expected = (dense * right).to_list()
+
+        # Sparse * sparse, sparse * dense and dense * sparse
+        product = csr * CSRMatrix.from_dense(right)
+        assert isinstance(product, CSRMatrix)
+        assert product.to_list() == expected
+        assert (csr * right).to_list() == expected
+
+        left = Matrix([[1, 2, 3, 4], [0, 1, 0, 1]])
+        assert (left * csr).to_list() == (left * dense).to_list()
+
+        with pytest.raises(ValueError):
+            csr * csr
+
+    def test_transpose(self, dense: Matrix) -> None:
+        csr = CSRMatrix.from_dense(dense)
+        assert csr.transpose().to_list() == dense.transpose().to_list()
+        assert csr.transpose().transpose().to_list() == dense.to_list()
+
+    def test_vector_operations(self) -> None:
+        sparse = CSRMatrix.from_dense(Matrix([[3, 0, 0, 4]]))
+        assert isclose(sparse.length(), 5)
+
+        other = Vector([[1, 2, 3, 2]])
+        assert CSRMatrix.dot_product(sparse, other) == 11
+        assert CSRMatrix.dot_product(sparse, CSRMatrix.from_dense(other)) == 11
+
+        with pytest.raises(ValueError):
+            CSRMatrix.dot_product(sparse, Vector([[1, 2]]))
+
+        with pytest.raises(TypeError):
+            CSRMatrix.from_dense(Matrix([[1, 2], [3, 4]])).length()
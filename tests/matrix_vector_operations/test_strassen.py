@@ -0,0 +1,57 @@
+import pytest
+from typing import Callable
+from math import isclose
+
+from project.matrix_vector_operations.backends import get_backend
+from project.matrix_vector_operations.matmul_kernels import naive_matmul
+from project.matrix_vector_operations.matrix_storage import MatrixStorage
+from project.matrix_vector_operations.strassen import strassen_matmul
+
+
+class TestStrassen:
+    @pytest.mark.parametrize(
+        "height, shared, width, cutoff",
+        [
+            (8, 8, 8, 2),  # Power of two, three levels deep
+            (13, 13, 13, 2),  # Odd sizes padded at every level
+            (17, 10, 23, 3),  # Rectangular operands
+            (5, 5, 5, 8),  # Below the cutoff
+        ],
+    )
+    def test_strassen_matches_naive(
+        self,
+        backend: str,
+        height: int,
+        shared: int,
+        width: int,
+        cutoff: int,
+        random_storage: Callable[[int, int, int], MatrixStorage],
+    ) -> None:
+        a = random_storage(height, shared, 1)
+        b = random_storage(shared, width, 2)
+
+        expected = naive_matmul(a, b).values()
+        result = strassen_matmul(get_backend(backend), a, b, cutoff)
+        assert result.is_contiguous
+        assert all(map(isclose, result.values(), expected))
+
+    def test_strassen_views_and_out(
+        self,
+        backend: str,
+        random_storage: Callable[[int, int, int], MatrixStorage],
+    ) -> None:
+        a = random_storage(6, 6, 3)
+        b = a.transposed()
+        out = MatrixStorage.zeros(6, 6)
+
+        expected = naive_matmul(a, b).values()
+        result = strassen_matmul(get_backend(backend), a, b, 1, out=out)
+        assert result is out
+        assert all(map(isclose, out.values(), expected))
+
+    def test_invalid_cutoff(
+        self, random_storage: Callable[[int, int, int], MatrixStorage]
+    ) -> None:
+        a = random_storage(2, 2, 4)
+        with pytest.raises(ValueError):
+            strassen_matmul(get_backend(), a, a, 0)
@@ -0,0 +1,149 @@
+import csv
+import io
+import pytest
+from pathlib import Path
+from typing import Iterator, List
+
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.streaming import (
+    MatrixBuilder,
+    build_matrix,
+    chunks,
+    column_sums,
+    gram,
+    matvec,
+    row_sums,
+)
+from project.matrix_vector_operations.vector_operations import Vector
+
+ROWS: List[List[float]] = [[i * 3 + j for j in range(3)] for i in range(7)]
+
+
+def stream() -> Iterator[List[float]]:
+    """
+    Yields the rows one by one, as a reader of a large file would.
+    """
+
+    for row in ROWS:
+        yield list(row)
+
+
+class TestStreaming:
+    def test_builder(self) -> None:
+        builder = MatrixBuilder()
+        builder.append(iter([1, 2]))
+        builder.extend([[3, 4], (5, 6)])
+        assert len(builder) == 3 and builder.width == 2
+
+        with pytest.raises(ValueError):
+            builder.append([7, 8, 9])
+        with pytest.raises(ValueError):
+            builder.append([])
+
+        assert builder.build().to_list() == [[1, 2], [3, 4], [5, 6]]
+
+        # The builder starts over after building
+        assert len(builder) == 0
+        builder.append([7, 8])
+        assert builder.build().to_list() == [[7, 8]]
+
+        with pytest.raises(ValueError):
+            MatrixBuilder().build()
+
+    def test_build_into_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "matrix.bin"
+
+        matrix = build_matrix(stream(), path)
+        assert matrix.to_list() == ROWS
+        assert Matrix.load(path, mmap=False).to_list() == ROWS
+
+    def test_builder_from_csv(self, tmp_path: Path) -> None:
+        text = "1,2.5\n-3,4e1\n"
+        expected = [[1, 2.5], [-3, 40]]
+
+        assert (
+            build_matrix(csv.reader(io.StringIO(text))).to_list() == expected
+        )
+
+        path = tmp_path / "matrix.bin"
+        matrix = build_matrix(csv.reader(io.StringIO(text)), path)
+        assert matrix.to_list() == expected
+
+        with pytest.raises(ValueError):
+            build_matrix(csv.reader(io.StringIO("1,2\n3,x\n")))
+
+    def test_builder_context_manager(self, tmp_path: Path) -> None:
+        with MatrixBuilder(path=tmp_path / "matrix.bin") as builder:
+            builder.append([1, 2])
+            file = builder._file
+
+        # Leaving the block closes the file even without `build`
+        assert file is not None and file.closed
+        assert len(builder) == 0
+
+        with pytest.raises(ValueError):
+            builder.append([3, 4])
+        with pytest.raises(ValueError):
+            builder.build()
+
+        # The file is closed when a row fails too
+        opened: List[MatrixBuilder] = []
+        with pytest.raises(ValueError):
+            with MatrixBuilder(path=tmp_path / "other.bin") as builder:
+                opened.append(builder)
+                builder.extend([[1, 2], [3]])
+        assert opened[0]._file is None
+
+    def test_reuse_file_builder(self, tmp_path: Path) -> None:
+        builder = MatrixBuilder(path=tmp_path / "matrix.bin")
+        builder.extend([[1, 2], [3, 4]])
+
+        matrix = builder.build()
+        assert len(builder) == 0
+
+        # The file belongs to the matrix now
+        with pytest.raises(ValueError):
+            builder.append([5, 6])
+        with pytest.raises(ValueError):
+            builder.build()
+
+        assert matrix.to_list() == [[1, 2], [3, 4]]
+
+    @pytest.mark.parametrize("chunk_rows", [1, 3, 7, 100])
+    def test_chunks(self, chunk_rows: int) -> None:
+        from_stream = [
+            chunk.tolist() for chunk in chunks(stream(), chunk_rows)
+        ]
+        from_matrix = [
+            chunk.tolist() for chunk in chunks(Matrix(ROWS), chunk_rows)
+        ]
+
+        assert from_stream == from_matrix
+        assert sum(from_stream, []) == ROWS
+        assert all(len(chunk) <= chunk_rows for chunk in from_stream)
+
+        with pytest.raises(ValueError):
+            next(chunks(stream(), 0))
+
+    @pytest.mark.parametrize("chunk_rows", [2, 100])
+    def test_reductions(self, backend: str, chunk_rows: int) -> None:
+        matrix = Matrix(ROWS)
+
+        assert list(row_sums(stream(), chunk_rows, backend)) == [
+            sum(row) for row in ROWS
+        ]
+        assert column_sums(stream(), chunk_rows, backend).to_list() == [
+            [63, 70, 77]
+        ]
+        assert (
+            gram(stream(), chunk_rows, backend).to_list()
+            == (matrix.transpose() * matrix).to_list()
+        )
+
+        vector = Vector([[1], [0], [-1]])
+        assert list(matvec(matrix, vector, chunk_rows, backend)) == [-2] * 7
+
+        with pytest.raises(ValueError):
+            list(matvec(stream(), Vector([[1, 2]]), chunk_rows, backend))
+        with pytest.raises(ValueError):
+            gram(iter([]), chunk_rows, backend)
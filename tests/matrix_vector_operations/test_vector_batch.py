@@ -0,0 +1,111 @@
+import pytest
+from math import isclose, isnan, pi
+
+from project.matrix_vector_operations.matrix_operations import Matrix
+from project.matrix_vector_operations.vector_batch import (
+    VectorBatch,
+    matvec_many,
+)
+from project.matrix_vector_operations.vector_operations import Vector
+
+
+@pytest.fixture
+def batch() -> VectorBatch:
+    return VectorBatch.from_vectors(
+        [
+            Vector([[3, 4]]),
+            Vector([[-4, 3]]),
+            Vector([[0, 0]]),
+            Vector([[1, 0]]),
+        ]
+    )
+
+
+class TestVectorBatch:
+    def test_construction(self) -> None:
+        batch = VectorBatch.from_matrix(Matrix([[1, 2], [3, 4]]))
+        assert len(batch) == 2
+        assert batch.dimension == 2
+
+        # Row and column vectors are stored alike
+        batch.append(Vector([[5], [6]]))
+        assert batch.to_list() == [[1, 2], [3, 4], [5, 6]]
+        assert batch[-1].to_list() == [[5, 6]]
+
+        with pytest.raises(ValueError):
+            batch.extend([Vector([[7, 8]]), Vector([[1, 2, 3]])])
+        assert len(batch) == 3
+
+        with pytest.raises(IndexError):
+            batch[3]
+        with pytest.raises(ValueError):
+            VectorBatch.from_vectors([])
+        with pytest.raises(ValueError):
+            VectorBatch(0)
+
+    def test_dot_and_norms(self, batch: VectorBatch, backend: str) -> None:
+        query = Vector([[1], [2]])
+
+        assert batch.dot(query, backend).tolist() == [11, 2, 0, 1]
+        assert batch.norms(backend).tolist() == [5, 5, 0, 1]
+
+        with pytest.raises(ValueError):
+            batch.dot(Vector([[1, 2, 3]]), backend)
+
+    def test_norms_cache(self, batch: VectorBatch, backend: str) -> None:
+        norms = batch.norms(backend)
+        assert batch.norms(backend) is norms
+
+        # The cached norms follow insertions and deletions
+        batch.append(Vector([[6, 8]]))
+        del batch[1]
+        assert batch.norms(backend) is norms
+        assert norms.tolist() == [5, 0, 1, 10]
+        assert batch.to_list() == [[3, 4], [0, 0], [1, 0], [6, 8]]
+
+        with pytest.raises(IndexError):
+            del batch[4]
+
+    def test_similarities(self, batch: VectorBatch, backend: str) -> None:
+        query = Vector([[3, 4]])
+
+        cosines = batch.cosine_similarity(query, backend)
+        assert isclose(cosines[0], 1)
+        assert isclose(cosines[1], 0, abs_tol=1e-12)
+        assert isnan(cosines[2])
+        assert isclose(cosines[3], 0.6)
+
+        # Rounding past 1 is clipped instead of failing
+        angles = batch.angles(query, backend)
+        assert angles[0] == 0
+        assert isclose(angles[1], pi / 2)
+        assert isnan(angles[2])
+        assert isclose(angles[3], Vector.angle(batch[3], query))
+
+    def test_empty_batch(self, backend: str) -> None:
+        batch = VectorBatch(3)
+        query = Vector([[1, 2, 3]])
+
+        assert len(batch) == 0
+        assert batch.dot(query, backend).tolist() == []
+        assert batch.norms(backend).tolist() == []
+        assert batch.angles(query, backend).tolist() == []
+
+    def test_matvec_many(self, batch: VectorBatch, backend: str) -> None:
+        matrix = Matrix([[1, 0], [0, 2], [1, 1]])
+
+        result = matvec_many(matrix, batch, backend)
+        assert result.dimension == 3
+        assert result.to_list() == [
+            (matrix * vector.transpose()).transpose().to_list()[0]
+            for vector in (batch[i] for i in range(len(batch)))
+        ]
+
+        # Plain iterables of vectors are accepted too
+        assert matvec_many(
+            matrix, [Vector([[1], [1]])], backend
+        ).to_list() == [[1, 2, 2]]
+        assert len(matvec_many(matrix, VectorBatch(2), backend)) == 0
+
+        with pytest.raises(ValueError):
+            matvec_many(matrix, VectorBatch(3), backend)
@@ -0,0 +1,109 @@
+import pytest
+from math import cos, isclose, pi, sin
+from typing import Hashable, List, Tuple
+
+from project.matrix_vector_operations.vector_index import VectorIndex
+from project.matrix_vector_operations.vector_operations import Vector
+
+
+def circle_index(metric: str = "angle") -> VectorIndex:
+    """
+    Builds an index of 24 unit vectors spread around the circle, keyed by
+    their angle in degrees.
+    """
+
+    index = VectorIndex(2, metric)
+    for degrees in range(0, 360, 15):
+        radians = degrees * pi / 180
+        index.add(degrees, Vector([[cos(radians), sin(radians)]]))
+
+    return index
+
+
+def keys(matches: List[Tuple[Hashable, float]]) -> List[Hashable]:
+    return [key for key, _ in matches]
+
+
+class TestVectorIndex:
+    def test_search_by_angle(self, backend: str) -> None:
+        index = circle_index()
+
+        matches = index.search(Vector([[1, 0.1]]), 3, backend=backend)
+        assert keys(matches) == [0, 15, 345]
+        assert isclose(
+            matches[0][1], Vector.angle(Vector([[1, 0.1]]), Vector([[1, 0]]))
+        )
+
+        # Asking for more than there is returns everything, best first
+        matches = index.search(Vector([[0], [-2]]), 100, backend=backend)
+        assert len(matches) == 24
+        assert matches[0][0] == 270
+        assert isclose(matches[0][1], 0, abs_tol=1e-7)
+        assert matches[-1][0] == 90
+
+    def test_search_by_dot(self, backend: str) -> None:
+        index = VectorIndex(2, "dot")
+        index.add("short", Vector([[1, 0]]))
+        index.add("long", Vector([[10, 10]]))
+        index.add("opposite", Vector([[-5, 0]]))
+
+        assert index.search(Vector([[1, 0]]), 2, backend=backend) == [
+            ("long", 10),
+            ("short", 1),
+        ]
+
+    def test_insert_and_delete(self) -> None:
+        index = circle_index()
+        assert len(index) == 24 and 90 in index
+
+        index.remove(0)
+        index.remove(15)
+        assert 0 not in index
+        assert keys(index.search(Vector([[1, 0]]), 2)) == [345, 30]
+
+        # Zero vectors never match by angle
+        index.add("zero", Vector([[0, 0]]))
+        assert "zero" not in keys(index.search(Vector([[1, 0]]), 100))
+
+        with pytest.raises(KeyError):
+            index.remove(0)
+        with pytest.raises(KeyError):
+            index.add(90, Vector([[0, 1]]))
+        with pytest.raises(ValueError):
+            index.add("wide", Vector([[1, 2, 3]]))
+
+    def test_partitioned_search(self, backend: str) -> None:
+        index = circle_index()
+        query = Vector([[1, 1.2]])
+        exact = index.search(query, 3, backend=backend)
+        assert keys(exact) == [45, 60, 30]
+
+        index.partition(4, backend=backend)
+        assert len(index) == 24
+
+        # A single probe scans the quarter of the circle around the query,
+        # and misses neighbours across its border
+        assert len(index.search(query, 24, backend=backend)) == 6
+        assert keys(index.search(query, 3, backend=backend)) == [45, 30, 15]
+
+        # Probing more partitions restores the exact answer
+        assert index.search(query, 3, probes=2, backend=backend) == exact
+
+        # New vectors join their closest partition and can be deleted
+        index.add("new", Vector([[1, 1.19]]))
+        assert keys(index.search(query, 1)) == ["new"]
+        index.remove("new")
+        index.remove(45)
+        assert keys(index.search(query, 2, probes=4)) == [60, 30]
+
+    def test_invalid_arguments(self) -> None:
+        index = circle_index()
+
+        with pytest.raises(ValueError):
+            VectorIndex(2, "euclidean")
+        with pytest.raises(ValueError):
+            index.search(Vector([[1, 0]]), 0)
+        with pytest.raises(ValueError):
+            index.search(Vector([[0, 0]]), 1)
+        with pytest.raises(ValueError):
+            index.partition(25)
@@ -8,11 +8,11 @@ class TestVectorOperations:
     def test_vector_init(self) -> None:
         # Valid vector (1xN)
         vector = Vector([[1, 2, 3]])
-        assert vector._matrix == [[1, 2, 3]]
+        assert vector.to_list() == [[1, 2, 3]]
 
         # Valid vector (Nx1)
         vector = Vector([[1], [2], [3]])
-        assert vector._matrix == [[1], [2], [3]]
+        assert vector.to_list() == [[1], [2], [3]]
 
         # Invalid vector
         with pytest.raises(TypeError):